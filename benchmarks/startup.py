@@ -0,0 +1,78 @@
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+CLI_FIRST_MOVE = """
+import time
+started = time.perf_counter()
+from src.domain.board import Board
+from src.domain.entities import Position
+from src.domain.game_state import GameState
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+board = Board()
+game_state = GameState()
+InitializeGameUseCase(board, game_state).execute()
+ExecuteMoveUseCase(board, game_state).execute(board.get_piece(Position(6, 4)), Position(4, 4))
+import sys
+assert not any(name.startswith("PyQt6") for name in sys.modules)
+print(time.perf_counter() - started)
+"""
+
+GUI_FIRST_MOVE = """
+import time
+started = time.perf_counter()
+import sys
+from PyQt6.QtWidgets import QApplication
+from src.domain.entities import Position
+from src.presentation.ui import ChessApplication
+app = QApplication(sys.argv)
+window = ChessApplication()
+controller = window._controller
+controller.move_piece(controller.get_piece_at(Position(6, 4)), Position(4, 4))
+window._chess_widget.grab()
+print(time.perf_counter() - started)
+"""
+
+
+def measure(script: str, runs: int) -> list[float]:
+    environment = dict(os.environ, QT_QPA_PLATFORM=os.environ.get("QT_QPA_PLATFORM", "offscreen"))
+    samples = []
+    for _ in range(runs):
+        output = subprocess.run(
+            [sys.executable, "-c", script],
+            cwd=PROJECT_ROOT,
+            env=environment,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout
+        samples.append(float(output.strip().splitlines()[-1]))
+    return samples
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Import-to-first-move latency")
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--skip-gui", action="store_true")
+    args = parser.parse_args()
+
+    paths = [("cli", CLI_FIRST_MOVE)]
+    if not args.skip_gui:
+        paths.append(("gui", GUI_FIRST_MOVE))
+
+    for name, script in paths:
+        samples = measure(script, args.runs)
+        print(
+            f"{name}: median {statistics.median(samples) * 1000:.1f}ms  "
+            f"min {min(samples) * 1000:.1f}ms  max {max(samples) * 1000:.1f}ms"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,18 +1,304 @@
+import argparse
 import sys
-from PyQt6.QtWidgets import QApplication
 
-from src.domain.board import Board
-from src.domain.game_state import GameState
-from src.presentation.controller import ChessController
-from src.presentation.ui import ChessApplication
 
+def run_gui(args: argparse.Namespace) -> None:
+    from PyQt6.QtWidgets import QApplication
+
+    from src.domain.entities import Team
+    from src.presentation.ui import ChessApplication
 
-def main():
     app = QApplication(sys.argv)
-    window = ChessApplication()
+    computer_team = Team(args.computer) if args.computer else None
+    window = ChessApplication(computer_team, args.think_time, args.analysis, args.heatmap, args.clock)
     window.show()
     sys.exit(app.exec())
 
 
+def run_selfplay(args: argparse.Namespace) -> None:
+    from src.application.simulation import SelfPlayConfig, run_self_play
+
+    config = SelfPlayConfig(
+        games=args.games,
+        white_policy=args.white,
+        black_policy=args.black,
+        max_plies=args.max_plies,
+        seed=args.seed,
+        workers=args.workers,
+        search_depth=args.depth,
+        search_nodes=args.nodes,
+    )
+    report = run_self_play(config, args.output)
+    print(report.format())
+
+
+def run_match(args: argparse.Namespace) -> None:
+    from src.application.tournament import EngineConfig, MatchConfig, TournamentRunner
+
+    config = MatchConfig(
+        engine_a=EngineConfig.parse("A", args.engine_a),
+        engine_b=EngineConfig.parse("B", args.engine_b),
+        max_games=args.games,
+        opening_plies=args.opening_plies,
+        max_plies=args.max_plies,
+        workers=args.workers,
+        seed=args.seed,
+        elo0=args.elo0,
+        elo1=args.elo1,
+        alpha=args.alpha,
+        beta=args.beta,
+    )
+    report = TournamentRunner(config).run(
+        lambda progress: print(
+            f"\r{progress.statistics.games} games  llr {progress.llr:.2f}", end="", flush=True
+        )
+    )
+    print()
+    print(report.format(config))
+
+
+def run_server(args: argparse.Namespace) -> None:
+    import asyncio
+
+    from src.infrastructure.move_journal import MoveJournal, recover_games
+    from src.presentation.server import GameServer
+
+    journal = None
+    if args.journal:
+        recovered = recover_games(args.journal)
+        journal = MoveJournal(args.journal, sync_interval=args.sync_interval)
+    server = GameServer(max_games=args.max_games, journal=journal, time_control=args.clock)
+    if journal is not None:
+        server.restore_games(recovered)
+        print(f"Recovered {len(recovered)} games from {args.journal}", flush=True)
+    print(f"Serving games on {args.host}:{args.port}", flush=True)
+    try:
+        asyncio.run(server.serve_forever(args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+def run_load_test(args: argparse.Namespace) -> None:
+    import asyncio
+    import subprocess
+    import time
+
+    from src.presentation.loadtest import run_load_test as load_test
+
+    server_process = None
+    if args.spawn:
+        server_process = subprocess.Popen(
+            [sys.executable, __file__, "serve", "--host", args.host, "--port", str(args.port),
+             "--max-games", str(args.games + 1)] + (["--journal", args.journal] if args.journal else []),
+            stdout=subprocess.PIPE,
+        )
+        while not server_process.stdout.readline().startswith(b"Serving"):
+            pass
+        time.sleep(0.1)
+    try:
+        report = asyncio.run(load_test(
+            args.host,
+            args.port,
+            games=args.games,
+            connection_pairs=args.connections,
+            active_games=args.active,
+            plies=args.plies,
+            seed=args.seed,
+        ))
+        print(report.format())
+    finally:
+        if server_process is not None:
+            server_process.terminate()
+            server_process.wait()
+
+
+def run_render(args: argparse.Namespace) -> None:
+    import os
+
+    os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+    from src.application.diagrams import read_positions, render_diagrams
+
+    positions = list(read_positions(args.positions))
+    report = render_diagrams(positions, args.output, square_size=args.size, workers=args.workers)
+    print(report.format())
+
+
+def run_export(args: argparse.Namespace) -> None:
+    from src.application.datasets import export_dataset, GameFileSource, SelfPlaySource
+    from src.application.simulation import SelfPlayConfig
+
+    if args.games_file:
+        source = GameFileSource(args.games_file)
+    else:
+        source = SelfPlaySource(SelfPlayConfig(
+            games=args.games,
+            white_policy=args.white,
+            black_policy=args.black,
+            max_plies=args.max_plies,
+            seed=args.seed,
+            search_depth=args.depth,
+        ))
+    report = export_dataset(source, args.output, games_per_shard=args.games_per_shard, workers=args.workers)
+    print(report.format())
+
+
+def run_tune(args: argparse.Namespace) -> None:
+    from src.application.evaluation import load_weights, save_weights
+    from src.application.tuning import TexelTuner, TuningConfig
+
+    config = TuningConfig(
+        epochs=args.epochs,
+        learning_rate=args.learning_rate,
+        scaling=args.scaling,
+        workers=args.workers,
+        checkpoint_every=args.checkpoint_every,
+    )
+    weights = load_weights(args.weights) if args.weights else None
+    tuner = TexelTuner(args.dataset, config, weights)
+    report = tuner.tune(args.checkpoint, on_epoch=lambda epoch, loss: print(f"epoch {epoch}: loss {loss:.6f}"))
+    save_weights(tuner.weights, args.output)
+    print(report.format())
+
+
+def run_index(args: argparse.Namespace) -> None:
+    import time
+    from src.infrastructure.position_index_repository import PositionIndexRepository
+
+    started = time.perf_counter()
+    repository = PositionIndexRepository.build(args.games, args.output)
+    print(f"indexed {repository.game_count} games in {time.perf_counter() - started:.2f}s")
+
+
+def run_find(args: argparse.Namespace) -> None:
+    from src.domain.board import Board
+    from src.infrastructure.fen import load_fen
+    from src.infrastructure.position_index_repository import PositionIndexRepository
+
+    board = None
+    if args.pawns:
+        board = Board()
+        load_fen(board, args.pawns)
+    repository = PositionIndexRepository(args.index)
+    games = repository.find_games(args.material, board)
+    print(f"{len(games)} of {repository.game_count} games")
+    for game in games[:args.limit]:
+        print(game)
+
+
+def build_parser() -> argparse.ArgumentParser:
+    from src.application.policies import POLICY_NAMES
+    from src.application.simulation import default_worker_count
+    from src.application.timers import TimeControl
+
+    parser = argparse.ArgumentParser(description="Chess PyQt6")
+    parser.add_argument("--computer", choices=["white", "black"], help="Let the engine play this side in the GUI")
+    parser.add_argument("--think-time", type=float, default=1.0, help="Engine seconds per move")
+    parser.add_argument("--analysis", type=int, default=0, metavar="LINES", help="Show the top LINES candidate moves")
+    parser.add_argument("--heatmap", action="store_true", help="Overlay attack counts and hanging pieces (toggle with H)")
+    parser.add_argument("--clock", type=TimeControl.parse, help="Chess clock as MINUTES+INCREMENT or MINUTESdDELAY, e.g. 5+3 or 5d2")
+    commands = parser.add_subparsers(dest="command")
+
+    selfplay = commands.add_parser("selfplay", help="Run headless self-play games")
+    selfplay.add_argument("--games", type=int, default=1000)
+    selfplay.add_argument("--white", choices=POLICY_NAMES, default="random")
+    selfplay.add_argument("--black", choices=POLICY_NAMES, default="random")
+    selfplay.add_argument("--max-plies", type=int, default=300)
+    selfplay.add_argument("--seed", type=int, default=0)
+    selfplay.add_argument("--workers", type=int, default=default_worker_count())
+    selfplay.add_argument("--depth", type=int, default=2)
+    selfplay.add_argument("--nodes", type=int, default=None)
+    selfplay.add_argument("--output", default=None)
+    selfplay.set_defaults(handler=run_selfplay)
+
+    match = commands.add_parser("match", help="Play two engine configurations with SPRT")
+    match.add_argument("--engine-a", default="depth=3", help="e.g. depth=3,weights=tuned.json")
+    match.add_argument("--engine-b", default="depth=2", help="e.g. nodes=20000 or movetime=0.1")
+    match.add_argument("--games", type=int, default=2000)
+    match.add_argument("--opening-plies", type=int, default=6)
+    match.add_argument("--max-plies", type=int, default=300)
+    match.add_argument("--workers", type=int, default=default_worker_count())
+    match.add_argument("--seed", type=int, default=0)
+    match.add_argument("--elo0", type=float, default=0.0)
+    match.add_argument("--elo1", type=float, default=10.0)
+    match.add_argument("--alpha", type=float, default=0.05)
+    match.add_argument("--beta", type=float, default=0.05)
+    match.set_defaults(handler=run_match)
+
+    serve = commands.add_parser("serve", help="Host concurrent network games over TCP")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8765)
+    serve.add_argument("--max-games", type=int, default=20_000)
+    serve.add_argument("--journal", help="Write-ahead move journal for crash recovery")
+    serve.add_argument("--sync-interval", type=float, default=0.05, help="Seconds between journal fsyncs")
+    serve.add_argument("--clock", type=TimeControl.parse, help="Server-side clock for every game, e.g. 3+2")
+    serve.set_defaults(handler=run_server)
+
+    export = commands.add_parser("export", help="Export sharded training arrays from games")
+    export.add_argument("--output", default="dataset")
+    export.add_argument("--games-file", help="Binary game records from 'selfplay --output'")
+    export.add_argument("--games", type=int, default=1000)
+    export.add_argument("--white", choices=POLICY_NAMES, default="random")
+    export.add_argument("--black", choices=POLICY_NAMES, default="random")
+    export.add_argument("--max-plies", type=int, default=300)
+    export.add_argument("--seed", type=int, default=0)
+    export.add_argument("--depth", type=int, default=2)
+    export.add_argument("--games-per-shard", type=int, default=256)
+    export.add_argument("--workers", type=int, default=default_worker_count())
+    export.set_defaults(handler=run_export)
+
+    tune = commands.add_parser("tune", help="Tune evaluation weights on an exported dataset")
+    tune.add_argument("dataset")
+    tune.add_argument("--output", default="tuned.json")
+    tune.add_argument("--weights", help="Starting weights JSON")
+    tune.add_argument("--checkpoint", default=None)
+    tune.add_argument("--checkpoint-every", type=int, default=10)
+    tune.add_argument("--epochs", type=int, default=200)
+    tune.add_argument("--learning-rate", type=float, default=1.0)
+    tune.add_argument("--scaling", type=float, default=400.0)
+    tune.add_argument("--workers", type=int, default=default_worker_count())
+    tune.set_defaults(handler=run_tune)
+
+    index = commands.add_parser("index", help="Index game records by material and pawn structure")
+    index.add_argument("games")
+    index.add_argument("--output", default="games.idx")
+    index.set_defaults(handler=run_index)
+
+    find = commands.add_parser("find", help="Find indexed games by material signature or pawn structure")
+    find.add_argument("index")
+    find.add_argument("--material", help="Signature such as KRPvKR")
+    find.add_argument("--pawns", help="FEN whose pawn skeleton must be reached")
+    find.add_argument("--limit", type=int, default=20)
+    find.set_defaults(handler=run_find)
+
+    render = commands.add_parser("render", help="Render FEN or snapshot positions to PNG diagrams")
+    render.add_argument("positions", help="FEN file (one per line) or binary snapshot file")
+    render.add_argument("--output", default="diagrams")
+    render.add_argument("--size", type=int, default=45, help="Square size in pixels")
+    render.add_argument("--workers", type=int, default=default_worker_count())
+    render.set_defaults(handler=run_render)
+
+    loadtest = commands.add_parser("loadtest", help="Load-test a game server")
+    loadtest.add_argument("--host", default="127.0.0.1")
+    loadtest.add_argument("--port", type=int, default=8765)
+    loadtest.add_argument("--games", type=int, default=10_000)
+    loadtest.add_argument("--connections", type=int, default=10)
+    loadtest.add_argument("--active", type=int, default=100)
+    loadtest.add_argument("--plies", type=int, default=40)
+    loadtest.add_argument("--seed", type=int, default=0)
+    loadtest.add_argument("--spawn", action="store_true", help="Start a local server first")
+    loadtest.add_argument("--journal", help="Move journal for the spawned server")
+    loadtest.set_defaults(handler=run_load_test)
+
+    return parser
+
+
+def main():
+    args, _ = build_parser().parse_known_args()
+    if args.command is None:
+        run_gui(args)
+    else:
+        args.handler(args)
+
+
 if __name__ == "__main__":
     main()
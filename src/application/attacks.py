@@ -0,0 +1,145 @@
+from src.domain.board import ReadableBoard
+from src.domain.entities import PieceType, Position, Team
+from src.domain.encoding import EMPTY_CODE, encode_piece, PIECE_TYPES, SQUARES, TEAMS
+
+
+ORTHOGONAL_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+DIAGONAL_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+KING_OFFSETS = ORTHOGONAL_DIRECTIONS + DIAGONAL_DIRECTIONS
+KNIGHT_OFFSETS = ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2))
+PAWN_DIRECTIONS = {Team.WHITE: -1, Team.BLACK: 1}
+
+
+def _targets(square: int, offsets: tuple[tuple[int, int], ...]) -> tuple[int, ...]:
+    row, col = divmod(square, 8)
+    return tuple(
+        (row + row_step) * 8 + col + col_step
+        for row_step, col_step in offsets
+        if 0 <= row + row_step < 8 and 0 <= col + col_step < 8
+    )
+
+
+def _rays(square: int, directions: tuple[tuple[int, int], ...]) -> tuple[tuple[int, ...], ...]:
+    row, col = divmod(square, 8)
+    rays = []
+    for row_step, col_step in directions:
+        ray = []
+        target_row, target_col = row + row_step, col + col_step
+        while 0 <= target_row < 8 and 0 <= target_col < 8:
+            ray.append(target_row * 8 + target_col)
+            target_row, target_col = target_row + row_step, target_col + col_step
+        rays.append(tuple(ray))
+    return tuple(rays)
+
+
+_SLIDER_DIRECTIONS = {
+    PieceType.ROOK: ORTHOGONAL_DIRECTIONS,
+    PieceType.BISHOP: DIAGONAL_DIRECTIONS,
+    PieceType.QUEEN: ORTHOGONAL_DIRECTIONS + DIAGONAL_DIRECTIONS,
+}
+_JUMP_TARGETS = {
+    PieceType.KNIGHT: tuple(_targets(square, KNIGHT_OFFSETS) for square in range(64)),
+    PieceType.KING: tuple(_targets(square, KING_OFFSETS) for square in range(64)),
+}
+_PAWN_TARGETS = {
+    team: tuple(_targets(square, ((direction, -1), (direction, 1))) for square in range(64))
+    for team, direction in PAWN_DIRECTIONS.items()
+}
+_SLIDER_RAYS = {
+    piece_type: tuple(_rays(square, directions) for square in range(64))
+    for piece_type, directions in _SLIDER_DIRECTIONS.items()
+}
+_CODE_PIECES = {encode_piece(piece_type, team): (piece_type, team) for piece_type in PIECE_TYPES for team in TEAMS}
+
+
+class AttackMapService:
+    def __init__(self, board: ReadableBoard):
+        self._board = board
+        self._codes = [EMPTY_CODE] * 64
+        self._attacks: list[tuple[int, ...]] = [()] * 64
+        self._attackers: list[set[int]] = [set() for _ in range(64)]
+        self._counts = {team: [0] * 64 for team in TEAMS}
+        self.refresh()
+
+    def refresh(self) -> set[Position]:
+        codes = [EMPTY_CODE] * 64
+        for piece in self._board.get_all_pieces():
+            codes[piece.position.index] = encode_piece(piece.piece_type, piece.team)
+        changed = [square for square in range(64) if codes[square] != self._codes[square]]
+        if not changed:
+            return set()
+
+        recompute = set(changed)
+        for square in changed:
+            recompute.update(attacker for attacker in self._attackers[square] if self._is_slider(attacker))
+
+        touched: dict[int, tuple[int, int]] = {}
+        for square in recompute:
+            self._remove_attacks(square, touched)
+        self._codes = codes
+        for square in recompute:
+            if codes[square] != EMPTY_CODE:
+                self._add_attacks(square, touched)
+
+        dirty = set(changed)
+        dirty.update(square for square, before in touched.items() if before != self._count_pair(square))
+        return {SQUARES[square] for square in dirty}
+
+    def attack_count(self, position: Position, team: Team) -> int:
+        return self._counts[team][position.index]
+
+    def attackers_of(self, position: Position) -> list[Position]:
+        return [SQUARES[square] for square in sorted(self._attackers[position.index])]
+
+    def attacked_squares(self, position: Position) -> list[Position]:
+        return [SQUARES[square] for square in self._attacks[position.index]]
+
+    def is_hanging(self, position: Position) -> bool:
+        code = self._codes[position.index]
+        if code == EMPTY_CODE:
+            return False
+        _, team = _CODE_PIECES[code]
+        opponent = Team.BLACK if team == Team.WHITE else Team.WHITE
+        return self._counts[opponent][position.index] > 0 and self._counts[team][position.index] == 0
+
+    def hanging_pieces(self) -> list[Position]:
+        return [SQUARES[square] for square in range(64) if self.is_hanging(SQUARES[square])]
+
+    def _count_pair(self, square: int) -> tuple[int, int]:
+        return self._counts[Team.WHITE][square], self._counts[Team.BLACK][square]
+
+    def _is_slider(self, square: int) -> bool:
+        return _CODE_PIECES[self._codes[square]][0] in _SLIDER_RAYS
+
+    def _remove_attacks(self, square: int, touched: dict[int, tuple[int, int]]) -> None:
+        if self._codes[square] == EMPTY_CODE:
+            return
+        counts = self._counts[_CODE_PIECES[self._codes[square]][1]]
+        for target in self._attacks[square]:
+            touched.setdefault(target, self._count_pair(target))
+            self._attackers[target].discard(square)
+            counts[target] -= 1
+        self._attacks[square] = ()
+
+    def _add_attacks(self, square: int, touched: dict[int, tuple[int, int]]) -> None:
+        piece_type, team = _CODE_PIECES[self._codes[square]]
+        attacks = self._generate_attacks(square, piece_type, team)
+        counts = self._counts[team]
+        for target in attacks:
+            touched.setdefault(target, self._count_pair(target))
+            self._attackers[target].add(square)
+            counts[target] += 1
+        self._attacks[square] = attacks
+
+    def _generate_attacks(self, square: int, piece_type: PieceType, team: Team) -> tuple[int, ...]:
+        if piece_type == PieceType.PAWN:
+            return _PAWN_TARGETS[team][square]
+        if piece_type in _JUMP_TARGETS:
+            return _JUMP_TARGETS[piece_type][square]
+        attacks = []
+        for ray in _SLIDER_RAYS[piece_type][square]:
+            for target in ray:
+                attacks.append(target)
+                if self._codes[target] != EMPTY_CODE:
+                    break
+        return tuple(attacks)
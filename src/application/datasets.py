@@ -0,0 +1,273 @@
+import json
+import os
+import time
+from array import array
+from bisect import bisect_right
+from concurrent.futures import as_completed, ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from itertools import islice
+from pathlib import Path
+from typing import Iterator, Protocol
+
+import numpy as np
+
+from src.domain.board import Board
+from src.domain.game_state import GameStatus
+from src.application.simulation import play_game, SelfPlayConfig
+from src.application.tensors import bitboards_to_planes, codes_to_planes, move_masks, planes_to_bitboards
+from src.domain.encoding import decode_move, encode_piece, EMPTY_CODE, TEAMS
+from src.infrastructure.game_records import game_record_offsets, read_game_records
+
+
+MANIFEST_NAME = "manifest.json"
+DATASET_VERSION = 1
+SHARD_FIELDS = {
+    "bitboards": ("<u8", (12,)),
+    "turns": ("u1", ()),
+    "masks": ("u1", (512,)),
+    "results": ("i1", ()),
+    "moves": ("<u2", ()),
+}
+
+_RESULTS = {GameStatus.WHITE_WON: 1, GameStatus.BLACK_WON: -1}
+
+
+class GameSource(Protocol):
+    @property
+    def count(self) -> int:
+        ...
+
+    def load(self, start: int, stop: int) -> list[tuple[GameStatus, array]]:
+        ...
+
+
+@dataclass(frozen=True)
+class SelfPlaySource:
+    config: SelfPlayConfig
+
+    @property
+    def count(self) -> int:
+        return self.config.games
+
+    def load(self, start: int, stop: int) -> list[tuple[GameStatus, array]]:
+        records = (play_game(self.config, index) for index in range(start, stop))
+        return [(record.status, record.moves) for record in records]
+
+
+@dataclass
+class GameFileSource:
+    path: str
+    _offsets: array | None = field(default=None, init=False, repr=False)
+
+    @property
+    def count(self) -> int:
+        return len(self._record_offsets())
+
+    def load(self, start: int, stop: int) -> list[tuple[GameStatus, array]]:
+        offsets = self._record_offsets()
+        if start >= min(stop, len(offsets)):
+            return []
+        games = islice(read_game_records(self.path, offsets[start]), stop - start)
+        return [(game.status, game.moves) for game in games]
+
+    def _record_offsets(self) -> array:
+        if self._offsets is None:
+            self._offsets = game_record_offsets(self.path)
+        return self._offsets
+
+
+@dataclass
+class ShardInfo:
+    index: int
+    first_game: int
+    games: int
+    samples: int
+
+
+@dataclass
+class ExportReport:
+    shards_written: int = 0
+    shards_skipped: int = 0
+    samples: int = 0
+    elapsed: float = 0.0
+
+    def format(self) -> str:
+        rate = self.samples / self.elapsed if self.elapsed else 0.0
+        return (
+            f"shards written: {self.shards_written}  skipped (resumed): {self.shards_skipped}  "
+            f"samples: {self.samples}  elapsed: {self.elapsed:.2f}s  ({rate:.0f} samples/s)"
+        )
+
+
+def _starting_codes() -> np.ndarray:
+    codes = np.full(64, EMPTY_CODE, dtype=np.uint8)
+    for position, (piece_type, team) in Board.starting_positions().items():
+        codes[position.index] = encode_piece(piece_type, team)
+    return codes
+
+
+_STARTING_CODES = _starting_codes()
+
+
+def game_positions(moves: array) -> tuple[np.ndarray, np.ndarray]:
+    codes = np.empty((len(moves), 64), dtype=np.uint8)
+    turns = np.arange(len(moves), dtype=np.uint8) % 2
+    current = _STARTING_CODES.copy()
+    for ply, move in enumerate(moves):
+        codes[ply] = current
+        source, target, promotion = decode_move(move)
+        piece_code = current[source.index]
+        current[target.index] = encode_piece(promotion, TEAMS[ply % 2]) if promotion else piece_code
+        current[source.index] = EMPTY_CODE
+    return codes, turns
+
+
+def build_shard(games: list[tuple[GameStatus, array]]) -> dict[str, np.ndarray]:
+    codes, turns, results, moves = [], [], [], []
+    for status, game_moves in games:
+        game_codes, game_turns = game_positions(game_moves)
+        codes.append(game_codes)
+        turns.append(game_turns)
+        results.append(np.full(len(game_moves), _RESULTS.get(status, 0), dtype=np.int8))
+        moves.append(np.frombuffer(game_moves, dtype=np.uint16) if len(game_moves) else np.empty(0, np.uint16))
+
+    codes = np.concatenate(codes) if codes else np.empty((0, 64), dtype=np.uint8)
+    planes = codes_to_planes(codes)
+    turns = np.concatenate(turns) if turns else np.empty(0, dtype=np.uint8)
+    return {
+        "bitboards": planes_to_bitboards(planes),
+        "turns": turns,
+        "masks": np.packbits(move_masks(planes, turns).reshape(len(planes), -1), axis=1),
+        "results": np.concatenate(results) if results else np.empty(0, dtype=np.int8),
+        "moves": np.concatenate(moves).astype("<u2") if moves else np.empty(0, dtype="<u2"),
+    }
+
+
+def shard_path(directory: Path, index: int, name: str) -> Path:
+    return directory / f"shard-{index:05d}.{name}.npy"
+
+
+def _export_shard(source: GameSource, directory: str, index: int, first_game: int, last_game: int) -> ShardInfo:
+    directory = Path(directory)
+    arrays = build_shard(source.load(first_game, last_game))
+    for name, values in arrays.items():
+        dtype, _ = SHARD_FIELDS[name]
+        path = shard_path(directory, index, name)
+        temporary = path.with_suffix(".tmp")
+        with temporary.open("wb") as stream:
+            np.save(stream, values.astype(dtype, copy=False))
+        os.replace(temporary, path)
+    return ShardInfo(index, first_game, last_game - first_game, len(arrays["turns"]))
+
+
+def _read_manifest(directory: Path) -> dict:
+    path = directory / MANIFEST_NAME
+    if not path.exists():
+        return {"version": DATASET_VERSION, "fields": {}, "games_per_shard": None, "shards": []}
+    return json.loads(path.read_text())
+
+
+def _write_manifest(directory: Path, manifest: dict) -> None:
+    manifest["shards"].sort(key=lambda shard: shard["index"])
+    manifest["samples"] = sum(shard["samples"] for shard in manifest["shards"])
+    temporary = directory / (MANIFEST_NAME + ".tmp")
+    temporary.write_text(json.dumps(manifest, indent=2))
+    os.replace(temporary, directory / MANIFEST_NAME)
+
+
+def export_dataset(
+    source: GameSource,
+    directory: str | Path,
+    games_per_shard: int = 256,
+    workers: int = 1,
+) -> ExportReport:
+    directory = Path(directory)
+    directory.mkdir(parents=True, exist_ok=True)
+    manifest = _read_manifest(directory)
+    if manifest["games_per_shard"] not in (None, games_per_shard):
+        raise ValueError(
+            f"{directory} was exported with {manifest['games_per_shard']} games per shard, not {games_per_shard}"
+        )
+    manifest["games_per_shard"] = games_per_shard
+    manifest["fields"] = {name: {"dtype": dtype, "shape": list(shape)} for name, (dtype, shape) in SHARD_FIELDS.items()}
+
+    report = ExportReport()
+    started = time.perf_counter()
+    completed = {shard["index"] for shard in manifest["shards"]}
+    total = source.count
+    pending = []
+    for index, first_game in enumerate(range(0, total, games_per_shard)):
+        if index in completed:
+            report.shards_skipped += 1
+            continue
+        pending.append((index, first_game, min(total, first_game + games_per_shard)))
+
+    def record(info: ShardInfo) -> None:
+        manifest["shards"].append(asdict(info))
+        _write_manifest(directory, manifest)
+        report.shards_written += 1
+        report.samples += info.samples
+
+    if workers <= 1:
+        for index, first_game, last_game in pending:
+            record(_export_shard(source, str(directory), index, first_game, last_game))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(_export_shard, source, str(directory), index, first_game, last_game)
+                for index, first_game, last_game in pending
+            ]
+            for future in as_completed(futures):
+                record(future.result())
+
+    _write_manifest(directory, manifest)
+    report.elapsed = time.perf_counter() - started
+    return report
+
+
+@dataclass
+class TrainingSample:
+    planes: np.ndarray
+    turn: int
+    mask: np.ndarray
+    result: int
+    move: int
+
+
+class TrainingDataset:
+    def __init__(self, directory: str | Path):
+        self.directory = Path(directory)
+        self.manifest = _read_manifest(self.directory)
+        self._shards: dict[int, dict[str, np.ndarray]] = {}
+        self._offsets = [0]
+        for shard in self.manifest["shards"]:
+            self._offsets.append(self._offsets[-1] + shard["samples"])
+
+    def __len__(self) -> int:
+        return self._offsets[-1]
+
+    def __getitem__(self, index: int) -> TrainingSample:
+        if not 0 <= index < len(self):
+            raise IndexError(index)
+        position = bisect_right(self._offsets, index) - 1
+        arrays = self.shard(position)
+        local = index - self._offsets[position]
+        return TrainingSample(
+            planes=bitboards_to_planes(arrays["bitboards"][local:local + 1])[0],
+            turn=int(arrays["turns"][local]),
+            mask=np.unpackbits(arrays["masks"][local]).reshape(64, 64).astype(bool),
+            result=int(arrays["results"][local]),
+            move=int(arrays["moves"][local]),
+        )
+
+    def shard(self, position: int) -> dict[str, np.ndarray]:
+        if position not in self._shards:
+            index = self.manifest["shards"][position]["index"]
+            self._shards[position] = {
+                name: np.load(shard_path(self.directory, index, name), mmap_mode="r") for name in SHARD_FIELDS
+            }
+        return self._shards[position]
+
+    def iter_shards(self) -> Iterator[dict[str, np.ndarray]]:
+        for position in range(len(self.manifest["shards"])):
+            yield self.shard(position)
@@ -0,0 +1,149 @@
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Iterator
+
+from PyQt6.QtCore import QRect, Qt
+from PyQt6.QtGui import QGuiApplication, QImage, QPainter
+
+from src.domain.board import Board
+from src.domain.game_state import GameState
+from src.application.rendering import draw_board_squares, SVGPieceRenderer
+from src.infrastructure.fen import load_fen
+from src.infrastructure.snapshots import decode_snapshot, iter_snapshots, SNAPSHOT_FILE_MAGIC
+
+
+PositionSource = str | bytes
+
+
+class DiagramRenderer:
+    BOARD_SIZE = 8
+    DEFAULT_PNG_QUALITY = 80
+
+    def __init__(
+        self,
+        square_size: int = 45,
+        piece_renderer: SVGPieceRenderer | None = None,
+        png_quality: int = DEFAULT_PNG_QUALITY,
+    ):
+        self._square_size = square_size
+        self._piece_renderer = piece_renderer or SVGPieceRenderer()
+        self._png_quality = png_quality
+        dimension = self.BOARD_SIZE * square_size
+        self._background = QImage(dimension, dimension, QImage.Format.Format_RGB32)
+        self._background.fill(Qt.GlobalColor.white)
+        painter = QPainter(self._background)
+        draw_board_squares(painter, square_size, self.BOARD_SIZE)
+        painter.end()
+        self._canvas = QImage(self._background)
+        self._painter = QPainter()
+        self._board = Board()
+        self._game_state = GameState()
+
+    @property
+    def piece_renderer(self) -> SVGPieceRenderer:
+        return self._piece_renderer
+
+    def render(self, board: Board) -> QImage:
+        self._painter.begin(self._canvas)
+        self._painter.drawImage(0, 0, self._background)
+        size = self._square_size
+        for piece in board.get_all_pieces():
+            rect = QRect(piece.position.col * size, piece.position.row * size, size, size)
+            self._piece_renderer.render(self._painter, rect, piece)
+        self._painter.end()
+        return self._canvas
+
+    def render_position(self, position: PositionSource) -> QImage:
+        if isinstance(position, bytes):
+            decode_snapshot(position, self._board, self._game_state)
+        else:
+            load_fen(self._board, position)
+        return self.render(self._board)
+
+    def save(self, position: PositionSource, path: str | Path) -> None:
+        if not self.render_position(position).save(str(path), "PNG", self._png_quality):
+            raise OSError(f"Could not write {path}")
+
+
+@dataclass
+class DiagramReport:
+    positions: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def positions_per_second(self) -> float:
+        return self.positions / self.elapsed if self.elapsed else 0.0
+
+    def format(self) -> str:
+        return f"rendered {self.positions} diagrams in {self.elapsed:.2f}s ({self.positions_per_second:.0f}/s)"
+
+
+def read_positions(path: str | Path) -> Iterator[PositionSource]:
+    path = Path(path)
+    with path.open("rb") as stream:
+        binary = stream.read(len(SNAPSHOT_FILE_MAGIC)) == SNAPSHOT_FILE_MAGIC
+    if binary:
+        yield from iter_snapshots(path)
+        return
+    with path.open() as stream:
+        for line in stream:
+            if line.strip():
+                yield line.strip()
+
+
+_application: QGuiApplication | None = None
+_worker_renderer: DiagramRenderer | None = None
+
+
+def _ensure_application() -> None:
+    global _application
+    if QGuiApplication.instance() is None:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        _application = QGuiApplication([])
+
+
+def _initialize_worker(square_size: int) -> None:
+    global _worker_renderer
+    _ensure_application()
+    _worker_renderer = DiagramRenderer(square_size)
+
+
+def _render_chunk(output_dir: str, start: int, positions: list[PositionSource]) -> int:
+    for offset, position in enumerate(positions):
+        _worker_renderer.save(position, Path(output_dir) / f"{start + offset:06d}.png")
+    return len(positions)
+
+
+def render_diagrams(
+    positions: list[PositionSource],
+    output_dir: str | Path,
+    square_size: int = 45,
+    workers: int = 1,
+    chunk_size: int = 64,
+) -> DiagramReport:
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    report = DiagramReport()
+    started = time.perf_counter()
+    chunks = [(start, positions[start:start + chunk_size]) for start in range(0, len(positions), chunk_size)]
+
+    if workers <= 1:
+        _initialize_worker(square_size)
+        for start, chunk in chunks:
+            report.positions += _render_chunk(str(output_dir), start, chunk)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_initialize_worker,
+            initargs=(square_size,),
+        ) as executor:
+            futures = [executor.submit(_render_chunk, str(output_dir), start, chunk) for start, chunk in chunks]
+            report.positions = sum(future.result() for future in futures)
+
+    report.elapsed = time.perf_counter() - started
+    return report
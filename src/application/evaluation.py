@@ -0,0 +1,147 @@
+import json
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from src.domain.board import Board
+from src.domain.entities import PieceType, Team
+
+
+PIECE_VALUES: dict[PieceType, int] = {
+    PieceType.PAWN: 100,
+    PieceType.KNIGHT: 320,
+    PieceType.BISHOP: 330,
+    PieceType.ROOK: 500,
+    PieceType.QUEEN: 900,
+    PieceType.KING: 20000,
+}
+
+PIECE_SQUARE_TABLES: dict[PieceType, tuple[int, ...]] = {
+    PieceType.PAWN: (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        50, 50, 50, 50, 50, 50, 50, 50,
+        10, 10, 20, 30, 30, 20, 10, 10,
+        5, 5, 10, 25, 25, 10, 5, 5,
+        0, 0, 0, 20, 20, 0, 0, 0,
+        5, -5, -10, 0, 0, -10, -5, 5,
+        5, 10, 10, -20, -20, 10, 10, 5,
+        0, 0, 0, 0, 0, 0, 0, 0,
+    ),
+    PieceType.KNIGHT: (
+        -50, -40, -30, -30, -30, -30, -40, -50,
+        -40, -20, 0, 0, 0, 0, -20, -40,
+        -30, 0, 10, 15, 15, 10, 0, -30,
+        -30, 5, 15, 20, 20, 15, 5, -30,
+        -30, 0, 15, 20, 20, 15, 0, -30,
+        -30, 5, 10, 15, 15, 10, 5, -30,
+        -40, -20, 0, 5, 5, 0, -20, -40,
+        -50, -40, -30, -30, -30, -30, -40, -50,
+    ),
+    PieceType.BISHOP: (
+        -20, -10, -10, -10, -10, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 10, 10, 5, 0, -10,
+        -10, 5, 5, 10, 10, 5, 5, -10,
+        -10, 0, 10, 10, 10, 10, 0, -10,
+        -10, 10, 10, 10, 10, 10, 10, -10,
+        -10, 5, 0, 0, 0, 0, 5, -10,
+        -20, -10, -10, -10, -10, -10, -10, -20,
+    ),
+    PieceType.ROOK: (
+        0, 0, 0, 0, 0, 0, 0, 0,
+        5, 10, 10, 10, 10, 10, 10, 5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        -5, 0, 0, 0, 0, 0, 0, -5,
+        0, 0, 0, 5, 5, 0, 0, 0,
+    ),
+    PieceType.QUEEN: (
+        -20, -10, -10, -5, -5, -10, -10, -20,
+        -10, 0, 0, 0, 0, 0, 0, -10,
+        -10, 0, 5, 5, 5, 5, 0, -10,
+        -5, 0, 5, 5, 5, 5, 0, -5,
+        0, 0, 5, 5, 5, 5, 0, -5,
+        -10, 5, 5, 5, 5, 5, 0, -10,
+        -10, 0, 5, 0, 0, 0, 0, -10,
+        -20, -10, -10, -5, -5, -10, -10, -20,
+    ),
+    PieceType.KING: (
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -30, -40, -40, -50, -50, -40, -40, -30,
+        -20, -30, -30, -40, -40, -30, -30, -20,
+        -10, -20, -20, -20, -20, -20, -20, -10,
+        20, 20, 0, 0, 0, 0, 20, 20,
+        20, 30, 10, 0, 0, 10, 30, 20,
+    ),
+}
+
+
+@dataclass
+class EvaluationWeights:
+    piece_values: dict[PieceType, int] = field(default_factory=lambda: dict(PIECE_VALUES))
+    piece_square_tables: dict[PieceType, tuple[int, ...]] = field(
+        default_factory=lambda: dict(PIECE_SQUARE_TABLES)
+    )
+
+
+def square_table_index(team: Team, row: int, col: int) -> int:
+    return row * 8 + col if team == Team.WHITE else (7 - row) * 8 + col
+
+
+class BoardEvaluationService:
+    def __init__(self, weights: EvaluationWeights | None = None):
+        self._weights = weights or EvaluationWeights()
+        self._piece_scores = {
+            (piece_type, team): tuple(
+                self._weights.piece_values[piece_type]
+                + self._weights.piece_square_tables[piece_type][square_table_index(team, index // 8, index % 8)]
+                for index in range(64)
+            )
+            for piece_type in PieceType
+            for team in Team
+        }
+
+    @property
+    def weights(self) -> EvaluationWeights:
+        return self._weights
+
+    def piece_value(self, piece_type: PieceType) -> int:
+        return self._weights.piece_values[piece_type]
+
+    def evaluate(self, board: Board) -> int:
+        score = 0
+        for piece in board.get_all_pieces():
+            value = self._piece_scores[(piece.piece_type, piece.team)][piece.position.row * 8 + piece.position.col]
+            score += value if piece.team == Team.WHITE else -value
+        return score
+
+    def evaluate_for(self, board: Board, team: Team) -> int:
+        score = self.evaluate(board)
+        return score if team == Team.WHITE else -score
+
+
+def load_weights(path: str | Path) -> EvaluationWeights:
+    data = json.loads(Path(path).read_text())
+    weights = EvaluationWeights()
+    for name, value in data.get("piece_values", {}).items():
+        weights.piece_values[PieceType(name)] = int(value)
+    for name, table in data.get("piece_square_tables", {}).items():
+        if len(table) != 64:
+            raise ValueError(f"Piece-square table for {name} must have 64 entries")
+        weights.piece_square_tables[PieceType(name)] = tuple(int(value) for value in table)
+    return weights
+
+
+def save_weights(weights: EvaluationWeights, path: str | Path) -> None:
+    data = {
+        "piece_values": {
+            piece_type.value: value for piece_type, value in weights.piece_values.items()
+        },
+        "piece_square_tables": {
+            piece_type.value: list(table) for piece_type, table in weights.piece_square_tables.items()
+        },
+    }
+    Path(path).write_text(json.dumps(data, indent=2))
@@ -0,0 +1,130 @@
+import atexit
+import functools
+import json
+import os
+import time
+from pathlib import Path
+from typing import Callable, TypeVar
+
+
+F = TypeVar("F", bound=Callable)
+
+ENABLE_ENVIRONMENT_VARIABLE = "CHESS_INSTRUMENTATION"
+OUTPUT_ENVIRONMENT_VARIABLE = "CHESS_METRICS_FILE"
+
+_COUNT = 0
+_TOTAL_NS = 1
+_MAX_NS = 2
+
+
+class Instrumentation:
+    def __init__(self, enabled: bool = False):
+        self._enabled = enabled
+        self._counters: dict[str, list[int]] = {}
+        self._timers: dict[str, list[int]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    def timed(self, name: str) -> Callable[[F], F]:
+        def decorate(function: F) -> F:
+            if not self._enabled:
+                return function
+
+            timer = self._timers.setdefault(name, [0, 0, 0])
+            clock = time.perf_counter_ns
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                started = clock()
+                try:
+                    return function(*args, **kwargs)
+                finally:
+                    elapsed = clock() - started
+                    timer[_COUNT] += 1
+                    timer[_TOTAL_NS] += elapsed
+                    if elapsed > timer[_MAX_NS]:
+                        timer[_MAX_NS] = elapsed
+
+            return wrapper
+
+        return decorate
+
+    def counted(self, name: str) -> Callable[[F], F]:
+        def decorate(function: F) -> F:
+            if not self._enabled:
+                return function
+
+            counter = self._counters.setdefault(name, [0])
+
+            @functools.wraps(function)
+            def wrapper(*args, **kwargs):
+                counter[0] += 1
+                return function(*args, **kwargs)
+
+            return wrapper
+
+        return decorate
+
+    def increment(self, name: str, amount: int = 1) -> None:
+        if self._enabled:
+            self._counters.setdefault(name, [0])[0] += amount
+
+    def reset(self) -> None:
+        for counter in self._counters.values():
+            counter[0] = 0
+        for timer in self._timers.values():
+            timer[:] = [0, 0, 0]
+
+    def snapshot(self) -> dict:
+        timers = {}
+        for name, (count, total_ns, max_ns) in self._timers.items():
+            timers[name] = {
+                "count": count,
+                "total_seconds": total_ns / 1e9,
+                "mean_seconds": total_ns / count / 1e9 if count else 0.0,
+                "max_seconds": max_ns / 1e9,
+            }
+        return {
+            "counters": {name: counter[0] for name, counter in self._counters.items()},
+            "timers": timers,
+        }
+
+    def to_json(self) -> str:
+        return json.dumps(self.snapshot(), indent=2, sort_keys=True)
+
+    def to_prometheus(self, prefix: str = "chess") -> str:
+        snapshot = self.snapshot()
+        lines = [f"# TYPE {prefix}_events_total counter"]
+        lines.extend(
+            f'{prefix}_events_total{{name="{name}"}} {value}'
+            for name, value in sorted(snapshot["counters"].items())
+        )
+        series = (
+            ("calls_total", "counter", "count"),
+            ("duration_seconds_total", "counter", "total_seconds"),
+            ("duration_seconds_max", "gauge", "max_seconds"),
+        )
+        for suffix, metric_type, field in series:
+            lines.append(f"# TYPE {prefix}_{suffix} {metric_type}")
+            lines.extend(
+                f'{prefix}_{suffix}{{name="{name}"}} {values[field]}'
+                for name, values in sorted(snapshot["timers"].items())
+            )
+        return "\n".join(lines) + "\n"
+
+    def write(self, path: str | Path) -> None:
+        path = Path(path)
+        content = self.to_prometheus() if path.suffix in (".prom", ".txt") else self.to_json()
+        path.write_text(content)
+
+
+def _enabled_from_environment() -> bool:
+    return os.environ.get(ENABLE_ENVIRONMENT_VARIABLE, "") not in ("", "0")
+
+
+instrumentation = Instrumentation(_enabled_from_environment())
+
+if instrumentation.enabled and os.environ.get(OUTPUT_ENVIRONMENT_VARIABLE):
+    atexit.register(instrumentation.write, os.environ[OUTPUT_ENVIRONMENT_VARIABLE])
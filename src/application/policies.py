@@ -0,0 +1,79 @@
+import random
+from abc import ABC, abstractmethod
+
+from src.domain.board import Board
+from src.domain.entities import Piece, Position, Team
+from src.application.evaluation import BoardEvaluationService
+from src.application.search import MiniMaxService, SearchLimits
+from src.application.services import MoveValidator
+
+
+class MovePolicy(ABC):
+    @abstractmethod
+    def select_move(self, team: Team) -> tuple[Piece, Position] | None:
+        pass
+
+
+class RandomMovePolicy(MovePolicy):
+    def __init__(self, board: Board, rng: random.Random):
+        self._validator = MoveValidator(board)
+        self._rng = rng
+
+    def select_move(self, team: Team) -> tuple[Piece, Position] | None:
+        moves = self._validator.get_all_valid_moves(team)
+        return self._rng.choice(moves) if moves else None
+
+
+class GreedyCapturePolicy(MovePolicy):
+    def __init__(self, board: Board, rng: random.Random):
+        self._board = board
+        self._validator = MoveValidator(board)
+        self._evaluation_service = BoardEvaluationService()
+        self._rng = rng
+
+    def select_move(self, team: Team) -> tuple[Piece, Position] | None:
+        moves = self._validator.get_all_valid_moves(team)
+        if not moves:
+            return None
+
+        best_gain = 0
+        best_moves = []
+        for piece, target in moves:
+            captured = self._board.get_piece(target)
+            gain = self._evaluation_service.piece_value(captured.piece_type) if captured else 0
+            if gain > best_gain:
+                best_gain = gain
+                best_moves = [(piece, target)]
+            elif gain == best_gain:
+                best_moves.append((piece, target))
+        return self._rng.choice(best_moves)
+
+
+class SearchPolicy(MovePolicy):
+    def __init__(self, board: Board, limits: SearchLimits):
+        self._board = board
+        self._search_service = MiniMaxService(board)
+        self._limits = limits
+
+    def select_move(self, team: Team) -> tuple[Piece, Position] | None:
+        result = self._search_service.search(team, self._limits)
+        if result.move is None:
+            return None
+        source, target = result.move
+        return self._board.get_piece(source), target
+
+
+POLICY_NAMES = ("random", "greedy", "search")
+
+
+def create_policy(
+    name: str, board: Board, rng: random.Random, limits: SearchLimits = SearchLimits()
+) -> MovePolicy:
+    match name:
+        case "random":
+            return RandomMovePolicy(board, rng)
+        case "greedy":
+            return GreedyCapturePolicy(board, rng)
+        case "search":
+            return SearchPolicy(board, limits)
+    raise ValueError(f"Unknown move policy '{name}'")
@@ -0,0 +1,120 @@
+import threading
+import time
+
+from src.domain.board import Board
+from src.domain.entities import Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.evaluation import BoardEvaluationService
+from src.application.search import MiniMaxService, SearchLimits, SearchResult
+from src.application.usecases import ExecuteMoveUseCase
+from src.infrastructure.repositories import BoardRepository
+
+
+class ComputerPlayer:
+    PONDER_HIT_SECONDS = 1.0
+
+    def __init__(
+        self,
+        team: Team,
+        limits: SearchLimits = SearchLimits(depth=64, movetime=1.0),
+        evaluation_service: BoardEvaluationService | None = None,
+    ):
+        self._team = team
+        self._limits = limits
+        self._board = Board()
+        self._game_state = GameState()
+        self._repository = BoardRepository(self._board)
+        self._execute_move_use_case = ExecuteMoveUseCase(self._board, self._game_state)
+        self._search_service = MiniMaxService(self._board, evaluation_service)
+        self._stop_event = threading.Event()
+        self._ponder_thread: threading.Thread | None = None
+        self._ponder_key: int | None = None
+        self._ponder_move: tuple[Position, Position] | None = None
+        self._ponder_deadline: float | None = None
+        self._ponder_result: SearchResult | None = None
+        self.ponder_hits = 0
+        self.ponder_misses = 0
+
+    @property
+    def team(self) -> Team:
+        return self._team
+
+    @property
+    def search_service(self) -> MiniMaxService:
+        return self._search_service
+
+    @property
+    def is_pondering(self) -> bool:
+        return self._ponder_thread is not None
+
+    @property
+    def ponder_move(self) -> tuple[Position, Position] | None:
+        return self._ponder_move
+
+    def choose_move(self, board: Board, game_state: GameState) -> SearchResult:
+        if self._ponder_thread is not None:
+            if board.position_key(game_state.current_turn) == self._ponder_key:
+                self.ponder_hits += 1
+                result = self._finish_pondering()
+                if result is not None and result.move is not None:
+                    return result
+            else:
+                self.ponder_misses += 1
+                self.stop_pondering()
+        self._synchronize(board, game_state)
+        return self._search_service.search(self._team, self._limits)
+
+    def start_pondering(self, board: Board, game_state: GameState, result: SearchResult) -> bool:
+        self.stop_pondering()
+        if game_state.status != GameStatus.IN_PROGRESS or len(result.pv) < 2:
+            return False
+
+        self._synchronize(board, game_state)
+        source, target = result.pv[1]
+        piece = self._board.get_piece(source)
+        if piece is None:
+            return False
+        moved_piece, status = self._execute_move_use_case.execute(piece, target)
+        if moved_piece is None or status != GameStatus.IN_PROGRESS:
+            return False
+
+        self._ponder_key = self._board.position_key(self._game_state.current_turn)
+        self._ponder_move = (source, target)
+        self._ponder_deadline = None
+        self._ponder_result = None
+        self._stop_event.clear()
+        self._ponder_thread = threading.Thread(target=self._ponder, name="ponder", daemon=True)
+        self._ponder_thread.start()
+        return True
+
+    def stop_pondering(self) -> None:
+        if self._ponder_thread is None:
+            return
+        self._stop_event.set()
+        self._ponder_thread.join()
+        self._clear_ponder()
+
+    def _finish_pondering(self) -> SearchResult | None:
+        budget = self._limits.movetime if self._limits.movetime is not None else self.PONDER_HIT_SECONDS
+        self._ponder_deadline = time.perf_counter() + budget
+        self._ponder_thread.join()
+        result = self._ponder_result
+        self._clear_ponder()
+        return result
+
+    def _clear_ponder(self) -> None:
+        self._ponder_thread = None
+        self._ponder_key = None
+        self._ponder_move = None
+
+    def _ponder(self) -> None:
+        limits = SearchLimits(depth=self._limits.depth, nodes=self._limits.nodes)
+        self._ponder_result = self._search_service.search(self._team, limits, should_stop=self._should_stop_pondering)
+
+    def _should_stop_pondering(self) -> bool:
+        if self._stop_event.is_set():
+            return True
+        return self._ponder_deadline is not None and time.perf_counter() >= self._ponder_deadline
+
+    def _synchronize(self, board: Board, game_state: GameState) -> None:
+        self._repository.restore(BoardRepository(board).snapshot(game_state), self._game_state)
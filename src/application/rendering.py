@@ -1,9 +1,32 @@
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from PyQt6.QtGui import QPixmap, QPainter, QColor, QFont, QPen, QBrush, QPolygon
 from PyQt6.QtCore import QRect, Qt, QPoint
 from src.domain.entities import PieceType, Team, Piece
 
 
+SpriteKey = tuple[PieceType, Team, int, int, float]
+
+LIGHT_SQUARE_COLOR = QColor(240, 217, 181)
+DARK_SQUARE_COLOR = QColor(181, 136, 99)
+
+_KNIGHT_POLYGON = QPolygon([
+    QPoint(x, y) for x, y in [(-10, 24), (-10, 8), (-5, 0), (0, -6), (8, -4), (12, 8), (8, 24), (-10, 24)]
+])
+_QUEEN_POLYGON = QPolygon([
+    QPoint(x, y) for x, y in [(-12, 0), (-5, 0), (-3, 8), (0, 2), (3, 8), (5, 0), (12, 0), (8, 24), (-8, 24)]
+])
+
+
+def draw_board_squares(painter: QPainter, square_size: int, board_size: int = 8) -> None:
+    for row in range(board_size):
+        for col in range(board_size):
+            rect = QRect(col * square_size, row * square_size, square_size, square_size)
+            is_light = (row + col) % 2 == 0
+            painter.fillRect(rect, LIGHT_SQUARE_COLOR if is_light else DARK_SQUARE_COLOR)
+            painter.drawRect(rect)
+
+
 class PieceRenderingStrategy(ABC):
     @abstractmethod
     def render(self, painter: QPainter, rect: QRect, piece: Piece) -> None:
@@ -11,14 +34,72 @@ class PieceRenderingStrategy(ABC):
 
 
 class SVGPieceRenderer(PieceRenderingStrategy):
-    def __init__(self, piece_size: int = 60):
+    DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+
+    def __init__(self, piece_size: int = 60, cache_bytes: int = DEFAULT_CACHE_BYTES):
         self.piece_size = piece_size
+        self._cache_limit = cache_bytes
+        self._cache_bytes = 0
+        self._sprites: OrderedDict[SpriteKey, QPixmap] = OrderedDict()
 
-    def render(self, painter: QPainter, rect: QRect, piece: Piece) -> None:
-        color = QColor("white") if piece.team == Team.WHITE else QColor("black")
-        outline_color = QColor("black") if piece.team == Team.WHITE else QColor("white")
+    @property
+    def cached_sprite_count(self) -> int:
+        return len(self._sprites)
 
-        self._draw_piece_symbol(painter, rect, piece.piece_type, color, outline_color)
+    @property
+    def cache_bytes(self) -> int:
+        return self._cache_bytes
+
+    def render(self, painter: QPainter, rect: QRect, piece: Piece) -> None:
+        device = painter.device()
+        device_pixel_ratio = device.devicePixelRatioF() if device is not None else 1.0
+        sprite = self.sprite(piece.piece_type, piece.team, rect.width(), rect.height(), device_pixel_ratio)
+        painter.drawPixmap(rect.topLeft(), sprite)
+
+    def render_vector(self, painter: QPainter, rect: QRect, piece: Piece) -> None:
+        self._draw_team_symbol(painter, rect, piece.piece_type, piece.team)
+
+    def sprite(
+        self, piece_type: PieceType, team: Team, width: int, height: int, device_pixel_ratio: float = 1.0
+    ) -> QPixmap:
+        key = (piece_type, team, width, height, device_pixel_ratio)
+        sprite = self._sprites.get(key)
+        if sprite is not None:
+            self._sprites.move_to_end(key)
+            return sprite
+
+        sprite = self._draw_sprite(piece_type, team, width, height, device_pixel_ratio)
+        self._sprites[key] = sprite
+        self._cache_bytes += self._sprite_bytes(sprite)
+        while self._cache_bytes > self._cache_limit and len(self._sprites) > 1:
+            _, evicted = self._sprites.popitem(last=False)
+            self._cache_bytes -= self._sprite_bytes(evicted)
+        return sprite
+
+    def clear_cache(self) -> None:
+        self._sprites.clear()
+        self._cache_bytes = 0
+
+    def _draw_sprite(
+        self, piece_type: PieceType, team: Team, width: int, height: int, device_pixel_ratio: float
+    ) -> QPixmap:
+        sprite = QPixmap(max(1, round(width * device_pixel_ratio)), max(1, round(height * device_pixel_ratio)))
+        sprite.setDevicePixelRatio(device_pixel_ratio)
+        sprite.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(sprite)
+        self._draw_team_symbol(painter, QRect(0, 0, width, height), piece_type, team)
+        painter.end()
+        return sprite
+
+    @staticmethod
+    def _sprite_bytes(sprite: QPixmap) -> int:
+        return sprite.width() * sprite.height() * max(1, sprite.depth() // 8)
+
+    def _draw_team_symbol(self, painter: QPainter, rect: QRect, piece_type: PieceType, team: Team) -> None:
+        color = QColor("white") if team == Team.WHITE else QColor("black")
+        outline_color = QColor("black") if team == Team.WHITE else QColor("white")
+
+        self._draw_piece_symbol(painter, rect, piece_type, color, outline_color)
 
     def _draw_piece_symbol(
         self,
@@ -63,18 +144,7 @@ class SVGPieceRenderer(PieceRenderingStrategy):
         painter.drawRect(-2, -4, 4, 4)
 
     def _draw_knight(self, painter: QPainter) -> None:
-        points = [
-            (-10, 24),
-            (-10, 8),
-            (-5, 0),
-            (0, -6),
-            (8, -4),
-            (12, 8),
-            (8, 24),
-            (-10, 24),
-        ]
-        polygon_points = QPolygon([QPoint(x, y) for x, y in points])
-        painter.drawPolygon(polygon_points)
+        painter.drawPolygon(_KNIGHT_POLYGON)
 
     def _draw_bishop(self, painter: QPainter) -> None:
         painter.drawEllipse(-6, -8, 12, 12)
@@ -85,19 +155,7 @@ class SVGPieceRenderer(PieceRenderingStrategy):
         for i in range(5):
             x = -10 + i * 5
             painter.drawEllipse(x - 2, -8, 4, 4)
-        points = [
-            (-12, 0),
-            (-5, 0),
-            (-3, 8),
-            (0, 2),
-            (3, 8),
-            (5, 0),
-            (12, 0),
-            (8, 24),
-            (-8, 24),
-        ]
-        polygon_points = QPolygon([QPoint(x, y) for x, y in points])
-        painter.drawPolygon(polygon_points)
+        painter.drawPolygon(_QUEEN_POLYGON)
 
     def _draw_king(self, painter: QPainter) -> None:
         painter.drawRect(-10, 0, 20, 20)
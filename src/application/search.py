@@ -0,0 +1,348 @@
+import time
+from dataclasses import dataclass, field
+from typing import Callable
+
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Position, Team
+from src.application.evaluation import BoardEvaluationService
+from src.application.services import MoveValidator, PawnPromotionService
+
+
+MATE_SCORE = 1_000_000
+MATE_THRESHOLD = MATE_SCORE - 1_000
+INFINITE_SCORE = MATE_SCORE + 1
+
+
+class SearchStopped(Exception):
+    pass
+
+
+@dataclass(frozen=True)
+class SearchLimits:
+    depth: int = 3
+    nodes: int | None = None
+    movetime: float | None = None
+
+
+@dataclass
+class SearchResult:
+    move: tuple[Position, Position] | None
+    score: int
+    depth: int
+    nodes: int
+    elapsed: float
+    pv: list[tuple[Position, Position]] = field(default_factory=list)
+
+
+@dataclass
+class AnalysisLine:
+    move: tuple[Position, Position]
+    score: int
+    pv: list[tuple[Position, Position]]
+
+
+@dataclass
+class AnalysisResult:
+    depth: int
+    nodes: int
+    elapsed: float
+    lines: list[AnalysisLine] = field(default_factory=list)
+
+
+@dataclass
+class TranspositionEntry:
+    depth: int
+    score: int
+    bound: int
+    move: tuple[Position, Position] | None
+    generation: int = 0
+
+
+class MiniMaxService:
+    EXACT = 0
+    LOWER_BOUND = 1
+    UPPER_BOUND = 2
+    MAX_TRANSPOSITIONS = 1 << 20
+    TIME_CHECK_INTERVAL = 256
+
+    def __init__(self, board: Board, evaluation_service: BoardEvaluationService | None = None):
+        self._board = board
+        self._validator = MoveValidator(board)
+        self._evaluation_service = evaluation_service or BoardEvaluationService()
+        self._promotion_service = PawnPromotionService()
+        self._transpositions: dict[int, TranspositionEntry] = {}
+        self._generation = 0
+        self._nodes = 0
+        self._node_limit: int | None = None
+        self._deadline: float | None = None
+        self._should_stop: Callable[[], bool] | None = None
+
+    def clear(self) -> None:
+        self._transpositions.clear()
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    @property
+    def transposition_count(self) -> int:
+        return len(self._transpositions)
+
+    def search(
+        self,
+        team: Team,
+        limits: SearchLimits = SearchLimits(),
+        on_iteration: Callable[[SearchResult], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> SearchResult:
+        started = self._start(limits, should_stop)
+        root_moves = self._ordered_moves(team, None)
+        result = SearchResult(
+            move=self._move_key(root_moves[0]) if root_moves else None,
+            score=0,
+            depth=0,
+            nodes=0,
+            elapsed=0.0,
+        )
+        if not root_moves:
+            return result
+
+        for depth in range(1, limits.depth + 1):
+            try:
+                score = self._negamax(team, depth, -INFINITE_SCORE, INFINITE_SCORE, 0)
+            except SearchStopped:
+                break
+            pv = self._principal_variation(team, depth)
+            result = SearchResult(
+                move=pv[0] if pv else result.move,
+                score=score,
+                depth=depth,
+                nodes=self._nodes,
+                elapsed=time.perf_counter() - started,
+                pv=pv,
+            )
+            if on_iteration is not None:
+                on_iteration(result)
+            if abs(score) >= MATE_THRESHOLD:
+                break
+
+        result.nodes = self._nodes
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def analyze(
+        self,
+        team: Team,
+        lines: int = 3,
+        limits: SearchLimits = SearchLimits(),
+        on_iteration: Callable[[AnalysisResult], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AnalysisResult:
+        started = self._start(limits, should_stop)
+        root_moves = self._ordered_moves(team, None)
+        result = AnalysisResult(depth=0, nodes=0, elapsed=0.0)
+        line_count = min(lines, len(root_moves))
+
+        for depth in range(1, limits.depth + 1):
+            found: list[AnalysisLine] = []
+            try:
+                while len(found) < line_count:
+                    line = self._search_root(team, depth, root_moves, {line.move for line in found})
+                    if line is None:
+                        break
+                    found.append(line)
+            except SearchStopped:
+                break
+            ranks = {line.move: rank for rank, line in enumerate(found)}
+            root_moves.sort(key=lambda move: ranks.get(self._move_key(move), line_count))
+            result = AnalysisResult(depth, self._nodes, time.perf_counter() - started, found)
+            if on_iteration is not None:
+                on_iteration(result)
+            if all(abs(line.score) >= MATE_THRESHOLD for line in found):
+                break
+
+        result.nodes = self._nodes
+        result.elapsed = time.perf_counter() - started
+        return result
+
+    def _start(self, limits: SearchLimits, should_stop: Callable[[], bool] | None) -> float:
+        started = time.perf_counter()
+        self._generation += 1
+        self._nodes = 0
+        self._node_limit = limits.nodes
+        self._deadline = started + limits.movetime if limits.movetime is not None else None
+        self._should_stop = should_stop
+        return started
+
+    def _search_root(
+        self,
+        team: Team,
+        depth: int,
+        root_moves: list[tuple[Piece, Position]],
+        excluded: set[tuple[Position, Position]],
+    ) -> AnalysisLine | None:
+        opponent = Team.BLACK if team == Team.WHITE else Team.WHITE
+        alpha = -INFINITE_SCORE
+        best = None
+        for piece, target in root_moves:
+            move = (piece.position, target)
+            if move in excluded:
+                continue
+            captured = self._board.get_piece(target)
+            if captured is not None and captured.piece_type == PieceType.KING:
+                return AnalysisLine(move, MATE_SCORE, [move])
+
+            self.make_move(piece, target)
+            try:
+                score = -self._negamax(opponent, depth - 1, -INFINITE_SCORE, -alpha, 1)
+                if score > alpha:
+                    best = AnalysisLine(move, score, [move] + self._principal_variation(opponent, depth - 1))
+                    alpha = score
+            finally:
+                self.unmake_move(piece, target, captured)
+        return best
+
+    def _negamax(self, team: Team, depth: int, alpha: int, beta: int, ply: int) -> int:
+        self._tick()
+
+        key = self._board.position_key(team)
+        entry = self._transpositions.get(key)
+        tt_move = None
+        if entry is not None:
+            tt_move = entry.move
+            if ply > 0 and entry.depth >= depth:
+                if entry.bound == self.EXACT:
+                    return entry.score
+                if entry.bound == self.LOWER_BOUND and entry.score >= beta:
+                    return entry.score
+                if entry.bound == self.UPPER_BOUND and entry.score <= alpha:
+                    return entry.score
+
+        if depth == 0:
+            return self._evaluation_service.evaluate_for(self._board, team)
+
+        moves = self._ordered_moves(team, tt_move)
+        if not moves:
+            return 0
+
+        original_alpha = alpha
+        best_score = -INFINITE_SCORE
+        best_move = None
+        opponent = Team.BLACK if team == Team.WHITE else Team.WHITE
+
+        for piece, target in moves:
+            captured = self._board.get_piece(target)
+            if captured is not None and captured.piece_type == PieceType.KING:
+                best_score = MATE_SCORE - ply
+                best_move = (piece.position, target)
+                break
+
+            self.make_move(piece, target)
+            try:
+                score = -self._negamax(opponent, depth - 1, -beta, -alpha, ply + 1)
+            finally:
+                self.unmake_move(piece, target, captured)
+
+            if score > best_score:
+                best_score = score
+                best_move = (piece.position, target)
+            if score > alpha:
+                alpha = score
+            if alpha >= beta:
+                break
+
+        if best_score <= original_alpha:
+            bound = self.UPPER_BOUND
+        elif best_score >= beta:
+            bound = self.LOWER_BOUND
+        else:
+            bound = self.EXACT
+        self._store(key, TranspositionEntry(depth, best_score, bound, best_move, self._generation))
+        return best_score
+
+    def make_move(self, piece: Piece, target: Position) -> Piece:
+        self._board.remove_piece(piece.position)
+        moved_piece = Piece(piece.piece_type, piece.team, target)
+        if self._promotion_service.should_promote(moved_piece):
+            moved_piece = self._promotion_service.promote(moved_piece)
+        self._board.add_piece(moved_piece)
+        return moved_piece
+
+    def unmake_move(self, piece: Piece, target: Position, captured: Piece | None) -> None:
+        self._board.remove_piece(target)
+        self._board.add_piece(piece)
+        if captured is not None:
+            self._board.add_piece(captured)
+
+    def _ordered_moves(
+        self, team: Team, tt_move: tuple[Position, Position] | None
+    ) -> list[tuple[Piece, Position]]:
+        moves = self._validator.get_all_valid_moves(team)
+        piece_value = self._evaluation_service.piece_value
+
+        def priority(move: tuple[Piece, Position]) -> int:
+            piece, target = move
+            if tt_move is not None and (piece.position, target) == tt_move:
+                return -INFINITE_SCORE
+            captured = self._board.get_piece(target)
+            if captured is None:
+                return 0
+            return piece_value(piece.piece_type) - 10 * piece_value(captured.piece_type)
+
+        moves.sort(key=priority)
+        return moves
+
+    def _principal_variation(self, team: Team, depth: int) -> list[tuple[Position, Position]]:
+        pv = []
+        undo_stack = []
+        seen = set()
+        for _ in range(depth):
+            key = self._board.position_key(team)
+            entry = self._transpositions.get(key)
+            if entry is None or entry.move is None or key in seen:
+                break
+            seen.add(key)
+            source, target = entry.move
+            piece = self._board.get_piece(source)
+            if piece is None or piece.team != team:
+                break
+            pv.append(entry.move)
+            captured = self._board.get_piece(target)
+            if captured is not None and captured.piece_type == PieceType.KING:
+                break
+            self.make_move(piece, target)
+            undo_stack.append((piece, target, captured))
+            team = Team.BLACK if team == Team.WHITE else Team.WHITE
+        for piece, target, captured in reversed(undo_stack):
+            self.unmake_move(piece, target, captured)
+        return pv
+
+    def _store(self, key: int, entry: TranspositionEntry) -> None:
+        if len(self._transpositions) >= self.MAX_TRANSPOSITIONS and key not in self._transpositions:
+            for oldest in (self._generation - 1, self._generation):
+                self._discard_older_than(oldest)
+                if len(self._transpositions) < self.MAX_TRANSPOSITIONS:
+                    break
+            else:
+                self._transpositions.clear()
+        self._transpositions[key] = entry
+
+    def _discard_older_than(self, generation: int) -> None:
+        self._transpositions = {
+            key: entry for key, entry in self._transpositions.items() if entry.generation >= generation
+        }
+
+    def _tick(self) -> None:
+        self._nodes += 1
+        if self._node_limit is not None and self._nodes > self._node_limit:
+            raise SearchStopped()
+        if self._nodes % self.TIME_CHECK_INTERVAL:
+            return
+        if self._deadline is not None and time.perf_counter() >= self._deadline:
+            raise SearchStopped()
+        if self._should_stop is not None and self._should_stop():
+            raise SearchStopped()
+
+    @staticmethod
+    def _move_key(move: tuple[Piece, Position]) -> tuple[Position, Position]:
+        return move[0].position, move[1]
@@ -1,5 +1,19 @@
-from src.domain.board import Board
+from typing import TYPE_CHECKING
+
+from src.domain.board import Board, ReadableBoard
 from src.domain.entities import Piece, Team, Position, PieceType
+from src.domain.game_state import GameState, GameStatus
+from src.domain.encoding import (
+    decode_move,
+    decode_undo_record,
+    encode_move,
+    encode_undo_record,
+    UndoRecord,
+)
+from src.application.instrumentation import instrumentation
+
+if TYPE_CHECKING:
+    from src.infrastructure.repositories import MoveHistoryRepository
 
 
 class BoardSetupService:
@@ -11,7 +25,7 @@ class BoardSetupService:
         starting_positions = Board.starting_positions()
 
         for position, (piece_type, team) in starting_positions.items():
-            piece = __import__('src.infrastructure.factories', fromlist=['PieceFactory']).PieceFactory.create(piece_type, team, position)
+            piece = Piece(piece_type, team, position)
             self._board.add_piece(piece)
 
     def get_all_pieces(self) -> list[Piece]:
@@ -22,15 +36,18 @@ class BoardSetupService:
 
 
 class BoardQueryService:
-    def __init__(self, board: Board):
+    def __init__(self, board: ReadableBoard):
         self._board = board
 
+    @instrumentation.counted("board_query.get_piece_at")
     def get_piece_at(self, position: Position) -> Piece | None:
         return self._board.get_piece(position)
 
+    @instrumentation.counted("board_query.get_all_pieces")
     def get_all_pieces(self) -> list[Piece]:
         return self._board.get_all_pieces()
 
+    @instrumentation.counted("board_query.is_square_occupied")
     def is_square_occupied(self, position: Position) -> bool:
         return self._board.get_piece(position) is not None
 
@@ -44,10 +61,11 @@ class BoardQueryService:
 
 
 class MoveValidator:
-    def __init__(self, board: Board):
+    def __init__(self, board: ReadableBoard):
         self._board = board
         self._query_service = BoardQueryService(board)
 
+    @instrumentation.timed("move_validator.get_valid_moves")
     def get_valid_moves(self, piece: Piece) -> list[Position]:
         match piece.piece_type:
             case PieceType.PAWN:
@@ -66,6 +84,14 @@ class MoveValidator:
     def is_valid_move(self, piece: Piece, target: Position) -> bool:
         return target in self.get_valid_moves(piece)
 
+    def get_all_valid_moves(self, team: Team) -> list[tuple[Piece, Position]]:
+        return [
+            (piece, target)
+            for piece in self._board.get_pieces_by_team(team)
+            for target in self.get_valid_moves(piece)
+        ]
+
+    @instrumentation.timed("move_validator.get_valid_moves.pawn")
     def _get_pawn_moves(self, piece: Piece) -> list[Position]:
         moves = []
         direction = 1 if piece.team == Team.BLACK else -1
@@ -96,18 +122,21 @@ class MoveValidator:
         
         return moves
 
+    @instrumentation.timed("move_validator.get_valid_moves.rook")
     def _get_rook_moves(self, piece: Piece) -> list[Position]:
         moves = []
         directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
         moves.extend(self._get_sliding_moves(piece, directions))
         return moves
 
+    @instrumentation.timed("move_validator.get_valid_moves.bishop")
     def _get_bishop_moves(self, piece: Piece) -> list[Position]:
         moves = []
         directions = [(1, 1), (1, -1), (-1, 1), (-1, -1)]
         moves.extend(self._get_sliding_moves(piece, directions))
         return moves
 
+    @instrumentation.timed("move_validator.get_valid_moves.queen")
     def _get_queen_moves(self, piece: Piece) -> list[Position]:
         moves = []
         directions = [
@@ -117,6 +146,7 @@ class MoveValidator:
         moves.extend(self._get_sliding_moves(piece, directions))
         return moves
 
+    @instrumentation.timed("move_validator.get_valid_moves.knight")
     def _get_knight_moves(self, piece: Piece) -> list[Position]:
         moves = []
         offsets = [
@@ -133,6 +163,7 @@ class MoveValidator:
                     moves.append(target)
         return moves
 
+    @instrumentation.timed("move_validator.get_valid_moves.king")
     def _get_king_moves(self, piece: Piece) -> list[Position]:
         moves = []
         offsets = [(0, 1), (0, -1), (1, 0), (-1, 0), (1, 1), (1, -1), (-1, 1), (-1, -1)]
@@ -179,6 +210,7 @@ class MoveExecutor:
     def __init__(self, board: Board):
         self._board = board
 
+    @instrumentation.timed("move_executor.execute_move")
     def execute_move(self, piece: Piece, target: Position) -> Piece:
         self._board.remove_piece(piece.position)
         moved_piece = Piece(piece.piece_type, piece.team, target)
@@ -221,3 +253,104 @@ class KingCheckService:
                 return piece
         return None
 
+
+class DrawDetectionService:
+    def __init__(self, board: Board, game_state: GameState):
+        self._board = board
+        self._game_state = game_state
+
+    def is_draw(self) -> bool:
+        return (
+            self._game_state.is_threefold_repetition
+            or self._game_state.is_fifty_move_rule
+            or self.is_insufficient_material()
+        )
+
+    def is_insufficient_material(self) -> bool:
+        board = self._board
+        for piece_type in (PieceType.PAWN, PieceType.ROOK, PieceType.QUEEN):
+            if board.piece_count(piece_type):
+                return False
+
+        knights = board.piece_count(PieceType.KNIGHT)
+        bishops = board.piece_count(PieceType.BISHOP)
+        if knights + bishops <= 1:
+            return True
+        if knights:
+            return False
+        return 0 in board.bishop_square_colors()
+
+
+class UndoRedoService:
+    def __init__(self, board: Board, game_state: GameState, history: "MoveHistoryRepository"):
+        self._board = board
+        self._game_state = game_state
+        self._history = history
+
+    def record_move(
+        self,
+        source: Position,
+        moved_piece: Piece,
+        captured_piece: Piece | None,
+        promotion: PieceType | None,
+        previous_status: GameStatus,
+        turn_advanced: bool,
+    ) -> None:
+        captured = (captured_piece.piece_type, captured_piece.team) if captured_piece else None
+        record = UndoRecord(captured, previous_status, self._game_state.status, turn_advanced)
+        self._history.append(
+            encode_move(source, moved_piece.position, promotion),
+            encode_undo_record(record),
+        )
+
+    def can_undo(self) -> bool:
+        return self._history.can_undo()
+
+    def can_redo(self) -> bool:
+        return self._history.can_redo()
+
+    def undo(self) -> bool:
+        entry = self._history.step_back()
+        if entry is None:
+            return False
+
+        source, target, promotion = decode_move(entry[0])
+        record = decode_undo_record(entry[1])
+        moved_piece = self._board.get_piece(target)
+        piece_type = PieceType.PAWN if promotion else moved_piece.piece_type
+
+        self._board.remove_piece(target)
+        self._board.add_piece(Piece(piece_type, moved_piece.team, source))
+        if record.captured:
+            captured_type, captured_team = record.captured
+            self._board.add_piece(Piece(captured_type, captured_team, target))
+
+        if record.turn_advanced:
+            self._game_state.unrecord_position()
+            self._game_state.previous_turn()
+        self._game_state.restore_status(record.previous_status)
+        return True
+
+    def redo(self) -> bool:
+        entry = self._history.step_forward()
+        if entry is None:
+            return False
+
+        source, target, promotion = decode_move(entry[0])
+        record = decode_undo_record(entry[1])
+        piece = self._board.get_piece(source)
+
+        self._board.remove_piece(source)
+        self._board.add_piece(Piece(promotion or piece.piece_type, piece.team, target))
+
+        if record.turn_advanced:
+            self._game_state.next_turn()
+            irreversible = record.captured is not None or piece.piece_type == PieceType.PAWN
+            self._game_state.record_position(
+                self._board.position_key(self._game_state.current_turn), irreversible
+            )
+        self._game_state.restore_status(record.status)
+        return True
+
+    def clear(self) -> None:
+        self._history.clear()
@@ -0,0 +1,171 @@
+import os
+import random
+import time
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import partial
+from pathlib import Path
+from typing import Iterator
+
+from src.domain.board import Board
+from src.domain.entities import Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.policies import create_policy
+from src.application.search import SearchLimits
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.domain.encoding import encode_move
+from src.infrastructure.game_records import GameRecordWriter
+
+
+@dataclass(frozen=True)
+class SelfPlayConfig:
+    games: int = 100
+    white_policy: str = "random"
+    black_policy: str = "random"
+    max_plies: int = 300
+    seed: int = 0
+    workers: int = 1
+    search_depth: int = 2
+    search_nodes: int | None = None
+
+
+@dataclass
+class GameRecord:
+    index: int
+    status: GameStatus
+    moves: array
+    adjudicated: bool
+    setup_seconds: float
+    selection_seconds: float
+    execution_seconds: float
+
+
+@dataclass
+class SimulationReport:
+    games: int = 0
+    plies: int = 0
+    adjudicated: int = 0
+    elapsed_seconds: float = 0.0
+    setup_seconds: float = 0.0
+    selection_seconds: float = 0.0
+    execution_seconds: float = 0.0
+    results: Counter = field(default_factory=Counter)
+
+    @property
+    def games_per_second(self) -> float:
+        return self.games / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    @property
+    def moves_per_second(self) -> float:
+        return self.plies / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def add(self, record: GameRecord) -> None:
+        self.games += 1
+        self.plies += len(record.moves)
+        self.adjudicated += int(record.adjudicated)
+        self.setup_seconds += record.setup_seconds
+        self.selection_seconds += record.selection_seconds
+        self.execution_seconds += record.execution_seconds
+        self.results[record.status] += 1
+
+    def format(self) -> str:
+        lines = [
+            f"games: {self.games}  plies: {self.plies}  adjudicated: {self.adjudicated}",
+            f"elapsed: {self.elapsed_seconds:.2f}s  "
+            f"games/sec: {self.games_per_second:.1f}  moves/sec: {self.moves_per_second:.0f}",
+            f"phase totals: setup {self.setup_seconds:.2f}s  "
+            f"selection {self.selection_seconds:.2f}s  execution {self.execution_seconds:.2f}s",
+        ]
+        lines.extend(f"{status.value}: {count}" for status, count in sorted(
+            self.results.items(), key=lambda item: item[0].value
+        ))
+        return "\n".join(lines)
+
+
+def play_game(config: SelfPlayConfig, index: int) -> GameRecord:
+    started = time.perf_counter()
+    board = Board()
+    game_state = GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+    rng = random.Random(config.seed * 1_000_003 + index)
+    limits = SearchLimits(depth=config.search_depth, nodes=config.search_nodes)
+    policies = {
+        Team.WHITE: create_policy(config.white_policy, board, rng, limits),
+        Team.BLACK: create_policy(config.black_policy, board, rng, limits),
+    }
+    setup_seconds = time.perf_counter() - started
+
+    moves = array("H")
+    selection_seconds = 0.0
+    execution_seconds = 0.0
+    adjudicated = False
+
+    while game_state.status == GameStatus.IN_PROGRESS:
+        if len(moves) >= config.max_plies:
+            game_state.end_game(GameStatus.DRAW)
+            adjudicated = True
+            break
+
+        selection_started = time.perf_counter()
+        move = policies[game_state.current_turn].select_move(game_state.current_turn)
+        execution_started = time.perf_counter()
+        selection_seconds += execution_started - selection_started
+
+        if move is None:
+            game_state.end_game(GameStatus.DRAW)
+            adjudicated = True
+            break
+
+        piece, target = move
+        moved_piece, _ = execute_move_use_case.execute(piece, target)
+        execution_seconds += time.perf_counter() - execution_started
+        if moved_piece is None:
+            raise RuntimeError(f"Policy produced an invalid move in game {index}")
+
+        promotion = moved_piece.piece_type if moved_piece.piece_type != piece.piece_type else None
+        moves.append(encode_move(piece.position, target, promotion))
+
+    return GameRecord(
+        index=index,
+        status=game_state.status,
+        moves=moves,
+        adjudicated=adjudicated,
+        setup_seconds=setup_seconds,
+        selection_seconds=selection_seconds,
+        execution_seconds=execution_seconds,
+    )
+
+
+def iterate_games(config: SelfPlayConfig) -> Iterator[GameRecord]:
+    play = partial(play_game, config)
+    if config.workers <= 1:
+        yield from map(play, range(config.games))
+        return
+
+    chunk_size = max(1, config.games // (config.workers * 8))
+    with ProcessPoolExecutor(max_workers=config.workers) as executor:
+        yield from executor.map(play, range(config.games), chunksize=chunk_size)
+
+
+def run_self_play(config: SelfPlayConfig, output_path: str | Path | None = None) -> SimulationReport:
+    report = SimulationReport()
+    started = time.perf_counter()
+
+    if output_path is None:
+        for record in iterate_games(config):
+            report.add(record)
+    else:
+        with GameRecordWriter(output_path) as writer:
+            for record in iterate_games(config):
+                writer.write(record.index, record.status, record.moves)
+                report.add(record)
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def default_worker_count() -> int:
+    return max(1, (os.cpu_count() or 1) - 1)
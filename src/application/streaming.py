@@ -0,0 +1,169 @@
+import json
+from typing import Protocol
+
+from src.domain.board import Board
+from src.domain.entities import Piece, Team
+from src.domain.game_state import GameState, GameStatus
+from src.domain.encoding import (
+    decode_move,
+    decode_piece,
+    decode_status,
+    encode_move,
+    encode_piece,
+    encode_status,
+    EMPTY_CODE,
+    SQUARES,
+)
+
+
+class StreamSubscriber(Protocol):
+    def write(self, payload: bytes) -> None:
+        ...
+
+
+_PIECE_SYMBOLS = ".ABCDEFGHIJKL"
+
+
+def _encode_frame(frame: dict) -> bytes:
+    return json.dumps(frame, separators=(",", ":")).encode() + b"\n"
+
+
+class PositionStream:
+    DEFAULT_KEYFRAME_INTERVAL = 32
+
+    def __init__(
+        self,
+        game_id: int,
+        board: Board,
+        game_state: GameState,
+        keyframe_interval: int = DEFAULT_KEYFRAME_INTERVAL,
+    ):
+        self._game_id = game_id
+        self._board = board
+        self._game_state = game_state
+        self._keyframe_interval = keyframe_interval
+        self._sequence = 0
+        self._subscribers: dict[StreamSubscriber, None] = {}
+        self._keyframe = self._encode_keyframe()
+        self._backlog: list[bytes] = []
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
+
+    @property
+    def sequence(self) -> int:
+        return self._sequence
+
+    def subscribe(self, subscriber: StreamSubscriber) -> None:
+        subscriber.write(self._keyframe)
+        for payload in self._backlog:
+            subscriber.write(payload)
+        self._subscribers[subscriber] = None
+
+    def unsubscribe(self, subscriber: StreamSubscriber) -> None:
+        self._subscribers.pop(subscriber, None)
+
+    def publish_move(self, piece: Piece, moved_piece: Piece, status: GameStatus) -> bytes:
+        self._sequence += 1
+        promotion = moved_piece.piece_type if moved_piece.piece_type != piece.piece_type else None
+        payload = _encode_frame({
+            "type": "delta",
+            "game": self._game_id,
+            "seq": self._sequence,
+            "move": encode_move(piece.position, moved_piece.position, promotion),
+            "status": encode_status(status),
+        })
+        self._publish(payload)
+        return payload
+
+    def publish_status(self, status: GameStatus, reason: str) -> bytes:
+        self._sequence += 1
+        payload = _encode_frame({
+            "type": "status",
+            "game": self._game_id,
+            "seq": self._sequence,
+            "status": encode_status(status),
+            "reason": reason,
+        })
+        self._publish(payload)
+        return payload
+
+    def _publish(self, payload: bytes) -> None:
+        for subscriber in self._subscribers:
+            subscriber.write(payload)
+
+        self._backlog.append(payload)
+        if len(self._backlog) >= self._keyframe_interval:
+            self._keyframe = self._encode_keyframe()
+            self._backlog.clear()
+
+    def _encode_keyframe(self) -> bytes:
+        squares = [EMPTY_CODE] * 64
+        for piece in self._board.get_all_pieces():
+            squares[piece.position.index] = encode_piece(piece.piece_type, piece.team)
+        return _encode_frame({
+            "type": "keyframe",
+            "game": self._game_id,
+            "seq": self._sequence,
+            "turn": self._game_state.current_turn.value,
+            "status": encode_status(self._game_state.status),
+            "board": "".join(_PIECE_SYMBOLS[code] for code in squares),
+        })
+
+
+class SpectatorView:
+    def __init__(self):
+        self.board = Board()
+        self.sequence: int | None = None
+        self.turn = Team.WHITE
+        self.status = GameStatus.IN_PROGRESS
+
+    def apply(self, frame: dict) -> None:
+        match frame["type"]:
+            case "keyframe":
+                self._apply_keyframe(frame)
+            case "delta":
+                self._apply_delta(frame)
+            case "status":
+                if self._accepts(frame):
+                    self.sequence = frame["seq"]
+                    self.status = decode_status(frame["status"])
+            case other:
+                raise ValueError(f"Unknown frame type '{other}'")
+
+    def _apply_keyframe(self, frame: dict) -> None:
+        self.board.clear()
+        for index, symbol in enumerate(frame["board"]):
+            code = _PIECE_SYMBOLS.index(symbol)
+            if code != EMPTY_CODE:
+                piece_type, team = decode_piece(code)
+                self.board.add_piece(Piece(piece_type, team, SQUARES[index]))
+        self.sequence = frame["seq"]
+        self.turn = Team(frame["turn"])
+        self.status = decode_status(frame["status"])
+
+    def _accepts(self, frame: dict) -> bool:
+        if self.sequence is None:
+            raise ValueError(f"{frame['type'].capitalize()} received before keyframe")
+        if frame["seq"] <= self.sequence:
+            return False
+        if frame["seq"] != self.sequence + 1:
+            raise ValueError(f"Missing frames between {self.sequence} and {frame['seq']}")
+        return True
+
+    def _apply_delta(self, frame: dict) -> None:
+        if not self._accepts(frame):
+            return
+
+        source, target, promotion = decode_move(frame["move"])
+        piece = self.board.get_piece(source)
+        if piece is None:
+            raise ValueError(f"Delta moves from empty square {source.algebraic}")
+        self.board.remove_piece(source)
+        self.board.add_piece(Piece(promotion or piece.piece_type, piece.team, target))
+
+        self.sequence = frame["seq"]
+        self.status = decode_status(frame["status"])
+        if self.status == GameStatus.IN_PROGRESS or self.status == GameStatus.DRAW:
+            self.turn = Team.BLACK if piece.team == Team.WHITE else Team.WHITE
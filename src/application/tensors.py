@@ -0,0 +1,225 @@
+from pathlib import Path
+from typing import Iterable
+
+import numpy as np
+
+from src.domain.board import Board
+from src.domain.entities import PieceType, Team
+from src.application.evaluation import EvaluationWeights, square_table_index
+from src.domain.encoding import encode_piece, PIECE_TYPES, TEAMS
+from src.infrastructure.snapshots import SNAPSHOT_FILE_MAGIC, SNAPSHOT_SIZE
+
+
+PLANE_COUNT = len(PIECE_TYPES) * len(TEAMS)
+SQUARE_COUNT = 64
+
+ORTHOGONAL_DIRECTIONS = ((0, 1), (0, -1), (1, 0), (-1, 0))
+DIAGONAL_DIRECTIONS = ((1, 1), (1, -1), (-1, 1), (-1, -1))
+KING_OFFSETS = ORTHOGONAL_DIRECTIONS + DIAGONAL_DIRECTIONS
+KNIGHT_OFFSETS = ((2, 1), (2, -1), (-2, 1), (-2, -1), (1, 2), (1, -2), (-1, 2), (-1, -2))
+
+
+def plane_index(piece_type: PieceType, team: Team) -> int:
+    return encode_piece(piece_type, team) - 1
+
+
+def _landing_mask(col_step: int) -> np.uint64:
+    mask = 0
+    for square in range(SQUARE_COUNT):
+        if 0 <= square % 8 - col_step < 8:
+            mask |= 1 << square
+    return np.uint64(mask)
+
+
+_LANDING_MASKS = {col_step: _landing_mask(col_step) for col_step in range(-2, 3)}
+
+
+def shift(bitboards: np.ndarray, row_step: int, col_step: int) -> np.ndarray:
+    delta = row_step * 8 + col_step
+    if delta >= 0:
+        shifted = bitboards << np.uint64(delta)
+    else:
+        shifted = bitboards >> np.uint64(-delta)
+    return shifted & _LANDING_MASKS[col_step]
+
+
+def boards_to_planes(boards: Iterable[Board]) -> np.ndarray:
+    batch, planes, squares = [], [], []
+    count = 0
+    for index, board in enumerate(boards):
+        count = index + 1
+        for piece in board.get_all_pieces():
+            batch.append(index)
+            planes.append(plane_index(piece.piece_type, piece.team))
+            squares.append(piece.position.index)
+    tensor = np.zeros((count, PLANE_COUNT, SQUARE_COUNT), dtype=np.uint8)
+    tensor[batch, planes, squares] = 1
+    return tensor
+
+
+def snapshots_to_codes(snapshots: bytes | np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    records = np.frombuffer(snapshots, dtype=np.uint8) if isinstance(snapshots, bytes) else snapshots
+    records = records.reshape(-1, SNAPSHOT_SIZE)
+    packed = records[:, :32]
+    codes = np.empty((len(records), SQUARE_COUNT), dtype=np.uint8)
+    codes[:, 0::2] = packed & 0x0F
+    codes[:, 1::2] = packed >> 4
+    return codes, records[:, 32].copy()
+
+
+def codes_to_planes(codes: np.ndarray) -> np.ndarray:
+    return (codes[:, None, :] == np.arange(1, PLANE_COUNT + 1, dtype=np.uint8)[None, :, None]).astype(np.uint8)
+
+
+def planes_to_bitboards(planes: np.ndarray) -> np.ndarray:
+    packed = np.packbits(planes.astype(bool, copy=False), axis=-1, bitorder="little")
+    return np.ascontiguousarray(packed).view("<u8").reshape(len(planes), PLANE_COUNT).astype(np.uint64)
+
+
+def bitboards_to_planes(bitboards: np.ndarray) -> np.ndarray:
+    packed = np.ascontiguousarray(bitboards.astype("<u8")).view(np.uint8).reshape(len(bitboards), PLANE_COUNT, 8)
+    return np.unpackbits(packed, axis=-1, bitorder="little")
+
+
+def load_snapshot_batch(path: str | Path) -> tuple[np.ndarray, np.ndarray]:
+    with Path(path).open("rb") as stream:
+        if stream.read(len(SNAPSHOT_FILE_MAGIC)) != SNAPSHOT_FILE_MAGIC:
+            raise ValueError(f"{path} is not a snapshot file")
+    records = np.fromfile(path, dtype=np.uint8, offset=len(SNAPSHOT_FILE_MAGIC))
+    if len(records) % SNAPSHOT_SIZE:
+        raise ValueError(f"Truncated snapshot in {path}")
+    codes, turns = snapshots_to_codes(records)
+    return codes_to_planes(codes), turns
+
+
+def team_bitboard(bitboards: np.ndarray, team: Team) -> np.ndarray:
+    return np.bitwise_or.reduce(bitboards[:, TEAMS.index(team)::2], axis=1)
+
+
+def piece_bitboard(bitboards: np.ndarray, team: Team, *piece_types: PieceType) -> np.ndarray:
+    return np.bitwise_or.reduce(
+        bitboards[:, [plane_index(piece_type, team) for piece_type in piece_types]], axis=1
+    )
+
+
+def opponent(team: Team) -> Team:
+    return Team.BLACK if team == Team.WHITE else Team.WHITE
+
+
+class BatchEvaluationService:
+    def __init__(self, weights: EvaluationWeights | None = None, mobility_weight: int = 0):
+        self._weights = weights or EvaluationWeights()
+        self._mobility_weight = mobility_weight
+        self._square_scores = np.zeros((PLANE_COUNT, SQUARE_COUNT), dtype=np.int32)
+        for piece_type in PieceType:
+            for team in Team:
+                sign = 1 if team == Team.WHITE else -1
+                table = self._weights.piece_square_tables[piece_type]
+                self._square_scores[plane_index(piece_type, team)] = [
+                    sign * (self._weights.piece_values[piece_type] + table[square_table_index(team, index // 8, index % 8)])
+                    for index in range(SQUARE_COUNT)
+                ]
+
+    @property
+    def square_scores(self) -> np.ndarray:
+        return self._square_scores
+
+    def evaluate(self, planes: np.ndarray) -> np.ndarray:
+        scores = self.material_and_position(planes)
+        if self._mobility_weight:
+            scores += self._mobility_weight * self.mobility(planes)
+        return scores
+
+    def material_and_position(self, planes: np.ndarray) -> np.ndarray:
+        return np.einsum("npk,pk->n", planes, self._square_scores)
+
+    def mobility(self, planes: np.ndarray) -> np.ndarray:
+        bitboards = planes_to_bitboards(planes)
+        return self._team_mobility(bitboards, Team.WHITE) - self._team_mobility(bitboards, Team.BLACK)
+
+    @staticmethod
+    def _team_mobility(bitboards: np.ndarray, team: Team) -> np.ndarray:
+        own = team_bitboard(bitboards, team)
+        empty = ~(own | team_bitboard(bitboards, opponent(team)))
+        available = ~own
+        mobility = np.zeros(len(bitboards), dtype=np.int32)
+
+        sliders = (
+            (piece_bitboard(bitboards, team, PieceType.ROOK, PieceType.QUEEN), ORTHOGONAL_DIRECTIONS),
+            (piece_bitboard(bitboards, team, PieceType.BISHOP, PieceType.QUEEN), DIAGONAL_DIRECTIONS),
+        )
+        for pieces, directions in sliders:
+            for row_step, col_step in directions:
+                frontier = pieces
+                for _ in range(7):
+                    frontier = shift(frontier, row_step, col_step)
+                    mobility += np.bitwise_count(frontier & available)
+                    frontier = frontier & empty
+                    if not frontier.any():
+                        break
+
+        for piece_type, offsets in ((PieceType.KNIGHT, KNIGHT_OFFSETS), (PieceType.KING, KING_OFFSETS)):
+            pieces = piece_bitboard(bitboards, team, piece_type)
+            for row_step, col_step in offsets:
+                mobility += np.bitwise_count(shift(pieces, row_step, col_step) & available)
+        return mobility
+
+
+def _row_mask(row: int) -> np.uint64:
+    return np.uint64(0xFF << row * 8)
+
+
+def _unpack(bitboards: np.ndarray) -> np.ndarray:
+    packed = np.ascontiguousarray(bitboards.astype("<u8")).view(np.uint8).reshape(len(bitboards), 8)
+    return np.unpackbits(packed, axis=1, bitorder="little")
+
+
+def _scatter_moves(masks: np.ndarray, rows: np.ndarray, targets: np.ndarray, delta: int) -> None:
+    batch, target_squares = np.nonzero(_unpack(targets))
+    masks[rows[batch], target_squares - delta, target_squares] = True
+
+
+def move_masks(planes: np.ndarray, turns: np.ndarray) -> np.ndarray:
+    bitboards = planes_to_bitboards(planes)
+    masks = np.zeros((len(planes), SQUARE_COUNT, SQUARE_COUNT), dtype=bool)
+    for team_index, team in enumerate(TEAMS):
+        rows = np.flatnonzero(turns == team_index)
+        if len(rows):
+            _team_move_masks(masks, rows, bitboards[rows], team)
+    return masks
+
+
+def _team_move_masks(masks: np.ndarray, rows: np.ndarray, bitboards: np.ndarray, team: Team) -> None:
+    own = team_bitboard(bitboards, team)
+    enemy = team_bitboard(bitboards, opponent(team))
+    empty = ~(own | enemy)
+    available = ~own
+
+    sliders = (
+        (piece_bitboard(bitboards, team, PieceType.ROOK, PieceType.QUEEN), ORTHOGONAL_DIRECTIONS),
+        (piece_bitboard(bitboards, team, PieceType.BISHOP, PieceType.QUEEN), DIAGONAL_DIRECTIONS),
+    )
+    for pieces, directions in sliders:
+        for row_step, col_step in directions:
+            frontier = pieces
+            for distance in range(1, 8):
+                frontier = shift(frontier, row_step, col_step)
+                _scatter_moves(masks, rows, frontier & available, distance * (row_step * 8 + col_step))
+                frontier = frontier & empty
+                if not frontier.any():
+                    break
+
+    for piece_type, offsets in ((PieceType.KNIGHT, KNIGHT_OFFSETS), (PieceType.KING, KING_OFFSETS)):
+        pieces = piece_bitboard(bitboards, team, piece_type)
+        for row_step, col_step in offsets:
+            _scatter_moves(masks, rows, shift(pieces, row_step, col_step) & available, row_step * 8 + col_step)
+
+    pawns = piece_bitboard(bitboards, team, PieceType.PAWN)
+    direction = -1 if team == Team.WHITE else 1
+    starting_row = 6 if team == Team.WHITE else 1
+    single = shift(pawns, direction, 0) & empty
+    _scatter_moves(masks, rows, single, direction * 8)
+    double = shift(single & _row_mask(starting_row + direction), direction, 0) & empty
+    _scatter_moves(masks, rows, double, direction * 16)
+    for col_step in (-1, 1):
+        _scatter_moves(masks, rows, shift(pawns, direction, col_step) & enemy, direction * 8 + col_step)
@@ -0,0 +1,206 @@
+import heapq
+import re
+import time
+from dataclasses import dataclass
+from enum import Enum
+from typing import Callable, Hashable
+
+from src.domain.entities import Team
+from src.domain.game_state import GameState, GameStatus
+
+NANOSECONDS = 1_000_000_000
+TIME_CONTROL_PATTERN = re.compile(r"^\s*(\d+(?:\.\d+)?)\s*([+d])\s*(\d+(?:\.\d+)?)\s*$")
+
+
+class ClockMode(Enum):
+    INCREMENT = "increment"
+    DELAY = "delay"
+
+
+@dataclass(frozen=True)
+class TimeControl:
+    initial: float
+    bonus: float = 0.0
+    mode: ClockMode = ClockMode.INCREMENT
+
+    @classmethod
+    def parse(cls, text: str) -> "TimeControl":
+        match = TIME_CONTROL_PATTERN.match(text)
+        if match is None:
+            raise ValueError(f"Time control '{text}' must look like '5+3' or '5d2' (minutes, then bonus seconds)")
+        minutes, separator, bonus = match.groups()
+        mode = ClockMode.INCREMENT if separator == "+" else ClockMode.DELAY
+        return cls(float(minutes) * 60, float(bonus), mode)
+
+    @property
+    def initial_ns(self) -> int:
+        return round(self.initial * NANOSECONDS)
+
+    @property
+    def bonus_ns(self) -> int:
+        return round(self.bonus * NANOSECONDS)
+
+    def format(self) -> str:
+        separator = "+" if self.mode == ClockMode.INCREMENT else "d"
+        return f"{self.initial / 60:g}{separator}{self.bonus:g}"
+
+
+class TimerService:
+    def __init__(
+        self,
+        game_state: GameState,
+        time_control: TimeControl,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ):
+        self._game_state = game_state
+        self._time_control = time_control
+        self._clock = clock
+        self._remaining: dict[Team, int] = {}
+        self._running: Team | None = None
+        self._started_at = 0
+        self._flagged: Team | None = None
+        self.reset()
+
+    @property
+    def time_control(self) -> TimeControl:
+        return self._time_control
+
+    @property
+    def running_team(self) -> Team | None:
+        return self._running
+
+    @property
+    def flagged(self) -> Team | None:
+        return self._flagged
+
+    def now(self) -> int:
+        return self._clock()
+
+    def reset(self) -> None:
+        self._remaining = {team: self._time_control.initial_ns for team in (Team.WHITE, Team.BLACK)}
+        self._running = None
+        self._flagged = None
+
+    def restore(self, remaining: dict[Team, int], running: bool, now: int | None = None) -> None:
+        self.reset()
+        self._remaining.update(remaining)
+        if running:
+            self.start(now)
+
+    def start(self, now: int | None = None) -> None:
+        if self._flagged is not None or self._game_state.status != GameStatus.IN_PROGRESS:
+            return
+        self._running = self._game_state.current_turn
+        self._started_at = self._clock() if now is None else now
+
+    def stop(self, now: int | None = None) -> None:
+        if self._running is None:
+            return
+        self._charge(self._clock() if now is None else now)
+        self._running = None
+
+    def remaining(self, team: Team, now: int | None = None) -> int:
+        if team != self._running:
+            return self._remaining[team]
+        return max(0, self._remaining[team] - self._spent(self._clock() if now is None else now))
+
+    def deadline(self) -> int | None:
+        if self._running is None:
+            return None
+        delay = self._time_control.bonus_ns if self._time_control.mode == ClockMode.DELAY else 0
+        return self._started_at + delay + self._remaining[self._running]
+
+    def check(self, now: int | None = None) -> bool:
+        if self._running is None:
+            return False
+        now = self._clock() if now is None else now
+        if now < self.deadline():
+            return False
+        flagged = self._running
+        self._remaining[flagged] = 0
+        self._running = None
+        self._flagged = flagged
+        if self._game_state.status == GameStatus.IN_PROGRESS:
+            self._game_state.set_winner(Team.BLACK if flagged == Team.WHITE else Team.WHITE)
+        return True
+
+    def press(self, now: int | None = None) -> None:
+        if self._running is None:
+            self.start(now)
+        else:
+            self.on_move(now)
+
+    def on_move(self, now: int | None = None) -> None:
+        if self._running is None:
+            return
+        now = self._clock() if now is None else now
+        mover = self._running
+        self._charge(now)
+        if self._time_control.mode == ClockMode.INCREMENT:
+            self._remaining[mover] += self._time_control.bonus_ns
+        self._switch(now)
+
+    def sync(self, now: int | None = None) -> None:
+        if self._running is None:
+            return
+        now = self._clock() if now is None else now
+        self._charge(now)
+        self._switch(now)
+
+    def _switch(self, now: int) -> None:
+        self._running = None
+        self.start(now)
+
+    def _spent(self, now: int) -> int:
+        elapsed = now - self._started_at
+        if self._time_control.mode == ClockMode.DELAY:
+            elapsed -= self._time_control.bonus_ns
+        return max(0, elapsed)
+
+    def _charge(self, now: int) -> None:
+        self._remaining[self._running] = max(0, self._remaining[self._running] - self._spent(now))
+
+
+class ClockScheduler:
+    def __init__(self):
+        self._heap: list[tuple[int, int, Hashable]] = []
+        self._deadlines: dict[Hashable, tuple[int, int]] = {}
+        self._sequence = 0
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, key: Hashable, deadline: int | None) -> bool:
+        if deadline is None:
+            self.cancel(key)
+            return False
+        earliest = self.next_deadline()
+        self._sequence += 1
+        self._deadlines[key] = (deadline, self._sequence)
+        heapq.heappush(self._heap, (deadline, self._sequence, key))
+        if len(self._heap) > 2 * len(self._deadlines) + 64:
+            self._heap = [(entry[0], entry[1], entry_key) for entry_key, entry in self._deadlines.items()]
+            heapq.heapify(self._heap)
+        return earliest is None or deadline < earliest
+
+    def cancel(self, key: Hashable) -> None:
+        self._deadlines.pop(key, None)
+
+    def next_deadline(self) -> int | None:
+        self._discard_stale()
+        return self._heap[0][0] if self._heap else None
+
+    def pop_expired(self, now: int) -> list[Hashable]:
+        expired = []
+        while self.next_deadline() is not None and self._heap[0][0] <= now:
+            _, _, key = heapq.heappop(self._heap)
+            del self._deadlines[key]
+            expired.append(key)
+        return expired
+
+    def _discard_stale(self) -> None:
+        while self._heap:
+            deadline, sequence, key = self._heap[0]
+            if self._deadlines.get(key) == (deadline, sequence):
+                return
+            heapq.heappop(self._heap)
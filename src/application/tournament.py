@@ -0,0 +1,326 @@
+import math
+import random
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Callable
+
+from src.domain.board import Board
+from src.domain.entities import Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.evaluation import BoardEvaluationService, load_weights
+from src.application.search import MiniMaxService, SearchLimits
+from src.application.services import MoveValidator
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.domain.encoding import decode_move, encode_move
+
+
+@dataclass(frozen=True)
+class EngineConfig:
+    name: str
+    depth: int | None = None
+    nodes: int | None = None
+    movetime: float | None = None
+    weights_path: str | None = None
+
+    @property
+    def limits(self) -> SearchLimits:
+        depth = self.depth
+        if depth is None:
+            depth = 3 if self.nodes is None and self.movetime is None else 64
+        return SearchLimits(depth=depth, nodes=self.nodes, movetime=self.movetime)
+
+    def create_search_service(self, board: Board) -> MiniMaxService:
+        weights = load_weights(self.weights_path) if self.weights_path else None
+        return MiniMaxService(board, BoardEvaluationService(weights))
+
+    @staticmethod
+    def parse(name: str, spec: str) -> "EngineConfig":
+        options = {}
+        for item in filter(None, spec.split(",")):
+            key, separator, value = item.partition("=")
+            if not separator:
+                raise ValueError(f"Engine option '{item}' must be key=value")
+            options[key.strip()] = value.strip()
+
+        unknown = set(options) - {"depth", "nodes", "movetime", "weights"}
+        if unknown:
+            raise ValueError(f"Unknown engine options: {', '.join(sorted(unknown))}")
+
+        return EngineConfig(
+            name=name,
+            depth=int(options["depth"]) if "depth" in options else None,
+            nodes=int(options["nodes"]) if "nodes" in options else None,
+            movetime=float(options["movetime"]) if "movetime" in options else None,
+            weights_path=options.get("weights"),
+        )
+
+
+@dataclass(frozen=True)
+class MatchConfig:
+    engine_a: EngineConfig
+    engine_b: EngineConfig
+    max_games: int = 1000
+    opening_plies: int = 6
+    max_plies: int = 300
+    workers: int = 1
+    seed: int = 0
+    elo0: float = 0.0
+    elo1: float = 10.0
+    alpha: float = 0.05
+    beta: float = 0.05
+
+
+class SPRTDecision(Enum):
+    CONTINUE = "continue"
+    ACCEPT_H0 = "accept_h0"
+    ACCEPT_H1 = "accept_h1"
+
+
+def expected_score(elo: float) -> float:
+    return 1.0 / (1.0 + 10.0 ** (-elo / 400.0))
+
+
+def elo_from_score(score: float) -> float:
+    score = min(max(score, 1e-6), 1.0 - 1e-6)
+    return -400.0 * math.log10(1.0 / score - 1.0)
+
+
+def score_and_variance(wins: float, draws: float, losses: float) -> tuple[float, float]:
+    games = wins + draws + losses
+    if not games:
+        return 0.5, 0.0
+    mean = (wins + 0.5 * draws) / games
+    variance = (
+        wins * (1.0 - mean) ** 2 + draws * (0.5 - mean) ** 2 + losses * mean ** 2
+    ) / games
+    return mean, variance
+
+
+@dataclass
+class MatchStatistics:
+    wins: int = 0
+    draws: int = 0
+    losses: int = 0
+
+    @property
+    def games(self) -> int:
+        return self.wins + self.draws + self.losses
+
+    @property
+    def score(self) -> float:
+        return score_and_variance(self.wins, self.draws, self.losses)[0]
+
+    @property
+    def variance(self) -> float:
+        return score_and_variance(self.wins, self.draws, self.losses)[1]
+
+    def add(self, score: float) -> None:
+        if score == 1.0:
+            self.wins += 1
+        elif score == 0.0:
+            self.losses += 1
+        else:
+            self.draws += 1
+
+    def elo(self) -> float:
+        return elo_from_score(self.score)
+
+    def elo_error_margin(self, z: float = 1.96) -> float:
+        if self.games < 2:
+            return math.inf
+        margin = z * math.sqrt(self.variance / self.games)
+        upper = elo_from_score(self.score + margin)
+        lower = elo_from_score(self.score - margin)
+        return (upper - lower) / 2.0
+
+
+@dataclass
+class SequentialProbabilityRatioTest:
+    elo0: float
+    elo1: float
+    alpha: float = 0.05
+    beta: float = 0.05
+    PSEUDO_COUNT = 0.5
+
+    @property
+    def lower_bound(self) -> float:
+        return math.log(self.beta / (1.0 - self.alpha))
+
+    @property
+    def upper_bound(self) -> float:
+        return math.log((1.0 - self.beta) / self.alpha)
+
+    def log_likelihood_ratio(self, statistics: MatchStatistics) -> float:
+        if statistics.games == 0:
+            return 0.0
+        score, variance = score_and_variance(
+            statistics.wins + self.PSEUDO_COUNT,
+            statistics.draws + self.PSEUDO_COUNT,
+            statistics.losses + self.PSEUDO_COUNT,
+        )
+        score0 = expected_score(self.elo0)
+        score1 = expected_score(self.elo1)
+        return (
+            statistics.games * (score1 - score0) * (2.0 * score - score0 - score1) / (2.0 * variance)
+        )
+
+    def decide(self, statistics: MatchStatistics) -> SPRTDecision:
+        llr = self.log_likelihood_ratio(statistics)
+        if llr >= self.upper_bound:
+            return SPRTDecision.ACCEPT_H1
+        if llr <= self.lower_bound:
+            return SPRTDecision.ACCEPT_H0
+        return SPRTDecision.CONTINUE
+
+
+@dataclass
+class MatchReport:
+    statistics: MatchStatistics = field(default_factory=MatchStatistics)
+    llr: float = 0.0
+    decision: SPRTDecision = SPRTDecision.CONTINUE
+    elapsed_seconds: float = 0.0
+
+    def format(self, config: MatchConfig) -> str:
+        stats = self.statistics
+        return "\n".join([
+            f"{config.engine_a.name} vs {config.engine_b.name}: "
+            f"+{stats.wins} ={stats.draws} -{stats.losses} ({stats.games} games)",
+            f"elo: {stats.elo():+.1f} +/- {stats.elo_error_margin():.1f}",
+            f"sprt [{config.elo0}, {config.elo1}]: llr {self.llr:.2f} "
+            f"({self.decision.value})",
+            f"elapsed: {self.elapsed_seconds:.1f}s",
+        ])
+
+
+def generate_opening(seed: int, plies: int) -> tuple[int, ...]:
+    rng = random.Random(seed)
+    board = Board()
+    game_state = GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    validator = MoveValidator(board)
+    execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+
+    moves = []
+    for _ in range(plies):
+        candidates = validator.get_all_valid_moves(game_state.current_turn)
+        if not candidates or game_state.status != GameStatus.IN_PROGRESS:
+            break
+        piece, target = rng.choice(candidates)
+        moved_piece, status = execute_move_use_case.execute(piece, target)
+        moves.append(encode_move(piece.position, target))
+        if status != GameStatus.IN_PROGRESS:
+            moves.pop()
+            break
+    return tuple(moves)
+
+
+def play_match_game(
+    engine_a: EngineConfig,
+    engine_b: EngineConfig,
+    opening: tuple[int, ...],
+    engine_a_plays_white: bool,
+    max_plies: int,
+) -> float:
+    board = Board()
+    game_state = GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+
+    for move in opening:
+        source, target, _ = decode_move(move)
+        execute_move_use_case.execute(board.get_piece(source), target)
+
+    white, black = (engine_a, engine_b) if engine_a_plays_white else (engine_b, engine_a)
+    engines = {
+        Team.WHITE: (white.create_search_service(board), white.limits),
+        Team.BLACK: (black.create_search_service(board), black.limits),
+    }
+
+    plies = len(opening)
+    while game_state.status == GameStatus.IN_PROGRESS and plies < max_plies:
+        search_service, limits = engines[game_state.current_turn]
+        result = search_service.search(game_state.current_turn, limits)
+        if result.move is None:
+            break
+        source, target = result.move
+        execute_move_use_case.execute(board.get_piece(source), target)
+        plies += 1
+
+    a_team = Team.WHITE if engine_a_plays_white else Team.BLACK
+    if game_state.status == GameStatus.WHITE_WON:
+        return 1.0 if a_team == Team.WHITE else 0.0
+    if game_state.status == GameStatus.BLACK_WON:
+        return 1.0 if a_team == Team.BLACK else 0.0
+    return 0.5
+
+
+def _play_pair(config: MatchConfig, pair_index: int) -> tuple[float, ...]:
+    opening = generate_opening(config.seed * 1_000_003 + pair_index, config.opening_plies)
+    colours = (True, False)[:config.max_games - 2 * pair_index]
+    return tuple(
+        play_match_game(config.engine_a, config.engine_b, opening, engine_a_plays_white, config.max_plies)
+        for engine_a_plays_white in colours
+    )
+
+
+class TournamentRunner:
+    def __init__(self, config: MatchConfig):
+        self._config = config
+        self._sprt = SequentialProbabilityRatioTest(
+            config.elo0, config.elo1, config.alpha, config.beta
+        )
+
+    def run(self, on_progress: Callable[[MatchReport], None] | None = None) -> MatchReport:
+        report = MatchReport()
+        started = time.perf_counter()
+        pair_count = (self._config.max_games + 1) // 2
+
+        if self._config.workers <= 1:
+            for pair_index in range(pair_count):
+                if self._record(report, _play_pair(self._config, pair_index), on_progress):
+                    break
+        else:
+            self._run_parallel(report, pair_count, on_progress)
+
+        report.elapsed_seconds = time.perf_counter() - started
+        return report
+
+    def _run_parallel(
+        self,
+        report: MatchReport,
+        pair_count: int,
+        on_progress: Callable[[MatchReport], None] | None,
+    ) -> None:
+        executor = ProcessPoolExecutor(max_workers=self._config.workers)
+        stopped = False
+        try:
+            next_pair = 0
+            pending: set[Future] = set()
+            while next_pair < pair_count or pending:
+                while next_pair < pair_count and len(pending) < self._config.workers * 2:
+                    pending.add(executor.submit(_play_pair, self._config, next_pair))
+                    next_pair += 1
+
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    if self._record(report, future.result(), on_progress):
+                        stopped = True
+                        return
+        finally:
+            executor.shutdown(wait=not stopped, cancel_futures=True)
+
+    def _record(
+        self,
+        report: MatchReport,
+        pair_scores: tuple[float, ...],
+        on_progress: Callable[[MatchReport], None] | None,
+    ) -> bool:
+        for score in pair_scores:
+            report.statistics.add(score)
+        report.llr = self._sprt.log_likelihood_ratio(report.statistics)
+        report.decision = self._sprt.decide(report.statistics)
+        if on_progress is not None:
+            on_progress(report)
+        return report.decision != SPRTDecision.CONTINUE
@@ -0,0 +1,240 @@
+import math
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+import numpy as np
+
+from src.domain.entities import PieceType
+from src.application.datasets import TrainingDataset
+from src.application.evaluation import EvaluationWeights
+from src.application.tensors import bitboards_to_planes, SQUARE_COUNT
+from src.domain.encoding import PIECE_TYPES
+
+
+PIECE_TYPE_COUNT = len(PIECE_TYPES)
+PARAMETER_COUNT = PIECE_TYPE_COUNT + PIECE_TYPE_COUNT * SQUARE_COUNT
+FROZEN_VALUES = (PieceType.KING,)
+
+_ADAM_BETAS = (0.9, 0.999)
+_ADAM_EPSILON = 1e-8
+
+_worker_dataset: TrainingDataset | None = None
+
+
+@dataclass(frozen=True)
+class TuningConfig:
+    epochs: int = 200
+    learning_rate: float = 1.0
+    scaling: float = 400.0
+    chunk_size: int = 16384
+    workers: int = 1
+    checkpoint_every: int = 10
+
+
+@dataclass
+class TuningReport:
+    positions: int = 0
+    epochs: int = 0
+    resumed_from: int = 0
+    losses: list[float] = field(default_factory=list)
+    elapsed: float = 0.0
+
+    def format(self) -> str:
+        first = f"{self.losses[0]:.6f}" if self.losses else "-"
+        last = f"{self.losses[-1]:.6f}" if self.losses else "-"
+        rate = self.positions * (self.epochs - self.resumed_from) / self.elapsed if self.elapsed else 0.0
+        return (
+            f"positions: {self.positions}  epochs: {self.epochs} (resumed at {self.resumed_from})  "
+            f"loss: {first} -> {last}  elapsed: {self.elapsed:.2f}s  ({rate:.0f} positions/s)"
+        )
+
+
+def weights_to_parameters(weights: EvaluationWeights) -> np.ndarray:
+    values = [weights.piece_values[piece_type] for piece_type in PIECE_TYPES]
+    tables = [weights.piece_square_tables[piece_type] for piece_type in PIECE_TYPES]
+    return np.concatenate([np.array(values, dtype=np.float64), np.array(tables, dtype=np.float64).ravel()])
+
+
+def parameters_to_weights(parameters: np.ndarray) -> EvaluationWeights:
+    values, tables = _split(np.rint(parameters).astype(int))
+    return EvaluationWeights(
+        piece_values={piece_type: int(values[index]) for index, piece_type in enumerate(PIECE_TYPES)},
+        piece_square_tables={
+            piece_type: tuple(int(value) for value in tables[index]) for index, piece_type in enumerate(PIECE_TYPES)
+        },
+    )
+
+
+def _split(parameters: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    return parameters[:PIECE_TYPE_COUNT], parameters[PIECE_TYPE_COUNT:].reshape(PIECE_TYPE_COUNT, SQUARE_COUNT)
+
+
+def score_table(parameters: np.ndarray) -> np.ndarray:
+    values, tables = _split(parameters)
+    return values[:, None] + tables
+
+
+def position_features(bitboards: np.ndarray) -> np.ndarray:
+    oriented = np.concatenate([bitboards[:, 0::2], bitboards[:, 1::2].byteswap()], axis=1)
+    planes = bitboards_to_planes(oriented).view(np.int8)
+    return np.subtract(planes[:, :PIECE_TYPE_COUNT], planes[:, PIECE_TYPE_COUNT:], dtype=np.float32).reshape(
+        len(bitboards), -1
+    )
+
+
+def result_targets(results: np.ndarray) -> np.ndarray:
+    return (results.astype(np.float32) + 1) / 2
+
+
+def chunk_loss_and_gradient(
+    features: np.ndarray, targets: np.ndarray, table: np.ndarray, scaling: float
+) -> tuple[float, np.ndarray]:
+    slope = math.log(10) / scaling
+    logits = features @ table.ravel().astype(np.float32) * slope
+    losses = np.logaddexp(0, logits) - targets * logits
+    residuals = (0.5 * (1 + np.tanh(logits / 2)) - targets) * slope
+    gradient = residuals @ features
+    return float(losses.sum(dtype=np.float64)), gradient.astype(np.float64).reshape(PIECE_TYPE_COUNT, SQUARE_COUNT)
+
+
+def _initialize_worker(directory: str) -> None:
+    global _worker_dataset
+    _worker_dataset = TrainingDataset(directory)
+
+
+def _chunk_task(position: int, start: int, stop: int, table: np.ndarray, scaling: float) -> tuple[float, np.ndarray]:
+    arrays = _worker_dataset.shard(position)
+    features = position_features(np.asarray(arrays["bitboards"][start:stop]))
+    return chunk_loss_and_gradient(features, result_targets(np.asarray(arrays["results"][start:stop])), table, scaling)
+
+
+class TexelTuner:
+    def __init__(
+        self,
+        directory: str | Path,
+        config: TuningConfig | None = None,
+        weights: EvaluationWeights | None = None,
+    ):
+        self._directory = str(directory)
+        self._config = config or TuningConfig()
+        self._dataset = TrainingDataset(directory)
+        self._parameters = weights_to_parameters(weights or EvaluationWeights())
+        self._first_moment = np.zeros(PARAMETER_COUNT)
+        self._second_moment = np.zeros(PARAMETER_COUNT)
+        self._epoch = 0
+        self._losses: list[float] = []
+        self._frozen = np.zeros(PARAMETER_COUNT, dtype=bool)
+        for piece_type in FROZEN_VALUES:
+            self._frozen[PIECE_TYPES.index(piece_type)] = True
+        self._tasks = [
+            (position, start, min(shard["samples"], start + self._config.chunk_size))
+            for position, shard in enumerate(self._dataset.manifest["shards"])
+            for start in range(0, shard["samples"], self._config.chunk_size)
+        ]
+
+    @property
+    def weights(self) -> EvaluationWeights:
+        return parameters_to_weights(self._parameters)
+
+    @property
+    def parameters(self) -> np.ndarray:
+        return self._parameters.copy()
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    @property
+    def losses(self) -> list[float]:
+        return list(self._losses)
+
+    def loss_and_gradient(self, executor: ProcessPoolExecutor | None = None) -> tuple[float, np.ndarray]:
+        table = score_table(self._parameters)
+        if executor is None:
+            if _worker_dataset is None or _worker_dataset.directory != self._dataset.directory:
+                _initialize_worker(self._directory)
+            results = [_chunk_task(*task, table, self._config.scaling) for task in self._tasks]
+        else:
+            futures = [executor.submit(_chunk_task, *task, table, self._config.scaling) for task in self._tasks]
+            results = [future.result() for future in futures]
+
+        count = max(1, len(self._dataset))
+        loss = sum(chunk_loss for chunk_loss, _ in results) / count
+        table_gradient = sum((gradient for _, gradient in results), np.zeros((PIECE_TYPE_COUNT, SQUARE_COUNT)))
+        gradient = np.concatenate([table_gradient.sum(axis=1), table_gradient.ravel()]) / count
+        gradient[self._frozen] = 0
+        return loss, gradient
+
+    def step(self, gradient: np.ndarray) -> None:
+        beta1, beta2 = _ADAM_BETAS
+        self._epoch += 1
+        self._first_moment = beta1 * self._first_moment + (1 - beta1) * gradient
+        self._second_moment = beta2 * self._second_moment + (1 - beta2) * gradient ** 2
+        corrected_first = self._first_moment / (1 - beta1 ** self._epoch)
+        corrected_second = self._second_moment / (1 - beta2 ** self._epoch)
+        self._parameters -= self._config.learning_rate * corrected_first / (np.sqrt(corrected_second) + _ADAM_EPSILON)
+
+    def tune(
+        self,
+        checkpoint_path: str | Path | None = None,
+        on_epoch: Callable[[int, float], None] | None = None,
+    ) -> TuningReport:
+        if checkpoint_path is not None and Path(checkpoint_path).exists():
+            self.load_checkpoint(checkpoint_path)
+        report = TuningReport(positions=len(self._dataset), resumed_from=self._epoch)
+        started = time.perf_counter()
+
+        executor = None
+        if self._config.workers > 1:
+            executor = ProcessPoolExecutor(
+                max_workers=self._config.workers,
+                initializer=_initialize_worker,
+                initargs=(self._directory,),
+            )
+        try:
+            while self._epoch < self._config.epochs:
+                loss, gradient = self.loss_and_gradient(executor)
+                self._losses.append(loss)
+                self.step(gradient)
+                if on_epoch is not None:
+                    on_epoch(self._epoch, loss)
+                if checkpoint_path is not None and (
+                    self._epoch % self._config.checkpoint_every == 0 or self._epoch == self._config.epochs
+                ):
+                    self.save_checkpoint(checkpoint_path)
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        report.epochs = self._epoch
+        report.losses = self.losses
+        report.elapsed = time.perf_counter() - started
+        return report
+
+    def save_checkpoint(self, path: str | Path) -> None:
+        path = Path(path)
+        temporary = path.with_name(path.name + ".tmp")
+        with temporary.open("wb") as stream:
+            np.savez(
+                stream,
+                epoch=self._epoch,
+                parameters=self._parameters,
+                first_moment=self._first_moment,
+                second_moment=self._second_moment,
+                losses=np.array(self._losses, dtype=np.float64),
+            )
+        os.replace(temporary, path)
+
+    def load_checkpoint(self, path: str | Path) -> None:
+        with np.load(path) as checkpoint:
+            if checkpoint["parameters"].shape != (PARAMETER_COUNT,):
+                raise ValueError(f"{path} is not a tuning checkpoint")
+            self._epoch = int(checkpoint["epoch"])
+            self._parameters = checkpoint["parameters"].copy()
+            self._first_moment = checkpoint["first_moment"].copy()
+            self._second_moment = checkpoint["second_moment"].copy()
+            self._losses = checkpoint["losses"].tolist()
@@ -1,3 +1,5 @@
+from typing import Callable, TYPE_CHECKING
+
 from src.domain.board import Board
 from src.domain.entities import Position, Piece, PieceType, Team
 from src.domain.game_state import GameState, GameStatus
@@ -8,18 +10,28 @@ from src.application.services import (
     MoveExecutor,
     PawnPromotionService,
     KingCheckService,
+    DrawDetectionService,
+    UndoRedoService,
 )
-from src.application.rendering import SVGPieceRenderer
+from src.application.evaluation import BoardEvaluationService
+from src.application.search import AnalysisResult, MiniMaxService, SearchLimits
+from src.application.instrumentation import instrumentation
+from src.infrastructure.repositories import BoardRepository
+
+if TYPE_CHECKING:
+    from src.application.rendering import SVGPieceRenderer
 
 
 class InitializeGameUseCase:
     def __init__(self, board: Board, game_state: GameState):
+        self._board = board
         self._setup_service = BoardSetupService(board)
         self._game_state = game_state
 
     def execute(self) -> None:
         self._setup_service.initialize_standard_game()
         self._game_state.reset()
+        self._game_state.record_position(self._board.position_key(self._game_state.current_turn))
 
 
 class GetBoardStateUseCase:
@@ -33,9 +45,13 @@ class GetBoardStateUseCase:
 class RenderBoardUseCase:
     def __init__(self, board: Board):
         self._query_service = BoardQueryService(board)
-        self._piece_renderer = SVGPieceRenderer()
+        self._piece_renderer = None
 
-    def get_renderer(self) -> SVGPieceRenderer:
+    def get_renderer(self) -> "SVGPieceRenderer":
+        if self._piece_renderer is None:
+            from src.application.rendering import SVGPieceRenderer
+
+            self._piece_renderer = SVGPieceRenderer()
         return self._piece_renderer
 
     def get_pieces_to_render(self):
@@ -51,15 +67,23 @@ class GetValidMovesUseCase:
 
 
 class ExecuteMoveUseCase:
-    def __init__(self, board: Board, game_state: GameState):
+    def __init__(
+        self,
+        board: Board,
+        game_state: GameState,
+        undo_redo_service: UndoRedoService | None = None,
+    ):
         self._board = board
         self._validator = MoveValidator(board)
         self._executor = MoveExecutor(board)
         self._query_service = BoardQueryService(board)
         self._promotion_service = PawnPromotionService()
         self._king_check_service = KingCheckService(board)
+        self._draw_detection_service = DrawDetectionService(board, game_state)
         self._game_state = game_state
+        self._undo_redo_service = undo_redo_service
 
+    @instrumentation.timed("execute_move_use_case.execute")
     def execute(self, piece: Piece, target: Position) -> tuple[Piece | None, GameStatus]:
         if piece.team != self._game_state.current_turn:
             return None, self._game_state.status
@@ -67,18 +91,108 @@ class ExecuteMoveUseCase:
         if not self._validator.is_valid_move(piece, target):
             return None, self._game_state.status
         
+        captured_piece = self._query_service.get_piece_at(target)
+        previous_status = self._game_state.status
+        if not self._game_state.has_position_history:
+            self._game_state.record_position(self._board.position_key(self._game_state.current_turn))
+
         if self._king_check_service.did_capture_king(piece, target):
             moved_piece = self._executor.execute_move(piece, target)
             self._game_state.set_winner(piece.team)
+            self._record_move(piece, moved_piece, captured_piece, None, previous_status, False)
             return moved_piece, self._game_state.status
         
         moved_piece = self._executor.execute_move(piece, target)
+        promotion = None
         
         if self._promotion_service.should_promote(moved_piece):
             promoted_piece = self._promotion_service.promote(moved_piece, PieceType.QUEEN)
             self._board.remove_piece(moved_piece.position)
             self._board.add_piece(promoted_piece)
             moved_piece = promoted_piece
+            promotion = PieceType.QUEEN
         
         self._game_state.next_turn()
+        irreversible = captured_piece is not None or piece.piece_type == PieceType.PAWN
+        self._game_state.record_position(
+            self._board.position_key(self._game_state.current_turn), irreversible
+        )
+        if self._draw_detection_service.is_draw():
+            self._game_state.end_game(GameStatus.DRAW)
+        self._record_move(piece, moved_piece, captured_piece, promotion, previous_status, True)
         return moved_piece, self._game_state.status
+
+    def _record_move(
+        self,
+        piece: Piece,
+        moved_piece: Piece,
+        captured_piece: Piece | None,
+        promotion: PieceType | None,
+        previous_status: GameStatus,
+        turn_advanced: bool,
+    ) -> None:
+        if self._undo_redo_service is None:
+            return
+        self._undo_redo_service.record_move(
+            piece.position, moved_piece, captured_piece, promotion, previous_status, turn_advanced
+        )
+
+
+class ReplayMoveUseCase:
+    def __init__(self, board: Board, game_state: GameState):
+        self._board = board
+        self._executor = MoveExecutor(board)
+        self._promotion_service = PawnPromotionService()
+        self._draw_detection_service = DrawDetectionService(board, game_state)
+        self._game_state = game_state
+
+    def execute(self, source: Position, target: Position, promotion: PieceType | None = None) -> Piece | None:
+        piece = self._board.get_piece(source)
+        if piece is None or piece.team != self._game_state.current_turn:
+            return None
+        if self._game_state.status != GameStatus.IN_PROGRESS:
+            return None
+        captured_piece = self._board.get_piece(target)
+        moved_piece = self._executor.execute_move(piece, target)
+        if captured_piece is not None and captured_piece.piece_type == PieceType.KING:
+            self._game_state.set_winner(piece.team)
+            return moved_piece
+
+        if promotion is not None:
+            moved_piece = self._promotion_service.promote(moved_piece, promotion)
+            self._board.remove_piece(target)
+            self._board.add_piece(moved_piece)
+        self._game_state.next_turn()
+        irreversible = captured_piece is not None or piece.piece_type == PieceType.PAWN
+        self._game_state.record_position(
+            self._board.position_key(self._game_state.current_turn), irreversible
+        )
+        if self._draw_detection_service.is_draw():
+            self._game_state.end_game(GameStatus.DRAW)
+        return moved_piece
+
+
+class AnalyzePositionUseCase:
+    def __init__(self, evaluation_service: BoardEvaluationService | None = None):
+        self._board = Board()
+        self._game_state = GameState()
+        self._repository = BoardRepository(self._board)
+        self._search_service = MiniMaxService(self._board, evaluation_service)
+
+    def load(self, board: Board, game_state: GameState) -> None:
+        self._repository.restore(BoardRepository(board).snapshot(game_state), self._game_state)
+
+    @property
+    def team(self) -> Team:
+        return self._game_state.current_turn
+
+    def execute(
+        self,
+        lines: int = 3,
+        limits: SearchLimits = SearchLimits(depth=64),
+        on_update: Callable[[AnalysisResult], None] | None = None,
+        should_stop: Callable[[], bool] | None = None,
+    ) -> AnalysisResult:
+        if self._game_state.status != GameStatus.IN_PROGRESS:
+            return AnalysisResult(depth=0, nodes=0, elapsed=0.0)
+        return self._search_service.analyze(self._game_state.current_turn, lines, limits, on_update, should_stop)
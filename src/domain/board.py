@@ -1,5 +1,18 @@
-from typing import Dict, Set
+from collections import Counter
+from typing import Dict, Protocol, Set
 from src.domain.entities import Piece, Position, PieceType, Team
+from src.domain.zobrist import BLACK_TO_MOVE_KEY, piece_key
+
+
+class ReadableBoard(Protocol):
+    def get_piece(self, position: Position) -> Piece | None:
+        ...
+
+    def get_pieces_by_team(self, team: Team) -> list[Piece]:
+        ...
+
+    def get_all_pieces(self) -> list[Piece]:
+        ...
 
 
 class Board:
@@ -9,12 +22,21 @@ class Board:
 
     def __init__(self):
         self._pieces: Dict[Position, Piece] = {}
+        self._hash = 0
+        self._material: Counter[tuple[PieceType, Team]] = Counter()
+        self._bishop_square_colors = [0, 0]
 
     def add_piece(self, piece: Piece) -> None:
+        previous = self._pieces.get(piece.position)
+        if previous is not None:
+            self._unregister(previous)
         self._pieces[piece.position] = piece
+        self._register(piece)
 
     def remove_piece(self, position: Position) -> None:
-        self._pieces.pop(position, None)
+        piece = self._pieces.pop(position, None)
+        if piece is not None:
+            self._unregister(piece)
 
     def get_piece(self, position: Position) -> Piece | None:
         return self._pieces.get(position)
@@ -27,6 +49,36 @@ class Board:
 
     def clear(self) -> None:
         self._pieces.clear()
+        self._hash = 0
+        self._material.clear()
+        self._bishop_square_colors = [0, 0]
+
+    @property
+    def zobrist_hash(self) -> int:
+        return self._hash
+
+    def position_key(self, turn: Team) -> int:
+        return self._hash ^ BLACK_TO_MOVE_KEY if turn == Team.BLACK else self._hash
+
+    def piece_count(self, piece_type: PieceType, team: Team | None = None) -> int:
+        if team is not None:
+            return self._material[(piece_type, team)]
+        return self._material[(piece_type, Team.WHITE)] + self._material[(piece_type, Team.BLACK)]
+
+    def bishop_square_colors(self) -> tuple[int, int]:
+        return self._bishop_square_colors[0], self._bishop_square_colors[1]
+
+    def _register(self, piece: Piece) -> None:
+        self._hash ^= piece_key(piece.piece_type, piece.team, piece.position)
+        self._material[(piece.piece_type, piece.team)] += 1
+        if piece.piece_type == PieceType.BISHOP:
+            self._bishop_square_colors[(piece.position.row + piece.position.col) % 2] += 1
+
+    def _unregister(self, piece: Piece) -> None:
+        self._hash ^= piece_key(piece.piece_type, piece.team, piece.position)
+        self._material[(piece.piece_type, piece.team)] -= 1
+        if piece.piece_type == PieceType.BISHOP:
+            self._bishop_square_colors[(piece.position.row + piece.position.col) % 2] -= 1
 
     @staticmethod
     def starting_positions() -> Dict[Position, tuple[PieceType, Team]]:
@@ -0,0 +1,82 @@
+from dataclasses import dataclass
+
+from src.domain.entities import PieceType, Team, Position
+from src.domain.game_state import GameStatus
+
+
+PIECE_TYPES = tuple(PieceType)
+TEAMS = tuple(Team)
+STATUSES = tuple(GameStatus)
+SQUARES = tuple(Position.from_index(index) for index in range(64))
+
+EMPTY_CODE = 0
+MOVE_SQUARE_BITS = 6
+MOVE_SQUARE_MASK = 0x3F
+MOVE_PROMOTION_SHIFT = 12
+
+_PIECE_TYPE_INDEX = {piece_type: index for index, piece_type in enumerate(PIECE_TYPES)}
+_TEAM_INDEX = {team: index for index, team in enumerate(TEAMS)}
+_STATUS_INDEX = {status: index for index, status in enumerate(STATUSES)}
+
+
+def encode_piece(piece_type: PieceType, team: Team) -> int:
+    return 1 + _PIECE_TYPE_INDEX[piece_type] * 2 + _TEAM_INDEX[team]
+
+
+def decode_piece(code: int) -> tuple[PieceType, Team]:
+    if not 1 <= code <= len(PIECE_TYPES) * 2:
+        raise ValueError(f"Invalid piece code {code}")
+    return PIECE_TYPES[(code - 1) // 2], TEAMS[(code - 1) % 2]
+
+
+def encode_status(status: GameStatus) -> int:
+    return _STATUS_INDEX[status]
+
+
+def decode_status(code: int) -> GameStatus:
+    return STATUSES[code]
+
+
+def encode_move(
+    source: Position, target: Position, promotion: PieceType | None = None
+) -> int:
+    code = source.index | (target.index << MOVE_SQUARE_BITS)
+    if promotion is not None:
+        code |= (1 + _PIECE_TYPE_INDEX[promotion]) << MOVE_PROMOTION_SHIFT
+    return code
+
+
+def decode_move(code: int) -> tuple[Position, Position, PieceType | None]:
+    source = SQUARES[code & MOVE_SQUARE_MASK]
+    target = SQUARES[(code >> MOVE_SQUARE_BITS) & MOVE_SQUARE_MASK]
+    promotion_code = code >> MOVE_PROMOTION_SHIFT
+    promotion = PIECE_TYPES[promotion_code - 1] if promotion_code else None
+    return source, target, promotion
+
+
+@dataclass(frozen=True)
+class UndoRecord:
+    captured: tuple[PieceType, Team] | None
+    previous_status: GameStatus
+    status: GameStatus
+    turn_advanced: bool
+
+
+def encode_undo_record(record: UndoRecord) -> int:
+    captured_code = encode_piece(*record.captured) if record.captured else EMPTY_CODE
+    return (
+        captured_code
+        | (_STATUS_INDEX[record.previous_status] << 4)
+        | (_STATUS_INDEX[record.status] << 7)
+        | (int(record.turn_advanced) << 10)
+    )
+
+
+def decode_undo_record(code: int) -> UndoRecord:
+    captured_code = code & 0xF
+    return UndoRecord(
+        captured=decode_piece(captured_code) if captured_code else None,
+        previous_status=STATUSES[(code >> 4) & 0x7],
+        status=STATUSES[(code >> 7) & 0x7],
+        turn_advanced=bool((code >> 10) & 0x1),
+    )
@@ -17,7 +17,7 @@ class Team(Enum):
     BLACK = "black"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Position:
     row: int
     col: int
@@ -30,8 +30,22 @@ class Position:
     def algebraic(self) -> str:
         return f"{chr(97 + self.col)}{8 - self.row}"
 
+    @staticmethod
+    def from_algebraic(square: str) -> "Position":
+        if len(square) != 2 or not "a" <= square[0] <= "h" or not "1" <= square[1] <= "8":
+            raise ValueError(f"Invalid square '{square}'")
+        return Position(8 - int(square[1]), ord(square[0]) - 97)
 
-@dataclass
+    @property
+    def index(self) -> int:
+        return self.row * 8 + self.col
+
+    @staticmethod
+    def from_index(index: int) -> "Position":
+        return Position(index // 8, index % 8)
+
+
+@dataclass(slots=True)
 class Piece:
     piece_type: PieceType
     team: Team
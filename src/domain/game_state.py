@@ -1,3 +1,4 @@
+from collections import Counter
 from enum import Enum
 from src.domain.entities import Team
 
@@ -12,10 +13,18 @@ class GameStatus(Enum):
 
 
 class GameState:
-    def __init__(self, current_turn: Team = Team.WHITE):
+    FIFTY_MOVE_HALFMOVES = 100
+    REPETITION_LIMIT = 3
+
+    def __init__(self, current_turn: Team = Team.WHITE, keep_history: bool = True):
         self._current_turn = current_turn
+        self._keep_history = keep_history
         self._status = GameStatus.IN_PROGRESS
         self._move_count = 0
+        self._position_history: list[int] = []
+        self._window_starts = [0]
+        self._repetitions: Counter[int] = Counter()
+        self._halfmove_offset = 0
 
     @property
     def current_turn(self) -> Team:
@@ -29,17 +38,89 @@ class GameState:
     def move_count(self) -> int:
         return self._move_count
 
+    @property
+    def has_position_history(self) -> bool:
+        return bool(self._position_history)
+
+    @property
+    def halfmove_clock(self) -> int:
+        if not self._position_history:
+            return 0
+        offset = self._halfmove_offset if len(self._window_starts) == 1 else 0
+        return len(self._position_history) - 1 - self._window_starts[-1] + offset
+
+    @property
+    def repetition_count(self) -> int:
+        if not self._position_history:
+            return 0
+        return self._repetitions[self._position_history[-1]]
+
+    @property
+    def is_threefold_repetition(self) -> bool:
+        return self.repetition_count >= self.REPETITION_LIMIT
+
+    @property
+    def is_fifty_move_rule(self) -> bool:
+        return self.halfmove_clock >= self.FIFTY_MOVE_HALFMOVES
+
+    def record_position(self, position_key: int, irreversible: bool = False) -> int:
+        if irreversible and self._position_history:
+            self._repetitions.clear()
+            if self._keep_history:
+                self._window_starts.append(len(self._position_history))
+            else:
+                self._position_history.clear()
+                self._halfmove_offset = 0
+        self._position_history.append(position_key)
+        self._repetitions[position_key] += 1
+        return self._repetitions[position_key]
+
+    def unrecord_position(self) -> None:
+        position_key = self._position_history.pop()
+        if len(self._window_starts) > 1 and len(self._position_history) == self._window_starts[-1]:
+            self._window_starts.pop()
+            self._repetitions = Counter(self._position_history[self._window_starts[-1]:])
+            return
+        self._repetitions[position_key] -= 1
+        if not self._repetitions[position_key]:
+            del self._repetitions[position_key]
+
     def next_turn(self) -> None:
         self._current_turn = Team.BLACK if self._current_turn == Team.WHITE else Team.WHITE
         self._move_count += 1
 
+    def previous_turn(self) -> None:
+        self._current_turn = Team.BLACK if self._current_turn == Team.WHITE else Team.WHITE
+        self._move_count -= 1
+
     def set_winner(self, winner: Team) -> None:
         self._status = GameStatus.WHITE_WON if winner == Team.WHITE else GameStatus.BLACK_WON
 
     def end_game(self, status: GameStatus) -> None:
         self._status = status
 
-    def reset(self) -> None:
-        self._current_turn = Team.WHITE
+    def restore_status(self, status: GameStatus) -> None:
+        self._status = status
+
+    def reset(self, current_turn: Team = Team.WHITE) -> None:
+        self._current_turn = current_turn
         self._status = GameStatus.IN_PROGRESS
         self._move_count = 0
+        self._position_history.clear()
+        self._window_starts = [0]
+        self._repetitions.clear()
+        self._halfmove_offset = 0
+
+    def restore(
+        self,
+        current_turn: Team,
+        status: GameStatus,
+        move_count: int,
+        halfmove_clock: int,
+        position_key: int,
+    ) -> None:
+        self.reset(current_turn)
+        self._status = status
+        self._move_count = move_count
+        self._halfmove_offset = halfmove_clock
+        self.record_position(position_key)
@@ -0,0 +1,116 @@
+from src.domain.board import Board
+from src.domain.entities import Piece, Position, PieceType, Team
+from src.domain.zobrist import BLACK_TO_MOVE_KEY, piece_key
+
+
+Rank = tuple[Piece | None, ...]
+
+_EMPTY_RANK: Rank = (None,) * Board.BOARD_SIZE
+_MATERIAL_INDEX = {
+    (piece_type, team): index
+    for index, (piece_type, team) in enumerate(
+        (piece_type, team) for piece_type in PieceType for team in Team
+    )
+}
+
+
+class PersistentBoard:
+    __slots__ = ("_ranks", "_hash", "_material", "_bishop_square_colors")
+
+    def __init__(
+        self,
+        ranks: tuple[Rank, ...] = (_EMPTY_RANK,) * Board.BOARD_SIZE,
+        zobrist_hash: int = 0,
+        material: tuple[int, ...] = (0,) * len(_MATERIAL_INDEX),
+        bishop_square_colors: tuple[int, int] = (0, 0),
+    ):
+        self._ranks = ranks
+        self._hash = zobrist_hash
+        self._material = material
+        self._bishop_square_colors = bishop_square_colors
+
+    @staticmethod
+    def from_board(board: Board) -> "PersistentBoard":
+        rows = [[None] * Board.BOARD_SIZE for _ in range(Board.BOARD_SIZE)]
+        for piece in board.get_all_pieces():
+            rows[piece.position.row][piece.position.col] = Piece(piece.piece_type, piece.team, piece.position)
+        material = [0] * len(_MATERIAL_INDEX)
+        for (piece_type, team), index in _MATERIAL_INDEX.items():
+            material[index] = board.piece_count(piece_type, team)
+        return PersistentBoard(
+            tuple(tuple(row) for row in rows),
+            board.zobrist_hash,
+            tuple(material),
+            board.bishop_square_colors(),
+        )
+
+    def to_board(self) -> Board:
+        board = Board()
+        for piece in self.get_all_pieces():
+            board.add_piece(Piece(piece.piece_type, piece.team, piece.position))
+        return board
+
+    def rank(self, row: int) -> Rank:
+        return self._ranks[row]
+
+    def get_piece(self, position: Position) -> Piece | None:
+        return self._ranks[position.row][position.col]
+
+    def get_pieces_by_team(self, team: Team) -> list[Piece]:
+        return [piece for rank in self._ranks for piece in rank if piece is not None and piece.team == team]
+
+    def get_all_pieces(self) -> list[Piece]:
+        return [piece for rank in self._ranks for piece in rank if piece is not None]
+
+    @property
+    def zobrist_hash(self) -> int:
+        return self._hash
+
+    def position_key(self, turn: Team) -> int:
+        return self._hash ^ BLACK_TO_MOVE_KEY if turn == Team.BLACK else self._hash
+
+    def piece_count(self, piece_type: PieceType, team: Team | None = None) -> int:
+        if team is not None:
+            return self._material[_MATERIAL_INDEX[(piece_type, team)]]
+        return (
+            self._material[_MATERIAL_INDEX[(piece_type, Team.WHITE)]]
+            + self._material[_MATERIAL_INDEX[(piece_type, Team.BLACK)]]
+        )
+
+    def bishop_square_colors(self) -> tuple[int, int]:
+        return self._bishop_square_colors
+
+    def with_piece(self, piece: Piece) -> "PersistentBoard":
+        return self._replace({piece.position: piece})
+
+    def without_piece(self, position: Position) -> "PersistentBoard":
+        if self.get_piece(position) is None:
+            return self
+        return self._replace({position: None})
+
+    def move(self, piece: Piece, target: Position, promotion: PieceType | None = None) -> "PersistentBoard":
+        moved_piece = Piece(promotion or piece.piece_type, piece.team, target)
+        return self._replace({piece.position: None, target: moved_piece})
+
+    def _replace(self, changes: dict[Position, Piece | None]) -> "PersistentBoard":
+        ranks = list(self._ranks)
+        zobrist_hash = self._hash
+        material = list(self._material)
+        bishop_square_colors = list(self._bishop_square_colors)
+
+        for row in {position.row for position in changes}:
+            rank = list(self._ranks[row])
+            for position, piece in changes.items():
+                if position.row != row:
+                    continue
+                for delta, affected in ((-1, rank[position.col]), (1, piece)):
+                    if affected is None:
+                        continue
+                    zobrist_hash ^= piece_key(affected.piece_type, affected.team, position)
+                    material[_MATERIAL_INDEX[(affected.piece_type, affected.team)]] += delta
+                    if affected.piece_type == PieceType.BISHOP:
+                        bishop_square_colors[(position.row + position.col) % 2] += delta
+                rank[position.col] = piece
+            ranks[row] = tuple(rank)
+
+        return PersistentBoard(tuple(ranks), zobrist_hash, tuple(material), tuple(bishop_square_colors))
@@ -0,0 +1,19 @@
+import random
+
+from src.domain.entities import PieceType, Team, Position
+
+
+_ZOBRIST_SEED = 0x5A0B1257
+
+_random = random.Random(_ZOBRIST_SEED)
+
+PIECE_SQUARE_KEYS: dict[tuple[PieceType, Team], tuple[int, ...]] = {
+    (piece_type, team): tuple(_random.getrandbits(64) for _ in range(64))
+    for piece_type in PieceType
+    for team in Team
+}
+BLACK_TO_MOVE_KEY = _random.getrandbits(64)
+
+
+def piece_key(piece_type: PieceType, team: Team, position: Position) -> int:
+    return PIECE_SQUARE_KEYS[(piece_type, team)][position.row * 8 + position.col]
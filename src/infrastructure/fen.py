@@ -0,0 +1,84 @@
+from src.domain.board import Board
+from src.domain.entities import PieceType, Team, Position
+from src.domain.game_state import GameState, GameStatus
+from src.infrastructure.factories import PieceFactory
+
+
+STARTING_FEN = "rnbqkbnr/pppppppp/8/8/8/8/PPPPPPPP/RNBQKBNR w - - 0 1"
+
+_PIECE_LETTERS = {
+    "p": PieceType.PAWN,
+    "r": PieceType.ROOK,
+    "n": PieceType.KNIGHT,
+    "b": PieceType.BISHOP,
+    "q": PieceType.QUEEN,
+    "k": PieceType.KING,
+}
+_LETTERS_BY_TYPE = {piece_type: letter for letter, piece_type in _PIECE_LETTERS.items()}
+
+
+def load_fen(board: Board, fen: str, game_state: GameState | None = None) -> Team:
+    fields = fen.split()
+    if not fields:
+        raise ValueError("Empty FEN")
+    rows = fields[0].split("/")
+    if len(rows) != Board.BOARD_SIZE:
+        raise ValueError(f"FEN '{fen}' must describe {Board.BOARD_SIZE} ranks")
+
+    board.clear()
+    for row, rank in enumerate(rows):
+        col = 0
+        for symbol in rank:
+            if symbol.isdigit():
+                col += int(symbol)
+                continue
+            piece_type = _PIECE_LETTERS.get(symbol.lower())
+            if piece_type is None or col >= Board.BOARD_SIZE:
+                raise ValueError(f"Invalid FEN rank '{rank}'")
+            team = Team.WHITE if symbol.isupper() else Team.BLACK
+            board.add_piece(PieceFactory.create(piece_type, team, Position(row, col)))
+            col += 1
+        if col != Board.BOARD_SIZE:
+            raise ValueError(f"Invalid FEN rank '{rank}'")
+
+    if len(fields) > 1 and fields[1] not in ("w", "b"):
+        raise ValueError(f"Invalid side to move '{fields[1]}'")
+    turn = Team.BLACK if len(fields) > 1 and fields[1] == "b" else Team.WHITE
+    halfmove_clock, fullmove_number = _clock_fields(fields)
+    if game_state is not None:
+        move_count = 2 * (fullmove_number - 1) + (1 if turn == Team.BLACK else 0)
+        game_state.restore(turn, GameStatus.IN_PROGRESS, move_count, halfmove_clock, board.position_key(turn))
+    return turn
+
+
+def _clock_fields(fields: list[str]) -> tuple[int, int]:
+    clocks = fields[4:6]
+    if not all(field.isdigit() for field in clocks):
+        raise ValueError(f"Invalid FEN move counters '{' '.join(clocks)}'")
+    halfmove_clock = int(clocks[0]) if clocks else 0
+    fullmove_number = int(clocks[1]) if len(clocks) > 1 else 1
+    if fullmove_number < 1:
+        raise ValueError(f"Invalid FEN fullmove number {fullmove_number}")
+    return halfmove_clock, fullmove_number
+
+
+def to_fen(board: Board, turn: Team) -> str:
+    ranks = []
+    for row in range(Board.BOARD_SIZE):
+        rank = ""
+        empty = 0
+        for col in range(Board.BOARD_SIZE):
+            piece = board.get_piece(Position(row, col))
+            if piece is None:
+                empty += 1
+                continue
+            if empty:
+                rank += str(empty)
+                empty = 0
+            letter = _LETTERS_BY_TYPE[piece.piece_type]
+            rank += letter.upper() if piece.team == Team.WHITE else letter
+        if empty:
+            rank += str(empty)
+        ranks.append(rank)
+    side = "w" if turn == Team.WHITE else "b"
+    return f"{'/'.join(ranks)} {side} - - 0 1"
@@ -0,0 +1,90 @@
+import struct
+import sys
+from array import array
+from dataclasses import dataclass
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+from src.domain.game_state import GameStatus
+from src.domain.encoding import decode_status, encode_status
+
+
+GAME_FILE_MAGIC = b"CHG1"
+_GAME_HEADER = struct.Struct("<IBH")
+
+
+@dataclass
+class StoredGame:
+    index: int
+    status: GameStatus
+    moves: array
+
+
+def _to_little_endian(moves: array) -> array:
+    if sys.byteorder == "little":
+        return moves
+    swapped = array("H", moves)
+    swapped.byteswap()
+    return swapped
+
+
+class GameRecordWriter:
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        self._file: BinaryIO | None = None
+        self._count = 0
+
+    def __enter__(self) -> "GameRecordWriter":
+        self._file = self._path.open("wb")
+        self._file.write(GAME_FILE_MAGIC)
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    @property
+    def count(self) -> int:
+        return self._count
+
+    def write(self, index: int, status: GameStatus, moves: array) -> None:
+        self._file.write(_GAME_HEADER.pack(index, encode_status(status), len(moves)))
+        self._file.write(_to_little_endian(moves).tobytes())
+        self._count += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
+def game_record_offsets(path: str | Path) -> array:
+    offsets = array("Q")
+    with Path(path).open("rb") as stream:
+        if stream.read(len(GAME_FILE_MAGIC)) != GAME_FILE_MAGIC:
+            raise ValueError(f"{path} is not a game record file")
+        offset = len(GAME_FILE_MAGIC)
+        while header := stream.read(_GAME_HEADER.size):
+            if len(header) < _GAME_HEADER.size:
+                raise ValueError(f"Truncated game record in {path}")
+            _, _, ply_count = _GAME_HEADER.unpack(header)
+            offsets.append(offset)
+            offset += _GAME_HEADER.size + ply_count * array("H").itemsize
+            stream.seek(offset)
+    return offsets
+
+
+def read_game_records(path: str | Path, offset: int | None = None) -> Iterator[StoredGame]:
+    with Path(path).open("rb") as stream:
+        if stream.read(len(GAME_FILE_MAGIC)) != GAME_FILE_MAGIC:
+            raise ValueError(f"{path} is not a game record file")
+        if offset is not None:
+            stream.seek(offset)
+        while header := stream.read(_GAME_HEADER.size):
+            if len(header) < _GAME_HEADER.size:
+                raise ValueError(f"Truncated game record in {path}")
+            index, status_code, ply_count = _GAME_HEADER.unpack(header)
+            moves = array("H")
+            moves.frombytes(stream.read(ply_count * moves.itemsize))
+            if len(moves) != ply_count:
+                raise ValueError(f"Truncated game record in {path}")
+            yield StoredGame(index, decode_status(status_code), _to_little_endian(moves))
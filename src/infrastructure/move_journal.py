@@ -0,0 +1,161 @@
+import os
+import struct
+import time
+from dataclasses import dataclass
+from enum import IntEnum
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+JOURNAL_MAGIC = b"CHJ2"
+_RECORD = struct.Struct("<IHIBB")
+
+
+class JournalEntryKind(IntEnum):
+    CREATE = 1
+    MOVE = 2
+    CLOSE = 3
+
+
+@dataclass(frozen=True, slots=True)
+class JournalEntry:
+    kind: JournalEntryKind
+    game_id: int
+    move: int = 0
+    clock_ms: int = 0
+
+
+def _checksum(game_id: int, move: int, clock_ms: int, kind: int) -> int:
+    return (
+        game_id ^ game_id >> 8 ^ game_id >> 16 ^ game_id >> 24
+        ^ move ^ move >> 8
+        ^ clock_ms ^ clock_ms >> 8 ^ clock_ms >> 16 ^ clock_ms >> 24
+        ^ kind ^ 0xA5
+    ) & 0xFF
+
+
+def _scan(stream: BinaryIO) -> Iterator[tuple[int, JournalEntry]]:
+    offset = len(JOURNAL_MAGIC)
+    while len(data := stream.read(_RECORD.size)) == _RECORD.size:
+        game_id, move, clock_ms, kind, checksum = _RECORD.unpack(data)
+        if kind not in JournalEntryKind._value2member_map_ or checksum != _checksum(game_id, move, clock_ms, kind):
+            return
+        offset += _RECORD.size
+        yield offset, JournalEntry(JournalEntryKind(kind), game_id, move, clock_ms)
+
+
+def read_journal(path: str | Path) -> Iterator[JournalEntry]:
+    with Path(path).open("rb") as stream:
+        if stream.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+            raise ValueError(f"{path} is not a move journal")
+        for _, entry in _scan(stream):
+            yield entry
+
+
+def recover_games(path: str | Path) -> dict[int, list[JournalEntry]]:
+    games: dict[int, list[JournalEntry]] = {}
+    if not Path(path).exists():
+        return games
+    for entry in read_journal(path):
+        match entry.kind:
+            case JournalEntryKind.CREATE:
+                games[entry.game_id] = []
+            case JournalEntryKind.MOVE:
+                games.setdefault(entry.game_id, []).append(entry)
+            case JournalEntryKind.CLOSE:
+                games.pop(entry.game_id, None)
+    return games
+
+
+def _valid_length(path: Path) -> int:
+    with path.open("rb") as stream:
+        if stream.read(len(JOURNAL_MAGIC)) != JOURNAL_MAGIC:
+            raise ValueError(f"{path} is not a move journal")
+        length = len(JOURNAL_MAGIC)
+        for length, _ in _scan(stream):
+            pass
+        return length
+
+
+class MoveJournal:
+    DEFAULT_SYNC_INTERVAL = 0.05
+    DEFAULT_SYNC_EVERY = 1024
+
+    def __init__(
+        self,
+        path: str | Path,
+        sync_interval: float = DEFAULT_SYNC_INTERVAL,
+        sync_every: int = DEFAULT_SYNC_EVERY,
+    ):
+        self._path = Path(path)
+        self._sync_interval = sync_interval
+        self._sync_every = sync_every
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._syncs = 0
+        self._file = self._open()
+
+    @property
+    def pending(self) -> int:
+        return self._pending
+
+    @property
+    def sync_count(self) -> int:
+        return self._syncs
+
+    @property
+    def sync_interval(self) -> float:
+        return self._sync_interval
+
+    def record_create(self, game_id: int) -> None:
+        self._append(JournalEntryKind.CREATE, game_id)
+
+    def record_move(self, game_id: int, move: int, clock_ms: int = 0) -> None:
+        self._append(JournalEntryKind.MOVE, game_id, move, clock_ms)
+
+    def record_close(self, game_id: int) -> None:
+        self._append(JournalEntryKind.CLOSE, game_id)
+
+    def commit(self) -> None:
+        if self._file is None or not self._pending:
+            return
+        self._file.flush()
+        os.fsync(self._file.fileno())
+        self._pending = 0
+        self._last_sync = time.monotonic()
+        self._syncs += 1
+
+    def commit_if_due(self) -> None:
+        if self._pending and time.monotonic() - self._last_sync >= self._sync_interval:
+            self.commit()
+
+    def close(self) -> None:
+        if self._file is not None:
+            self.commit()
+            self._file.close()
+            self._file = None
+
+    def __enter__(self) -> "MoveJournal":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _append(self, kind: JournalEntryKind, game_id: int, move: int = 0, clock_ms: int = 0) -> None:
+        self._file.write(_RECORD.pack(game_id, move, clock_ms, kind, _checksum(game_id, move, clock_ms, kind)))
+        self._pending += 1
+        if self._pending >= self._sync_every:
+            self.commit()
+
+    def _open(self) -> BinaryIO:
+        if not self._path.exists() or self._path.stat().st_size < len(JOURNAL_MAGIC):
+            stream = self._path.open("wb")
+            stream.write(JOURNAL_MAGIC)
+            stream.flush()
+            os.fsync(stream.fileno())
+            return stream
+        length = _valid_length(self._path)
+        stream = self._path.open("r+b")
+        stream.truncate(length)
+        stream.seek(length)
+        return stream
@@ -0,0 +1,245 @@
+import os
+import struct
+from array import array
+from pathlib import Path
+from typing import Iterable, NamedTuple
+
+import numpy as np
+
+from src.domain.board import Board, ReadableBoard
+from src.domain.entities import PieceType, Team
+from src.domain.zobrist import PIECE_SQUARE_KEYS
+from src.domain.encoding import encode_piece, PIECE_TYPES, TEAMS
+from src.infrastructure.game_records import StoredGame
+
+
+INDEX_FILE_MAGIC = b"CHX1"
+_INDEX_HEADER = struct.Struct("<4sIQQ")
+_SECTION_ALIGNMENT = 8
+
+MATERIAL_LETTERS = {
+    PieceType.QUEEN: "Q",
+    PieceType.ROOK: "R",
+    PieceType.BISHOP: "B",
+    PieceType.KNIGHT: "N",
+    PieceType.PAWN: "P",
+}
+_LETTER_TYPES = {letter: piece_type for piece_type, letter in MATERIAL_LETTERS.items()}
+_COUNT_BITS = 4
+_COUNT_MASK = (1 << _COUNT_BITS) - 1
+
+
+class PositionMatch(NamedTuple):
+    game: int
+    ply: int
+
+
+def _material_shift(piece_type: PieceType, team: Team) -> int:
+    return (PIECE_TYPES.index(piece_type) * len(TEAMS) + TEAMS.index(team)) * _COUNT_BITS
+
+
+def _code_tables() -> tuple[list[int], list[tuple[int, ...] | None]]:
+    material_deltas = [0] * (len(PIECE_TYPES) * len(TEAMS) + 1)
+    pawn_keys: list[tuple[int, ...] | None] = [None] * len(material_deltas)
+    for piece_type in PIECE_TYPES:
+        for team in TEAMS:
+            code = encode_piece(piece_type, team)
+            if piece_type != PieceType.KING:
+                material_deltas[code] = 1 << _material_shift(piece_type, team)
+            if piece_type == PieceType.PAWN:
+                pawn_keys[code] = PIECE_SQUARE_KEYS[(piece_type, team)]
+    return material_deltas, pawn_keys
+
+
+_MATERIAL_DELTAS, _PAWN_KEYS = _code_tables()
+
+
+def material_key(board: ReadableBoard) -> int:
+    key = 0
+    for piece in board.get_all_pieces():
+        key += _MATERIAL_DELTAS[encode_piece(piece.piece_type, piece.team)]
+    return key
+
+
+def pawn_structure_key(board: ReadableBoard) -> int:
+    key = 0
+    for piece in board.get_all_pieces():
+        if piece.piece_type == PieceType.PAWN:
+            key ^= PIECE_SQUARE_KEYS[(piece.piece_type, piece.team)][piece.position.index]
+    return key
+
+
+def parse_material(signature: str) -> int:
+    sides = signature.upper().replace("VS", "V").replace(" ", "").split("V")
+    if len(sides) != 2 or not all(side.startswith("K") for side in sides):
+        raise ValueError(f"Material signature must look like 'KRPvKR', got {signature!r}")
+    key = 0
+    for team, side in zip(TEAMS, sides):
+        for letter in side[1:]:
+            if letter not in _LETTER_TYPES:
+                raise ValueError(f"Unknown piece letter {letter!r} in {signature!r}")
+            shift = _material_shift(_LETTER_TYPES[letter], team)
+            if (key >> shift) & _COUNT_MASK == _COUNT_MASK:
+                raise ValueError(f"Too many {letter} pieces in {signature!r}")
+            key += 1 << shift
+    return key
+
+
+def format_material(key: int) -> str:
+    sides = []
+    for team in TEAMS:
+        side = "K"
+        for piece_type, letter in MATERIAL_LETTERS.items():
+            side += letter * ((key >> _material_shift(piece_type, team)) & _COUNT_MASK)
+        sides.append(side)
+    return "v".join(sides)
+
+
+def _starting_state() -> tuple[bytearray, int, int]:
+    codes = bytearray(64)
+    for position, (piece_type, team) in Board.starting_positions().items():
+        codes[position.index] = encode_piece(piece_type, team)
+    material = sum(_MATERIAL_DELTAS[code] for code in codes)
+    pawns = 0
+    for square, code in enumerate(codes):
+        if _PAWN_KEYS[code] is not None:
+            pawns ^= _PAWN_KEYS[code][square]
+    return codes, material, pawns
+
+
+_STARTING_CODES, _STARTING_MATERIAL, _STARTING_PAWNS = _starting_state()
+
+
+def game_position_keys(moves: Iterable[int]) -> tuple[dict[int, int], dict[int, int]]:
+    codes = bytearray(_STARTING_CODES)
+    material, pawns = _STARTING_MATERIAL, _STARTING_PAWNS
+    first_material = {material: 0}
+    first_pawns = {pawns: 0}
+    for ply, move in enumerate(moves, start=1):
+        source, target, promotion = move & 0x3F, (move >> 6) & 0x3F, move >> 12
+        piece = codes[source]
+        captured = codes[target]
+        if captured:
+            material -= _MATERIAL_DELTAS[captured]
+            if _PAWN_KEYS[captured] is not None:
+                pawns ^= _PAWN_KEYS[captured][target]
+        placed = piece
+        if promotion:
+            placed = 1 + (promotion - 1) * len(TEAMS) + (piece - 1) % len(TEAMS)
+            material += _MATERIAL_DELTAS[placed] - _MATERIAL_DELTAS[piece]
+        if _PAWN_KEYS[piece] is not None:
+            pawns ^= _PAWN_KEYS[piece][source]
+        if _PAWN_KEYS[placed] is not None:
+            pawns ^= _PAWN_KEYS[placed][target]
+        codes[target] = placed
+        codes[source] = 0
+        first_material.setdefault(material, ply)
+        first_pawns.setdefault(pawns, ply)
+    return first_material, first_pawns
+
+
+class _PostingBuilder:
+    def __init__(self):
+        self.keys = array("Q")
+        self.games = array("I")
+        self.plies = array("H")
+
+    def extend(self, game: int, first_plies: dict[int, int]) -> None:
+        self.keys.extend(first_plies.keys())
+        self.games.extend([game] * len(first_plies))
+        self.plies.extend(first_plies.values())
+
+    def sorted_columns(self) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        keys = np.frombuffer(self.keys, dtype=np.uint64)
+        games = np.frombuffer(self.games, dtype=np.uint32)
+        plies = np.frombuffer(self.plies, dtype=np.uint16)
+        order = np.lexsort((games, keys))
+        return keys[order].astype("<u8"), games[order].astype("<u4"), plies[order].astype("<u2")
+
+
+def _write_aligned(stream, values: np.ndarray) -> None:
+    stream.write(values.tobytes())
+    stream.write(bytes(-values.nbytes % _SECTION_ALIGNMENT))
+
+
+def build_position_index(games: Iterable[StoredGame], path: str | Path) -> int:
+    material_postings, pawn_postings = _PostingBuilder(), _PostingBuilder()
+    game_count = 0
+    for game in games:
+        first_material, first_pawns = game_position_keys(game.moves)
+        material_postings.extend(game.index, first_material)
+        pawn_postings.extend(game.index, first_pawns)
+        game_count += 1
+
+    path = Path(path)
+    temporary = path.with_name(path.name + ".tmp")
+    with temporary.open("wb") as stream:
+        stream.write(
+            _INDEX_HEADER.pack(INDEX_FILE_MAGIC, game_count, len(material_postings.keys), len(pawn_postings.keys))
+        )
+        stream.write(bytes(-_INDEX_HEADER.size % _SECTION_ALIGNMENT))
+        for postings in (material_postings, pawn_postings):
+            for column in postings.sorted_columns():
+                _write_aligned(stream, column)
+    os.replace(temporary, path)
+    return game_count
+
+
+class _PostingList:
+    def __init__(self, path: Path, offset: int, count: int):
+        self.keys = self._map(path, "<u8", offset, count)
+        offset += self._aligned(count * 8)
+        self.games = self._map(path, "<u4", offset, count)
+        offset += self._aligned(count * 4)
+        self.plies = self._map(path, "<u2", offset, count)
+        self.end = offset + self._aligned(count * 2)
+
+    @staticmethod
+    def _aligned(size: int) -> int:
+        return size + (-size % _SECTION_ALIGNMENT)
+
+    @staticmethod
+    def _map(path: Path, dtype: str, offset: int, count: int) -> np.ndarray:
+        if not count:
+            return np.empty(0, dtype=dtype)
+        return np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=(count,))
+
+    def lookup(self, key: int) -> list[PositionMatch]:
+        key = np.uint64(key)
+        start = int(np.searchsorted(self.keys, key, side="left"))
+        stop = int(np.searchsorted(self.keys, key, side="right"))
+        return [
+            PositionMatch(int(game), int(ply))
+            for game, ply in zip(self.games[start:stop].tolist(), self.plies[start:stop].tolist())
+        ]
+
+
+class PositionIndex:
+    def __init__(self, path: str | Path):
+        self._path = Path(path)
+        with self._path.open("rb") as stream:
+            header = stream.read(_INDEX_HEADER.size)
+        if len(header) < _INDEX_HEADER.size:
+            raise ValueError(f"{path} is not a position index")
+        magic, self._game_count, material_count, pawn_count = _INDEX_HEADER.unpack(header)
+        if magic != INDEX_FILE_MAGIC:
+            raise ValueError(f"{path} is not a position index")
+        offset = _PostingList._aligned(_INDEX_HEADER.size)
+        self._material = _PostingList(self._path, offset, material_count)
+        self._pawns = _PostingList(self._path, self._material.end, pawn_count)
+        if self._pawns.end > self._path.stat().st_size:
+            raise ValueError(f"Truncated position index in {path}")
+
+    @property
+    def game_count(self) -> int:
+        return self._game_count
+
+    @property
+    def posting_count(self) -> int:
+        return len(self._material.keys) + len(self._pawns.keys)
+
+    def find_material(self, key: int) -> list[PositionMatch]:
+        return self._material.lookup(key)
+
+    def find_pawn_structure(self, key: int) -> list[PositionMatch]:
+        return self._pawns.lookup(key)
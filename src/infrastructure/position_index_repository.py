@@ -0,0 +1,42 @@
+from pathlib import Path
+
+from src.domain.board import ReadableBoard
+from src.infrastructure.game_records import read_game_records
+from src.infrastructure.position_index import (
+    build_position_index,
+    parse_material,
+    pawn_structure_key,
+    PositionIndex,
+    PositionMatch,
+)
+
+
+class PositionIndexRepository:
+    def __init__(self, path: str | Path):
+        self._index = PositionIndex(path)
+
+    @classmethod
+    def build(cls, games_path: str | Path, index_path: str | Path) -> "PositionIndexRepository":
+        build_position_index(read_game_records(games_path), index_path)
+        return cls(index_path)
+
+    @property
+    def game_count(self) -> int:
+        return self._index.game_count
+
+    def find_by_material(self, signature: str) -> list[PositionMatch]:
+        return self._index.find_material(parse_material(signature))
+
+    def find_by_pawn_structure(self, board: ReadableBoard) -> list[PositionMatch]:
+        return self._index.find_pawn_structure(pawn_structure_key(board))
+
+    def find_games(self, signature: str | None = None, board: ReadableBoard | None = None) -> list[int]:
+        if signature is None and board is None:
+            raise ValueError("Give a material signature, a pawn structure or both")
+        games: set[int] | None = None
+        if signature is not None:
+            games = {match.game for match in self.find_by_material(signature)}
+        if board is not None:
+            pawn_games = {match.game for match in self.find_by_pawn_structure(board)}
+            games = pawn_games if games is None else games & pawn_games
+        return sorted(games)
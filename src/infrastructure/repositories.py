@@ -1,5 +1,9 @@
+from array import array
+from pathlib import Path
 from src.domain.board import Board
 from src.domain.entities import Piece, Team
+from src.domain.game_state import GameState
+from src.infrastructure.snapshots import decode_snapshot, encode_snapshot, load_snapshot, save_snapshot
 
 
 class PieceRepository:
@@ -23,8 +27,8 @@ class PieceRepository:
 
 
 class BoardRepository:
-    def __init__(self):
-        self._board = Board()
+    def __init__(self, board: Board | None = None):
+        self._board = board if board is not None else Board()
 
     def get_board(self) -> Board:
         return self._board
@@ -37,3 +41,60 @@ class BoardRepository:
 
     def clear_board(self) -> None:
         self._board.clear()
+
+    def snapshot(self, game_state: GameState) -> bytes:
+        return encode_snapshot(self._board, game_state)
+
+    def restore(self, data: bytes, game_state: GameState) -> None:
+        decode_snapshot(data, self._board, game_state)
+
+    def save(self, path: str | Path, game_state: GameState) -> None:
+        save_snapshot(path, self._board, game_state)
+
+    def load(self, path: str | Path, game_state: GameState) -> None:
+        load_snapshot(path, self._board, game_state)
+
+
+class MoveHistoryRepository:
+    def __init__(self):
+        self._moves = array("H")
+        self._undo_records = array("H")
+        self._cursor = 0
+
+    def __len__(self) -> int:
+        return self._cursor
+
+    def append(self, move: int, undo_record: int) -> None:
+        if self._cursor < len(self._moves):
+            del self._moves[self._cursor:]
+            del self._undo_records[self._cursor:]
+        self._moves.append(move)
+        self._undo_records.append(undo_record)
+        self._cursor += 1
+
+    def can_undo(self) -> bool:
+        return self._cursor > 0
+
+    def can_redo(self) -> bool:
+        return self._cursor < len(self._moves)
+
+    def step_back(self) -> tuple[int, int] | None:
+        if not self.can_undo():
+            return None
+        self._cursor -= 1
+        return self._moves[self._cursor], self._undo_records[self._cursor]
+
+    def step_forward(self) -> tuple[int, int] | None:
+        if not self.can_redo():
+            return None
+        entry = self._moves[self._cursor], self._undo_records[self._cursor]
+        self._cursor += 1
+        return entry
+
+    def get_moves(self) -> array:
+        return self._moves[:self._cursor]
+
+    def clear(self) -> None:
+        self._moves = array("H")
+        self._undo_records = array("H")
+        self._cursor = 0
@@ -0,0 +1,100 @@
+import struct
+from pathlib import Path
+from typing import Iterable, Iterator
+
+from src.domain.board import Board
+from src.domain.entities import Piece
+from src.domain.game_state import GameState
+from src.domain.encoding import (
+    decode_status,
+    encode_piece,
+    encode_status,
+    EMPTY_CODE,
+    PIECE_TYPES,
+    SQUARES,
+    STATUSES,
+    TEAMS,
+)
+
+
+SNAPSHOT_FILE_MAGIC = b"CHS1"
+_SNAPSHOT = struct.Struct("<32sBBIH")
+SNAPSHOT_SIZE = _SNAPSHOT.size
+_MAX_HALFMOVE_CLOCK = 0xFFFF
+
+_DECODED_PIECES = (None,) + tuple(
+    (piece_type, team) for piece_type in PIECE_TYPES for team in TEAMS
+)
+
+
+def encode_snapshot(board: Board, game_state: GameState) -> bytes:
+    squares = bytearray(32)
+    for piece in board.get_all_pieces():
+        index = piece.position.index
+        squares[index >> 1] |= encode_piece(piece.piece_type, piece.team) << (index & 1) * 4
+    return _SNAPSHOT.pack(
+        bytes(squares),
+        TEAMS.index(game_state.current_turn),
+        encode_status(game_state.status),
+        game_state.move_count,
+        min(game_state.halfmove_clock, _MAX_HALFMOVE_CLOCK),
+    )
+
+
+def decode_snapshot(data: bytes, board: Board, game_state: GameState) -> None:
+    if len(data) != SNAPSHOT_SIZE:
+        raise ValueError(f"Snapshot must be {SNAPSHOT_SIZE} bytes, got {len(data)}")
+    squares, turn_code, status_code, move_count, halfmove_clock = _SNAPSHOT.unpack(data)
+    if turn_code >= len(TEAMS) or status_code >= len(STATUSES):
+        raise ValueError("Corrupt snapshot header")
+
+    board.clear()
+    for byte_index, packed in enumerate(squares):
+        if packed == EMPTY_CODE:
+            continue
+        for nibble in (0, 1):
+            code = packed >> nibble * 4 & 0xF
+            if code == EMPTY_CODE:
+                continue
+            if code >= len(_DECODED_PIECES):
+                raise ValueError(f"Invalid piece code {code} in snapshot")
+            piece_type, team = _DECODED_PIECES[code]
+            board.add_piece(Piece(piece_type, team, SQUARES[byte_index * 2 + nibble]))
+
+    turn = TEAMS[turn_code]
+    game_state.restore(
+        turn, decode_status(status_code), move_count, halfmove_clock, board.position_key(turn)
+    )
+
+
+def save_snapshot(path: str | Path, board: Board, game_state: GameState) -> None:
+    Path(path).write_bytes(SNAPSHOT_FILE_MAGIC + encode_snapshot(board, game_state))
+
+
+def load_snapshot(path: str | Path, board: Board, game_state: GameState) -> None:
+    data = Path(path).read_bytes()
+    if not data.startswith(SNAPSHOT_FILE_MAGIC):
+        raise ValueError(f"{path} is not a snapshot file")
+    decode_snapshot(data[len(SNAPSHOT_FILE_MAGIC):], board, game_state)
+
+
+def save_snapshots(path: str | Path, snapshots: Iterable[bytes]) -> int:
+    count = 0
+    with Path(path).open("wb") as stream:
+        stream.write(SNAPSHOT_FILE_MAGIC)
+        for snapshot in snapshots:
+            if len(snapshot) != SNAPSHOT_SIZE:
+                raise ValueError(f"Snapshot must be {SNAPSHOT_SIZE} bytes, got {len(snapshot)}")
+            stream.write(snapshot)
+            count += 1
+    return count
+
+
+def iter_snapshots(path: str | Path) -> Iterator[bytes]:
+    with Path(path).open("rb") as stream:
+        if stream.read(len(SNAPSHOT_FILE_MAGIC)) != SNAPSHOT_FILE_MAGIC:
+            raise ValueError(f"{path} is not a snapshot file")
+        while snapshot := stream.read(SNAPSHOT_SIZE):
+            if len(snapshot) != SNAPSHOT_SIZE:
+                raise ValueError(f"Truncated snapshot in {path}")
+            yield snapshot
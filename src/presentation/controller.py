@@ -1,25 +1,57 @@
+from typing import Callable
+
 from src.domain.board import Board
 from src.domain.entities import Position, Piece, Team
 from src.domain.game_state import GameState, GameStatus
+from src.application.attacks import AttackMapService
+from src.application.pondering import ComputerPlayer
+from src.application.search import SearchResult
+from src.application.services import UndoRedoService
+from src.application.timers import TimerService
 from src.application.usecases import (
+    AnalyzePositionUseCase,
     InitializeGameUseCase,
     RenderBoardUseCase,
     GetValidMovesUseCase,
     ExecuteMoveUseCase,
 )
+from src.infrastructure.repositories import BoardRepository, MoveHistoryRepository
 
 
 class ChessController:
-    def __init__(self, board: Board, game_state: GameState):
+    def __init__(
+        self,
+        board: Board,
+        game_state: GameState,
+        computer: ComputerPlayer | None = None,
+        timer: TimerService | None = None,
+        auto_reply: bool = True,
+    ):
         self._board = board
         self._game_state = game_state
+        self._computer = computer
+        self._timer = timer
+        self._auto_reply = auto_reply
+        self._computer_thinking = False
+        self._last_computer_move: tuple[Position, Position] | None = None
+        self._analyze_position_use_case: AnalyzePositionUseCase | None = None
+        self._attack_map: AttackMapService | None = None
         self._initialize_game_use_case = InitializeGameUseCase(board, game_state)
         self._render_board_use_case = RenderBoardUseCase(board)
         self._get_valid_moves_use_case = GetValidMovesUseCase(board)
-        self._execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+        self._undo_redo_service = UndoRedoService(board, game_state, MoveHistoryRepository())
+        self._execute_move_use_case = ExecuteMoveUseCase(
+            board, game_state, self._undo_redo_service
+        )
 
     def initialize_game(self) -> None:
+        self._stop_computer()
         self._initialize_game_use_case.execute()
+        self._undo_redo_service.clear()
+        if self._timer is not None:
+            self._timer.reset()
+        if self._auto_reply:
+            self.play_computer_move()
 
     def get_pieces_for_rendering(self):
         return self._render_board_use_case.get_pieces_to_render()
@@ -35,7 +67,124 @@ class ChessController:
         return self._get_valid_moves_use_case.execute(piece)
 
     def move_piece(self, piece: Piece, target: Position) -> tuple[Piece | None, GameStatus]:
-        return self._execute_move_use_case.execute(piece, target)
+        self._last_computer_move = None
+        if self.check_clock():
+            return None, self._game_state.status
+        moved_piece, game_status = self._execute_move_use_case.execute(piece, target)
+        if moved_piece is not None:
+            self._press_clock()
+        if moved_piece is not None and self._auto_reply and self.play_computer_move() is not None:
+            game_status = self._game_state.status
+        if self._computer is not None and self.is_game_over():
+            self._computer.stop_pondering()
+        return moved_piece, game_status
+
+    def is_computer_turn(self) -> bool:
+        return (
+            self._computer is not None
+            and not self.is_game_over()
+            and self._game_state.current_turn == self._computer.team
+        )
+
+    @property
+    def is_computer_thinking(self) -> bool:
+        return self._computer_thinking
+
+    def prepare_computer_move(self) -> Callable[[], SearchResult] | None:
+        if self._computer_thinking or not self.is_computer_turn():
+            return None
+        board, game_state = Board(), GameState()
+        BoardRepository(board).restore(BoardRepository(self._board).snapshot(self._game_state), game_state)
+        self._computer_thinking = True
+        computer = self._computer
+        return lambda: computer.choose_move(board, game_state)
+
+    def play_computer_move(self) -> tuple[Position, Position] | None:
+        think = self.prepare_computer_move()
+        if think is None:
+            return None
+        return self.apply_computer_move(think())
+
+    def apply_computer_move(self, result: SearchResult) -> tuple[Position, Position] | None:
+        self._computer_thinking = False
+        if self.check_clock() or not self.is_computer_turn():
+            self._computer.stop_pondering()
+            return None
+        if result.move is None:
+            return None
+        source, target = result.move
+        moved_piece, _ = self._execute_move_use_case.execute(self._board.get_piece(source), target)
+        if moved_piece is None:
+            return None
+        self._press_clock()
+        self._last_computer_move = result.move
+        self._computer.start_pondering(self._board, self._game_state, result)
+        return result.move
+
+    def prepare_analysis(self) -> AnalyzePositionUseCase:
+        if self._analyze_position_use_case is None:
+            self._analyze_position_use_case = AnalyzePositionUseCase()
+        self._analyze_position_use_case.load(self._board, self._game_state)
+        return self._analyze_position_use_case
+
+    def get_attack_map(self) -> AttackMapService:
+        if self._attack_map is None:
+            self._attack_map = AttackMapService(self._board)
+        return self._attack_map
+
+    def get_timer(self) -> TimerService | None:
+        return self._timer
+
+    def check_clock(self) -> bool:
+        if self._timer is None or not self._timer.check():
+            return False
+        if not self._computer_thinking:
+            self._stop_computer()
+        return True
+
+    def _press_clock(self) -> None:
+        if self._timer is not None:
+            self._timer.press()
+
+    def get_last_computer_move(self) -> tuple[Position, Position] | None:
+        return self._last_computer_move
+
+    def get_computer(self) -> ComputerPlayer | None:
+        return self._computer
+
+    def undo(self) -> bool:
+        return self._step_history(self._undo_redo_service.undo, self._undo_redo_service.can_undo)
+
+    def redo(self) -> bool:
+        return self._step_history(self._undo_redo_service.redo, self._undo_redo_service.can_redo)
+
+    def _step_history(self, step, can_step) -> bool:
+        if self._computer_thinking:
+            return False
+        self._stop_computer()
+        if not step():
+            return False
+        if self._computer is not None and self._game_state.current_turn == self._computer.team and can_step():
+            step()
+        if self._timer is not None:
+            self._timer.sync()
+        return True
+
+    def _stop_computer(self) -> None:
+        self._last_computer_move = None
+        if self._computer is not None:
+            self._computer.stop_pondering()
+
+    def shutdown(self) -> None:
+        self._stop_computer()
+        if self._timer is not None:
+            self._timer.stop()
+
+    def can_undo(self) -> bool:
+        return self._undo_redo_service.can_undo()
+
+    def can_redo(self) -> bool:
+        return self._undo_redo_service.can_redo()
 
     def get_current_turn(self) -> Team:
         return self._game_state.current_turn
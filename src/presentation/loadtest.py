@@ -0,0 +1,179 @@
+import asyncio
+import json
+import random
+import statistics
+import time
+from collections import defaultdict
+from dataclasses import dataclass, field
+
+from src.domain.board import Board
+from src.domain.entities import Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.services import MoveValidator
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+
+
+CONTROL_MESSAGES = ("created", "joined", "stats")
+
+
+class GameClient:
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self._reader = reader
+        self._writer = writer
+        self.control: asyncio.Queue = asyncio.Queue()
+        self.games: dict[int, asyncio.Queue] = defaultdict(asyncio.Queue)
+        self._reader_task = asyncio.get_running_loop().create_task(self._read())
+
+    @staticmethod
+    async def connect(host: str, port: int) -> "GameClient":
+        reader, writer = await asyncio.open_connection(host, port)
+        return GameClient(reader, writer)
+
+    def send(self, message: dict) -> None:
+        self._writer.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+    async def request(self, message: dict) -> dict:
+        self.send(message)
+        await self._writer.drain()
+        return await self.control.get()
+
+    def drain_game(self, game_id: int) -> None:
+        queue = self.games[game_id]
+        while not queue.empty():
+            queue.get_nowait()
+
+    async def close(self) -> None:
+        self._writer.close()
+        self._reader_task.cancel()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+
+    async def _read(self) -> None:
+        while line := await self._reader.readline():
+            message = json.loads(line)
+            if message["type"] in CONTROL_MESSAGES:
+                self.control.put_nowait(message)
+            elif "game" in message:
+                self.games[int(message["game"])].put_nowait(message)
+
+
+@dataclass
+class LoadTestReport:
+    games: int = 0
+    setup_seconds: float = 0.0
+    rss_kb_before: int | None = None
+    rss_kb_after: int | None = None
+    round_trips: list[float] = field(default_factory=list)
+    server_stats: dict = field(default_factory=dict)
+
+    def format(self) -> str:
+        lines = [f"games hosted: {self.games}  setup: {self.setup_seconds:.2f}s"]
+        if self.rss_kb_before is not None and self.rss_kb_after is not None and self.games:
+            per_game = (self.rss_kb_after - self.rss_kb_before) * 1024 / self.games
+            lines.append(f"server max rss: {self.rss_kb_after / 1024:.1f}MB  (~{per_game:.0f} bytes/game)")
+        if self.round_trips:
+            ordered = sorted(self.round_trips)
+            p99 = ordered[min(len(ordered) - 1, int(len(ordered) * 0.99))]
+            lines.append(
+                f"moves: {len(ordered)}  round trip p50 {statistics.median(ordered) * 1000:.3f}ms  "
+                f"p99 {p99 * 1000:.3f}ms  max {ordered[-1] * 1000:.3f}ms"
+            )
+        if self.server_stats:
+            lines.append(
+                f"server move handling mean {self.server_stats['mean_move_ms']:.3f}ms  "
+                f"max {self.server_stats['max_move_ms']:.3f}ms  "
+                f"(all messages mean {self.server_stats['mean_handling_ms']:.3f}ms)"
+            )
+        return "\n".join(lines)
+
+
+async def _create_games(white: GameClient, black: GameClient, count: int) -> list[int]:
+    for _ in range(count):
+        white.send({"type": "create"})
+    game_ids = [(await white.control.get())["game"] for _ in range(count)]
+    for game_id in game_ids:
+        black.send({"type": "join", "game": game_id})
+    for _ in game_ids:
+        await black.control.get()
+    for game_id in game_ids:
+        white.drain_game(game_id)
+        black.drain_game(game_id)
+    return game_ids
+
+
+async def _play_game(
+    white: GameClient, black: GameClient, game_id: int, plies: int, rng: random.Random
+) -> list[float]:
+    board = Board()
+    game_state = GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    validator = MoveValidator(board)
+    execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+    clients = {Team.WHITE: white, Team.BLACK: black}
+
+    round_trips = []
+    for _ in range(plies):
+        if game_state.status != GameStatus.IN_PROGRESS:
+            break
+        moves = validator.get_all_valid_moves(game_state.current_turn)
+        if not moves:
+            break
+        piece, target = rng.choice(moves)
+        client = clients[game_state.current_turn]
+        client.drain_game(game_id)
+
+        started = time.perf_counter()
+        client.send({
+            "type": "move",
+            "game": game_id,
+            "from": piece.position.algebraic,
+            "to": target.algebraic,
+        })
+        reply = await client.games[game_id].get()
+        round_trips.append(time.perf_counter() - started)
+        if reply["type"] != "moved":
+            raise RuntimeError(f"Server rejected move in game {game_id}: {reply}")
+        execute_move_use_case.execute(piece, target)
+    return round_trips
+
+
+async def run_load_test(
+    host: str,
+    port: int,
+    games: int,
+    connection_pairs: int = 10,
+    active_games: int = 100,
+    plies: int = 40,
+    seed: int = 0,
+) -> LoadTestReport:
+    report = LoadTestReport()
+    pairs = [
+        (await GameClient.connect(host, port), await GameClient.connect(host, port))
+        for _ in range(connection_pairs)
+    ]
+    report.rss_kb_before = (await pairs[0][0].request({"type": "stats"}))["max_rss_kb"]
+
+    started = time.perf_counter()
+    per_pair = [games // connection_pairs + (index < games % connection_pairs) for index in range(connection_pairs)]
+    created = await asyncio.gather(*(
+        _create_games(white, black, count) for (white, black), count in zip(pairs, per_pair)
+    ))
+    report.setup_seconds = time.perf_counter() - started
+    report.games = sum(len(game_ids) for game_ids in created)
+    report.rss_kb_after = (await pairs[0][0].request({"type": "stats"}))["max_rss_kb"]
+
+    rng = random.Random(seed)
+    players = []
+    for (white, black), game_ids in zip(pairs, created):
+        for game_id in game_ids[:max(1, active_games // connection_pairs)]:
+            players.append(_play_game(white, black, game_id, plies, random.Random(rng.getrandbits(32))))
+    for round_trips in await asyncio.gather(*players):
+        report.round_trips.extend(round_trips)
+
+    report.server_stats = await pairs[0][0].request({"type": "stats"})
+    for white, black in pairs:
+        await white.close()
+        await black.close()
+    return report
@@ -0,0 +1,445 @@
+import asyncio
+import itertools
+import json
+import time
+from dataclasses import dataclass
+from typing import Callable
+
+from src.domain.board import Board
+from src.domain.entities import Piece, Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.streaming import PositionStream
+from src.application.timers import ClockScheduler, NANOSECONDS, TimeControl, TimerService
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase, ReplayMoveUseCase
+from src.domain.encoding import decode_move, encode_move
+from src.infrastructure.move_journal import JournalEntry, MoveJournal
+
+try:
+    import resource
+except ImportError:
+    resource = None
+
+
+MAX_MESSAGE_BYTES = 4096
+NANOSECONDS_PER_MS = 1_000_000
+
+
+class ProtocolError(Exception):
+    pass
+
+
+class ClientConnection:
+    __slots__ = ("_writer", "games", "spectating")
+
+    def __init__(self, writer: asyncio.StreamWriter):
+        self._writer = writer
+        self.games: set[int] = set()
+        self.spectating: set[int] = set()
+
+    def send(self, message: dict) -> None:
+        self.write(json.dumps(message, separators=(",", ":")).encode() + b"\n")
+
+    def write(self, payload: bytes) -> None:
+        if not self._writer.is_closing():
+            self._writer.write(payload)
+
+    async def drain(self) -> None:
+        await self._writer.drain()
+
+    def close(self) -> None:
+        self._writer.close()
+
+
+class GameSession:
+    __slots__ = ("game_id", "board", "game_state", "timer", "players", "stream", "_execute_move")
+
+    def __init__(
+        self,
+        game_id: int,
+        time_control: TimeControl | None = None,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ):
+        self.game_id = game_id
+        self.board = Board()
+        self.game_state = GameState(keep_history=False)
+        self.timer = TimerService(self.game_state, time_control, clock) if time_control is not None else None
+        self.players: dict[Team, ClientConnection] = {}
+        self.stream: PositionStream | None = None
+        self._execute_move = ExecuteMoveUseCase(self.board, self.game_state)
+        InitializeGameUseCase(self.board, self.game_state).execute()
+
+    def check_clock(self) -> bool:
+        return self.timer is not None and self.timer.check()
+
+    def is_game_over(self) -> bool:
+        return self.game_state.status != GameStatus.IN_PROGRESS
+
+    def move_piece(self, piece: Piece, target: Position) -> tuple[Piece | None, GameStatus]:
+        if self.check_clock():
+            return None, self.game_state.status
+        moved_piece, status = self._execute_move.execute(piece, target)
+        if moved_piece is not None and self.timer is not None:
+            self.timer.press()
+        return moved_piece, status
+
+    def broadcast(self, message: dict) -> None:
+        sent = set()
+        for player in self.players.values():
+            if id(player) not in sent:
+                sent.add(id(player))
+                player.send(message)
+
+    def state_message(self) -> dict:
+        message = {
+            "type": "state",
+            "game": self.game_id,
+            "turn": self.game_state.current_turn.value,
+            "status": self.game_state.status.value,
+            "pieces": [
+                [piece.position.algebraic, piece.piece_type.value, piece.team.value]
+                for piece in self.board.get_all_pieces()
+            ],
+        }
+        if self.timer is not None:
+            message["clock"] = self.clock_message()
+        return message
+
+    def clock_message(self) -> dict:
+        now = self.timer.now()
+        return {
+            "white_ms": self.timer.remaining(Team.WHITE, now) // NANOSECONDS_PER_MS,
+            "black_ms": self.timer.remaining(Team.BLACK, now) // NANOSECONDS_PER_MS,
+            "running": self.timer.running_team.value if self.timer.running_team is not None else None,
+        }
+
+
+@dataclass
+class ServerStatistics:
+    messages: int = 0
+    moves: int = 0
+    handling_seconds: float = 0.0
+    max_handling_seconds: float = 0.0
+    move_seconds: float = 0.0
+    max_move_seconds: float = 0.0
+
+    def record(self, elapsed: float) -> None:
+        self.messages += 1
+        self.handling_seconds += elapsed
+        if elapsed > self.max_handling_seconds:
+            self.max_handling_seconds = elapsed
+
+    def record_move(self, elapsed: float) -> None:
+        self.moves += 1
+        self.move_seconds += elapsed
+        if elapsed > self.max_move_seconds:
+            self.max_move_seconds = elapsed
+
+
+class GameServer:
+    def __init__(
+        self,
+        max_games: int = 20_000,
+        journal: MoveJournal | None = None,
+        time_control: TimeControl | None = None,
+        clock: Callable[[], int] = time.monotonic_ns,
+    ):
+        self._max_games = max_games
+        self._sessions: dict[int, GameSession] = {}
+        self._game_ids = itertools.count(1)
+        self._statistics = ServerStatistics()
+        self._server: asyncio.AbstractServer | None = None
+        self._journal = journal
+        self._journal_task: asyncio.Task | None = None
+        self._uncommitted_acks: list[tuple[GameSession, dict]] = []
+        self._time_control = time_control
+        self._clock = clock
+        self._clocks = ClockScheduler()
+        self._clock_wakeup: asyncio.Event | None = None
+        self._clock_task: asyncio.Task | None = None
+
+    @property
+    def session_count(self) -> int:
+        return len(self._sessions)
+
+    @property
+    def running_clock_count(self) -> int:
+        return len(self._clocks)
+
+    def get_session(self, game_id: int) -> GameSession | None:
+        return self._sessions.get(game_id)
+
+    def expire_clocks(self, now: int | None = None) -> int:
+        now = self._clock() if now is None else now
+        flagged = 0
+        for game_id in self._clocks.pop_expired(now):
+            session = self._sessions.get(game_id)
+            if session is not None and session.timer.check(now):
+                self._announce_flag(session)
+                flagged += 1
+        return flagged
+
+    def restore_games(self, games: dict[int, list[JournalEntry]]) -> None:
+        for game_id, entries in games.items():
+            session = GameSession(game_id, self._time_control, self._clock)
+            replay = ReplayMoveUseCase(session.board, session.game_state)
+            remaining: dict[Team, int] = {}
+            for entry in entries:
+                source, target, promotion = decode_move(entry.move)
+                mover = session.game_state.current_turn
+                if replay.execute(source, target, promotion) is None:
+                    raise ValueError(f"Journal move {source.algebraic}{target.algebraic} cannot be replayed in game {game_id}")
+                if entry.clock_ms:
+                    remaining[mover] = entry.clock_ms * NANOSECONDS_PER_MS
+            if session.timer is not None:
+                session.timer.restore(remaining, running=bool(entries))
+            self._sessions[game_id] = session
+            self._schedule_clock(session)
+        if games:
+            self._game_ids = itertools.count(max(games) + 1)
+
+    async def start(self, host: str = "127.0.0.1", port: int = 8765) -> asyncio.AbstractServer:
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=MAX_MESSAGE_BYTES
+        )
+        if self._journal is not None:
+            self._journal_task = asyncio.get_running_loop().create_task(self._commit_journal())
+        if self._time_control is not None:
+            self._clock_wakeup = asyncio.Event()
+            self._clock_task = asyncio.get_running_loop().create_task(self._watch_clocks())
+        return self._server
+
+    async def serve_forever(self, host: str = "127.0.0.1", port: int = 8765) -> None:
+        server = await self.start(host, port)
+        try:
+            async with server:
+                await server.serve_forever()
+        finally:
+            if self._journal_task is not None:
+                self._journal_task.cancel()
+            if self._clock_task is not None:
+                self._clock_task.cancel()
+            if self._journal is not None:
+                self.commit_journal()
+                self._journal.close()
+
+    @property
+    def uncommitted_ack_count(self) -> int:
+        return len(self._uncommitted_acks)
+
+    def commit_journal(self) -> None:
+        self._journal.commit()
+        self._release_acks()
+
+    def _release_acks(self) -> None:
+        acks, self._uncommitted_acks = self._uncommitted_acks, []
+        for session, message in acks:
+            session.broadcast(message)
+
+    async def _commit_journal(self) -> None:
+        while True:
+            await asyncio.sleep(self._journal.sync_interval)
+            self.commit_journal()
+
+    async def _watch_clocks(self) -> None:
+        while True:
+            deadline = self._clocks.next_deadline()
+            timeout = None if deadline is None else max(0, deadline - self._clock()) / NANOSECONDS
+            try:
+                await asyncio.wait_for(self._clock_wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+            self._clock_wakeup.clear()
+            self.expire_clocks()
+
+    def _schedule_clock(self, session: GameSession) -> None:
+        if session.timer is None:
+            return
+        if self._clocks.schedule(session.game_id, session.timer.deadline()) and self._clock_wakeup is not None:
+            self._clock_wakeup.set()
+
+    def _announce_flag(self, session: GameSession) -> None:
+        self._clocks.cancel(session.game_id)
+        if session.stream is not None:
+            session.stream.publish_status(session.game_state.status, "time")
+        session.broadcast({
+            "type": "flag",
+            "game": session.game_id,
+            "team": session.timer.flagged.value,
+            "status": session.game_state.status.value,
+            "clock": session.clock_message(),
+        })
+
+    async def _handle_connection(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        connection = ClientConnection(writer)
+        try:
+            while line := await reader.readline():
+                self.handle_message(connection, line)
+                if writer.transport.get_write_buffer_size() > 64 * 1024:
+                    await connection.drain()
+        except (ConnectionError, ValueError):
+            pass
+        finally:
+            self.disconnect(connection)
+            connection.close()
+
+    def handle_message(self, connection: ClientConnection, line: bytes) -> None:
+        started = time.perf_counter()
+        message = None
+        try:
+            message = json.loads(line)
+            if not isinstance(message, dict):
+                raise ProtocolError("Message must be a JSON object")
+            self._dispatch(connection, message)
+        except (ProtocolError, ValueError, KeyError, TypeError) as error:
+            reply = {"type": "error", "reason": str(error)}
+            if isinstance(message, dict) and "game" in message:
+                reply["game"] = message["game"]
+            connection.send(reply)
+        self._statistics.record(time.perf_counter() - started)
+
+    def disconnect(self, connection: ClientConnection) -> None:
+        for game_id in list(connection.spectating):
+            session = self._sessions.get(game_id)
+            if session is not None:
+                self._unspectate(connection, session)
+        connection.spectating.clear()
+        for game_id in list(connection.games):
+            session = self._sessions.get(game_id)
+            if session is not None:
+                self._leave(connection, session)
+        connection.games.clear()
+
+    def _dispatch(self, connection: ClientConnection, message: dict) -> None:
+        match message.get("type"):
+            case "create":
+                self._create(connection)
+            case "join":
+                self._join(connection, self._session_for(message))
+            case "move":
+                self._move(connection, self._session_for(message), message)
+            case "state":
+                connection.send(self._session_for(message).state_message())
+            case "leave":
+                self._leave(connection, self._session_for(message))
+            case "spectate":
+                self._spectate(connection, self._session_for(message))
+            case "unspectate":
+                self._unspectate(connection, self._session_for(message))
+            case "stats":
+                connection.send(self._statistics_message())
+            case other:
+                raise ProtocolError(f"Unknown message type '{other}'")
+
+    def _session_for(self, message: dict) -> GameSession:
+        session = self._sessions.get(int(message["game"]))
+        if session is None:
+            raise ProtocolError(f"Unknown game {message['game']}")
+        return session
+
+    def _create(self, connection: ClientConnection) -> None:
+        if len(self._sessions) >= self._max_games:
+            raise ProtocolError("Server is full")
+        session = GameSession(next(self._game_ids), self._time_control, self._clock)
+        session.players[Team.WHITE] = connection
+        self._sessions[session.game_id] = session
+        connection.games.add(session.game_id)
+        if self._journal is not None:
+            self._journal.record_create(session.game_id)
+        connection.send({"type": "created", "game": session.game_id, "team": Team.WHITE.value})
+
+    def _join(self, connection: ClientConnection, session: GameSession) -> None:
+        team = next((team for team in (Team.WHITE, Team.BLACK) if team not in session.players), None)
+        if team is None:
+            raise ProtocolError(f"Game {session.game_id} is full")
+        session.players[team] = connection
+        connection.games.add(session.game_id)
+        connection.send({"type": "joined", "game": session.game_id, "team": team.value})
+        session.broadcast(session.state_message())
+
+    def _leave(self, connection: ClientConnection, session: GameSession) -> None:
+        connection.games.discard(session.game_id)
+        for team in [team for team, player in session.players.items() if player is connection]:
+            del session.players[team]
+        if session.players:
+            session.broadcast({"type": "opponent_left", "game": session.game_id})
+        else:
+            del self._sessions[session.game_id]
+            self._clocks.cancel(session.game_id)
+            if self._journal is not None:
+                self._journal.record_close(session.game_id)
+
+    def _spectate(self, connection: ClientConnection, session: GameSession) -> None:
+        if session.game_id in connection.spectating:
+            return
+        if session.stream is None:
+            session.stream = PositionStream(session.game_id, session.board, session.game_state)
+        connection.spectating.add(session.game_id)
+        session.stream.subscribe(connection)
+
+    def _unspectate(self, connection: ClientConnection, session: GameSession) -> None:
+        connection.spectating.discard(session.game_id)
+        if session.stream is not None:
+            session.stream.unsubscribe(connection)
+
+    def _move(self, connection: ClientConnection, session: GameSession, message: dict) -> None:
+        started = time.perf_counter()
+        turn = session.game_state.current_turn
+        if session.players.get(turn) is not connection:
+            raise ProtocolError("Not your turn")
+        if session.check_clock():
+            self._announce_flag(session)
+        if session.is_game_over():
+            raise ProtocolError("Game is over")
+
+        source = Position.from_algebraic(message["from"])
+        target = Position.from_algebraic(message["to"])
+        piece = session.board.get_piece(source)
+        if piece is None:
+            raise ProtocolError(f"No piece on {source.algebraic}")
+
+        moved_piece, status = session.move_piece(piece, target)
+        if moved_piece is None:
+            raise ProtocolError(f"Illegal move {source.algebraic}{target.algebraic}")
+
+        if self._journal is not None:
+            promotion = moved_piece.piece_type if moved_piece.piece_type != piece.piece_type else None
+            clock_ms = -(-session.timer.remaining(turn) // NANOSECONDS_PER_MS) if session.timer is not None else 0
+            self._journal.record_move(session.game_id, encode_move(source, target, promotion), clock_ms)
+        if session.stream is not None:
+            session.stream.publish_move(piece, moved_piece, status)
+        moved = {
+            "type": "moved",
+            "game": session.game_id,
+            "from": source.algebraic,
+            "to": target.algebraic,
+            "piece": moved_piece.piece_type.value,
+            "status": status.value,
+            "turn": session.game_state.current_turn.value,
+        }
+        if session.timer is not None:
+            moved["clock"] = session.clock_message()
+            self._schedule_clock(session)
+        if self._journal is not None and self._journal.pending:
+            self._uncommitted_acks.append((session, moved))
+        else:
+            self._release_acks()
+            session.broadcast(moved)
+        self._statistics.record_move(time.perf_counter() - started)
+
+    def _statistics_message(self) -> dict:
+        statistics = self._statistics
+        return {
+            "type": "stats",
+            "games": len(self._sessions),
+            "messages": statistics.messages,
+            "moves": statistics.moves,
+            "mean_handling_ms": (
+                statistics.handling_seconds / statistics.messages * 1000 if statistics.messages else 0.0
+            ),
+            "max_handling_ms": statistics.max_handling_seconds * 1000,
+            "mean_move_ms": statistics.move_seconds / statistics.moves * 1000 if statistics.moves else 0.0,
+            "max_move_ms": statistics.max_move_seconds * 1000,
+            "max_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss if resource else None,
+        }
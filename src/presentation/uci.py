@@ -0,0 +1,233 @@
+import asyncio
+import sys
+import threading
+from typing import Callable
+
+from src.domain.board import Board
+from src.domain.entities import PieceType, Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.search import MATE_SCORE, MATE_THRESHOLD, MiniMaxService, SearchLimits, SearchResult
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.infrastructure.fen import load_fen, STARTING_FEN
+
+
+ENGINE_NAME = "Chess PyQt6"
+ENGINE_AUTHOR = "Chess PyQt6 contributors"
+
+
+def format_move(source: Position, target: Position, board: Board | None = None) -> str:
+    move = source.algebraic + target.algebraic
+    piece = board.get_piece(source) if board is not None else None
+    if piece is not None and piece.piece_type == PieceType.PAWN and target.row in (0, 7):
+        move += "q"
+    return move
+
+
+def parse_move(move: str) -> tuple[Position, Position]:
+    if len(move) not in (4, 5):
+        raise ValueError(f"Invalid move '{move}'")
+    return Position.from_algebraic(move[:2]), Position.from_algebraic(move[2:4])
+
+
+def format_score(score: int) -> str:
+    if abs(score) >= MATE_THRESHOLD:
+        moves = (MATE_SCORE - abs(score) + 1) // 2
+        return f"mate {moves if score > 0 else -moves}"
+    return f"cp {score}"
+
+
+class UCIEngine:
+    DEFAULT_MOVES_TO_GO = 30
+    MOVE_OVERHEAD = 0.05
+    MAX_DEPTH = 64
+
+    def __init__(self, write: Callable[[str], None]):
+        self._write = write
+        self._board = Board()
+        self._game_state = GameState()
+        self._execute_move_use_case = ExecuteMoveUseCase(self._board, self._game_state)
+        self._search_service = MiniMaxService(self._board)
+        self._position: tuple[str, list[str]] | None = None
+        self._stop_event = threading.Event()
+        self._search_task: asyncio.Task | None = None
+
+    async def handle(self, line: str) -> bool:
+        tokens = line.split()
+        if not tokens:
+            return True
+
+        command, arguments = tokens[0], tokens[1:]
+        try:
+            return await self._dispatch(command, arguments)
+        except ValueError as error:
+            self._write(f"info string {error}")
+            return True
+
+    async def _dispatch(self, command: str, arguments: list[str]) -> bool:
+        match command:
+            case "uci":
+                self._write(f"id name {ENGINE_NAME}")
+                self._write(f"id author {ENGINE_AUTHOR}")
+                self._write("uciok")
+            case "isready":
+                self._write("readyok")
+            case "ucinewgame":
+                await self._stop_search()
+                self._position = None
+                self._search_service.clear()
+            case "position":
+                await self._stop_search()
+                self._set_position(arguments)
+            case "go":
+                await self._stop_search()
+                self._start_search(arguments)
+            case "stop":
+                await self._stop_search()
+            case "quit":
+                await self._stop_search()
+                return False
+        return True
+
+    async def wait_for_search(self) -> None:
+        if self._search_task is not None:
+            await self._search_task
+
+    def _set_position(self, arguments: list[str]) -> None:
+        if "moves" in arguments:
+            split = arguments.index("moves")
+            base, moves = arguments[:split], arguments[split + 1:]
+        else:
+            base, moves = arguments, []
+
+        if base[:1] == ["startpos"]:
+            fen = STARTING_FEN
+        elif base[:1] == ["fen"]:
+            fen = " ".join(base[1:])
+        else:
+            return
+
+        previous, self._position = self._position, None
+        if previous is not None:
+            previous_fen, previous_moves = previous
+            if previous_fen == fen and moves[:len(previous_moves)] == previous_moves:
+                self._apply_moves(moves[len(previous_moves):])
+                self._position = (fen, moves)
+                return
+
+        if fen == STARTING_FEN:
+            InitializeGameUseCase(self._board, self._game_state).execute()
+        else:
+            load_fen(self._board, fen, self._game_state)
+        self._apply_moves(moves)
+        self._position = (fen, moves)
+
+    def _apply_moves(self, moves: list[str]) -> None:
+        for move in moves:
+            source, target = parse_move(move)
+            piece = self._board.get_piece(source)
+            if piece is None:
+                raise ValueError(f"No piece on {source.algebraic} for move '{move}'")
+            moved_piece, _ = self._execute_move_use_case.execute(piece, target)
+            if moved_piece is None:
+                raise ValueError(f"Illegal move '{move}'")
+
+    def _start_search(self, arguments: list[str]) -> None:
+        limits = self._limits_from(arguments)
+        self._stop_event.clear()
+        loop = asyncio.get_running_loop()
+        team = self._game_state.current_turn
+
+        def report(result: SearchResult) -> None:
+            loop.call_soon_threadsafe(self._write, self._format_info(result))
+
+        def run() -> SearchResult:
+            if self._game_state.status != GameStatus.IN_PROGRESS:
+                return SearchResult(None, 0, 0, 0, 0.0)
+            return self._search_service.search(team, limits, report, self._stop_event.is_set)
+
+        async def search() -> None:
+            result = await loop.run_in_executor(None, run)
+            if result.move is None:
+                self._write("bestmove 0000")
+                return
+            self._write(f"bestmove {format_move(*result.move, self._board)}")
+
+        self._search_task = loop.create_task(search())
+
+    async def _stop_search(self) -> None:
+        if self._search_task is None:
+            return
+        self._stop_event.set()
+        await self._search_task
+        self._search_task = None
+
+    def _limits_from(self, arguments: list[str]) -> SearchLimits:
+        options: dict[str, float] = {}
+        iterator = iter(arguments)
+        for token in iterator:
+            if token in ("infinite", "ponder"):
+                options[token] = 1
+                continue
+            value = next(iterator, None)
+            if value is not None:
+                try:
+                    options[token] = float(value)
+                except ValueError:
+                    continue
+
+        depth = int(options.get("depth", self.MAX_DEPTH))
+        nodes = int(options["nodes"]) if "nodes" in options else None
+        if "movetime" in options:
+            return SearchLimits(depth, nodes, max(0.0, options["movetime"] / 1000 - self.MOVE_OVERHEAD))
+        if "infinite" in options:
+            return SearchLimits(depth, nodes, None)
+
+        white = self._game_state.current_turn == Team.WHITE
+        remaining = options.get("wtime" if white else "btime")
+        if remaining is None:
+            return SearchLimits(depth if "depth" in options or nodes else 4, nodes, None)
+
+        increment = options.get("winc" if white else "binc", 0.0)
+        moves_to_go = options.get("movestogo", self.DEFAULT_MOVES_TO_GO) or self.DEFAULT_MOVES_TO_GO
+        budget = remaining / moves_to_go + increment * 0.8
+        budget = min(budget, remaining * 0.5) / 1000 - self.MOVE_OVERHEAD
+        return SearchLimits(depth, nodes, max(0.01, budget))
+
+    def _format_info(self, result: SearchResult) -> str:
+        nps = int(result.nodes / result.elapsed) if result.elapsed else 0
+        pv = " ".join(source.algebraic + target.algebraic for source, target in result.pv)
+        return (
+            f"info depth {result.depth} score {format_score(result.score)} "
+            f"nodes {result.nodes} nps {nps} time {int(result.elapsed * 1000)} pv {pv}"
+        ).rstrip()
+
+
+async def _open_stdin() -> asyncio.StreamReader:
+    loop = asyncio.get_running_loop()
+    reader = asyncio.StreamReader()
+    await loop.connect_read_pipe(lambda: asyncio.StreamReaderProtocol(reader), sys.stdin)
+    return reader
+
+
+async def _read_lines():
+    try:
+        reader = await _open_stdin()
+    except (NotImplementedError, ValueError, OSError):
+        loop = asyncio.get_running_loop()
+        while line := await loop.run_in_executor(None, sys.stdin.readline):
+            yield line
+        return
+    while line := await reader.readline():
+        yield line.decode()
+
+
+async def run_uci() -> None:
+    def write(line: str) -> None:
+        sys.stdout.write(line + "\n")
+        sys.stdout.flush()
+
+    engine = UCIEngine(write)
+    async for line in _read_lines():
+        if not await engine.handle(line):
+            return
+    await engine.wait_for_search()
@@ -1,11 +1,18 @@
-from PyQt6.QtCore import Qt, QRect, QSize
-from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont
-from PyQt6.QtWidgets import QWidget, QApplication, QVBoxLayout, QLabel
+from PyQt6.QtCore import Qt, QRect, QSize, QTimer, pyqtSignal
+from PyQt6.QtGui import QPainter, QColor, QPen, QBrush, QFont, QKeySequence, QPixmap
+from PyQt6.QtWidgets import QWidget, QApplication, QHBoxLayout, QVBoxLayout, QLabel
 import sys
+import threading
 
 from src.domain.board import Board
 from src.domain.entities import Position, Team
 from src.domain.game_state import GameState, GameStatus
+from src.application.pondering import ComputerPlayer
+from src.application.rendering import draw_board_squares
+from src.application.search import AnalysisResult, MATE_SCORE, MATE_THRESHOLD, SearchLimits, SearchResult
+from src.application.timers import NANOSECONDS, TimeControl, TimerService
+from src.application.usecases import AnalyzePositionUseCase
+from src.application.instrumentation import instrumentation
 from src.presentation.controller import ChessController
 
 
@@ -14,13 +21,33 @@ class ChessBoardWidget(QWidget):
     MIN_SQUARE_SIZE = 20
     MAX_SQUARE_SIZE = 150
     DEFAULT_SQUARE_SIZE = 60
+    RESIZE_SETTLE_MS = 120
+    HEATMAP_WHITE = QColor(33, 150, 243)
+    HEATMAP_BLACK = QColor(244, 67, 54)
+    HEATMAP_CONTESTED = QColor(158, 158, 158)
+    HANGING_COLOR = QColor(213, 0, 0)
+
+    state_changed = pyqtSignal()
+    computer_move_ready = pyqtSignal(object)
 
     def __init__(self, controller: ChessController):
         super().__init__()
         self._controller = controller
+        self._computer_thread: threading.Thread | None = None
+        self.computer_move_ready.connect(self._apply_computer_move)
         self._square_size = self.DEFAULT_SQUARE_SIZE
         self._selected_piece = None
         self._valid_moves = []
+        self._background: QPixmap | None = None
+        self._background_key: tuple[int, float] | None = None
+        self._preview: QPixmap | None = None
+        self._heatmap_enabled = False
+        self._heatmap: QPixmap | None = None
+        self._heatmap_key: tuple[int, float] | None = None
+        self._resize_timer = QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(self.RESIZE_SETTLE_MS)
+        self._resize_timer.timeout.connect(self._finish_resize)
         
         self._update_widget_size()
         self.setWindowTitle("Chess")
@@ -34,17 +61,55 @@ class ChessBoardWidget(QWidget):
         board_dimension = self.BOARD_SIZE * self._square_size
         return QSize(board_dimension, board_dimension)
 
+    @property
+    def is_resizing(self) -> bool:
+        return self._preview is not None
+
     def resizeEvent(self, event):
         widget_size = min(event.size().width(), event.size().height())
-        self._square_size = max(
+        square_size = max(
             self.MIN_SQUARE_SIZE,
             min(self.MAX_SQUARE_SIZE, widget_size // self.BOARD_SIZE)
         )
+        if square_size != self._square_size and self.isVisible():
+            if self._preview is None:
+                self._preview = self._render_frame()
+            self._resize_timer.start()
+        self._square_size = square_size
         super().resizeEvent(event)
         self.update()
 
+    @property
+    def heatmap_enabled(self) -> bool:
+        return self._heatmap_enabled
+
+    def set_heatmap_enabled(self, enabled: bool) -> None:
+        if enabled == self._heatmap_enabled:
+            return
+        self._heatmap_enabled = enabled
+        self._heatmap = None
+        if enabled:
+            self._controller.get_attack_map().refresh()
+        self.update()
+
+    def _finish_resize(self) -> None:
+        self._preview = None
+        self.update()
+        QTimer.singleShot(0, self._warm_caches)
+
+    def _warm_caches(self) -> None:
+        if self._preview is not None:
+            return
+        self._board_background()
+        if self._heatmap_enabled:
+            self._heatmap_overlay()
+        renderer = self._controller.get_piece_renderer()
+        device_pixel_ratio = self.devicePixelRatioF()
+        for piece in self._controller.get_pieces_for_rendering():
+            renderer.sprite(piece.piece_type, piece.team, self._square_size, self._square_size, device_pixel_ratio)
+
     def mousePressEvent(self, event):
-        if self._controller.is_game_over():
+        if self._controller.is_game_over() or self.is_computer_thinking:
             return
         
         col = event.position().x() // self._square_size
@@ -65,128 +130,502 @@ class ChessBoardWidget(QWidget):
         else:
             self._deselect_piece()
 
+    def keyPressEvent(self, event):
+        if event.matches(QKeySequence.StandardKey.Undo):
+            self._navigate_history(self._controller.undo)
+        elif event.matches(QKeySequence.StandardKey.Redo):
+            self._navigate_history(self._controller.redo)
+        elif event.key() == Qt.Key.Key_H:
+            self.set_heatmap_enabled(not self._heatmap_enabled)
+        else:
+            super().keyPressEvent(event)
+
+    def _navigate_history(self, step) -> None:
+        if step():
+            self._selected_piece = None
+            self._valid_moves = []
+            self._refresh_heatmap()
+            self.update()
+            self.state_changed.emit()
+            self.start_computer_move()
+
     def _select_piece(self, piece) -> None:
+        previous = self._highlighted_squares()
         self._selected_piece = piece
         self._valid_moves = self._controller.get_valid_moves(piece)
-        self.update()
+        self._update_squares(previous + self._highlighted_squares())
 
     def _deselect_piece(self) -> None:
+        previous = self._highlighted_squares()
         self._selected_piece = None
         self._valid_moves = []
-        self.update()
+        self._update_squares(previous)
 
     def _execute_move(self, target: Position) -> None:
+        previous = self._highlighted_squares()
         moved_piece, game_status = self._controller.move_piece(self._selected_piece, target)
         if moved_piece:
             self._selected_piece = None
             self._valid_moves = []
-            self.update()
+            self._update_squares(
+                previous + list(self._controller.get_last_computer_move() or ()) + self._refresh_heatmap()
+            )
+            self.state_changed.emit()
+            self.start_computer_move()
+
+    @property
+    def is_computer_thinking(self) -> bool:
+        return self._computer_thread is not None
+
+    def start_computer_move(self) -> bool:
+        think = self._controller.prepare_computer_move()
+        if think is None:
+            return False
+        self._computer_thread = threading.Thread(
+            target=lambda: self.computer_move_ready.emit(think()), name="computer-move", daemon=True
+        )
+        self._computer_thread.start()
+        return True
+
+    def wait_for_computer(self) -> None:
+        if self._computer_thread is not None:
+            self._computer_thread.join()
+
+    def _apply_computer_move(self, result: SearchResult) -> None:
+        self._computer_thread = None
+        move = self._controller.apply_computer_move(result)
+        self._update_squares(list(move or ()) + self._refresh_heatmap())
+        self.state_changed.emit()
+
+    def _refresh_heatmap(self) -> list[Position]:
+        if not self._heatmap_enabled:
+            return []
+        changed = list(self._controller.get_attack_map().refresh())
+        if changed and self._heatmap is not None:
+            self._paint_heatmap_squares(changed)
+        return changed
+
+    def _highlighted_squares(self) -> list[Position]:
+        squares = list(self._valid_moves)
+        if self._selected_piece:
+            squares.append(self._selected_piece.position)
+        return squares
+
+    def _update_squares(self, positions: list[Position]) -> None:
+        for position in set(positions):
+            self.update(self._square_rect(position))
+
+    def _square_rect(self, position: Position) -> QRect:
+        return QRect(
+            position.col * self._square_size,
+            position.row * self._square_size,
+            self._square_size,
+            self._square_size,
+        )
+
+    def _squares_in(self, rect: QRect) -> list[Position]:
+        last = self.BOARD_SIZE - 1
+        first_row = max(0, rect.top() // self._square_size)
+        last_row = min(last, rect.bottom() // self._square_size)
+        first_col = max(0, rect.left() // self._square_size)
+        last_col = min(last, rect.right() // self._square_size)
+        return [
+            Position(row, col)
+            for row in range(first_row, last_row + 1)
+            for col in range(first_col, last_col + 1)
+        ]
+
+    def _board_background(self) -> QPixmap:
+        device_pixel_ratio = self.devicePixelRatioF()
+        key = (self._square_size, device_pixel_ratio)
+        if self._background is None or self._background_key != key:
+            board_dimension = self.BOARD_SIZE * self._square_size
+            background = QPixmap(
+                round(board_dimension * device_pixel_ratio), round(board_dimension * device_pixel_ratio)
+            )
+            background.setDevicePixelRatio(device_pixel_ratio)
+            background.fill(Qt.GlobalColor.transparent)
+            painter = QPainter(background)
+            self._draw_board(painter)
+            painter.end()
+            self._background = background
+            self._background_key = key
+        return self._background
+
+    def _heatmap_overlay(self) -> QPixmap:
+        device_pixel_ratio = self.devicePixelRatioF()
+        key = (self._square_size, device_pixel_ratio)
+        if self._heatmap is None or self._heatmap_key != key:
+            board_dimension = self.BOARD_SIZE * self._square_size
+            heatmap = QPixmap(round(board_dimension * device_pixel_ratio), round(board_dimension * device_pixel_ratio))
+            heatmap.setDevicePixelRatio(device_pixel_ratio)
+            heatmap.fill(Qt.GlobalColor.transparent)
+            self._heatmap = heatmap
+            self._heatmap_key = key
+            self._paint_heatmap_squares(
+                [Position(row, col) for row in range(self.BOARD_SIZE) for col in range(self.BOARD_SIZE)]
+            )
+        return self._heatmap
+
+    def _paint_heatmap_squares(self, positions: list[Position]) -> None:
+        attack_map = self._controller.get_attack_map()
+        painter = QPainter(self._heatmap)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_Source)
+        for position in positions:
+            painter.fillRect(self._square_rect(position), Qt.GlobalColor.transparent)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
+        font = QFont()
+        font.setPixelSize(max(8, self._square_size // 5))
+        painter.setFont(font)
+        for position in positions:
+            self._draw_heatmap_square(
+                painter,
+                self._square_rect(position),
+                attack_map.attack_count(position, Team.WHITE),
+                attack_map.attack_count(position, Team.BLACK),
+                attack_map.is_hanging(position),
+            )
+        painter.end()
+
+    def _draw_heatmap_square(self, painter: QPainter, rect: QRect, white: int, black: int, hanging: bool) -> None:
+        if white or black:
+            balance = white - black
+            if balance > 0:
+                color = QColor(self.HEATMAP_WHITE)
+            elif balance < 0:
+                color = QColor(self.HEATMAP_BLACK)
+            else:
+                color = QColor(self.HEATMAP_CONTESTED)
+            color.setAlpha(min(40 + 30 * abs(balance), 160))
+            painter.fillRect(rect, color)
+            text_rect = rect.adjusted(3, 1, -3, -1)
+            painter.setPen(self.HEATMAP_WHITE.darker(150))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignTop | Qt.AlignmentFlag.AlignLeft, str(white))
+            painter.setPen(self.HEATMAP_BLACK.darker(150))
+            painter.drawText(text_rect, Qt.AlignmentFlag.AlignBottom | Qt.AlignmentFlag.AlignRight, str(black))
+        if hanging:
+            pen_width = max(2, self._square_size // 20)
+            painter.setPen(QPen(self.HANGING_COLOR, pen_width))
+            painter.setBrush(Qt.BrushStyle.NoBrush)
+            inset = pen_width // 2 + 1
+            painter.drawRect(rect.adjusted(inset, inset, -inset, -inset))
 
+    def _render_frame(self) -> QPixmap:
+        device_pixel_ratio = self.devicePixelRatioF()
+        board_dimension = self.BOARD_SIZE * self._square_size
+        frame = QPixmap(round(board_dimension * device_pixel_ratio), round(board_dimension * device_pixel_ratio))
+        frame.setDevicePixelRatio(device_pixel_ratio)
+        frame.fill(Qt.GlobalColor.transparent)
+        painter = QPainter(frame)
+        self._paint_squares(painter, set(self._squares_in(QRect(0, 0, board_dimension, board_dimension))))
+        painter.end()
+        return frame
+
+    @instrumentation.timed("chess_board_widget.paint_event")
     def paintEvent(self, event):
         painter = QPainter(self)
-        self._draw_board(painter)
-        self._draw_valid_moves(painter)
-        self._draw_pieces(painter)
-        self._draw_selection_highlight(painter)
+        if self._preview is not None:
+            board_dimension = self.BOARD_SIZE * self._square_size
+            painter.drawPixmap(QRect(0, 0, board_dimension, board_dimension), self._preview)
+        else:
+            painter.setClipRegion(event.region())
+            self._paint_squares(painter, set(self._squares_in(event.rect())))
+        painter.end()
+
+    def _paint_squares(self, painter: QPainter, squares: set[Position]) -> None:
+        painter.drawPixmap(0, 0, self._board_background())
+        if self._heatmap_enabled:
+            painter.drawPixmap(0, 0, self._heatmap_overlay())
+        self._draw_valid_moves(painter, squares)
+        self._draw_pieces(painter, squares)
+        self._draw_selection_highlight(painter, squares)
 
     def _draw_board(self, painter: QPainter) -> None:
-        light_color = QColor(240, 217, 181)
-        dark_color = QColor(181, 136, 99)
-
-        for row in range(self.BOARD_SIZE):
-            for col in range(self.BOARD_SIZE):
-                rect = QRect(
-                    col * self._square_size,
-                    row * self._square_size,
-                    self._square_size,
-                    self._square_size,
-                )
-                is_light = (row + col) % 2 == 0
-                color = light_color if is_light else dark_color
-                painter.fillRect(rect, color)
-                painter.drawRect(rect)
-
-    def _draw_valid_moves(self, painter: QPainter) -> None:
+        draw_board_squares(painter, self._square_size, self.BOARD_SIZE)
+
+    def _draw_valid_moves(self, painter: QPainter, squares: set[Position]) -> None:
         if not self._valid_moves:
             return
         
         highlight_color = QColor(76, 175, 80, 100)
-        painter.fillRect(painter.viewport(), Qt.GlobalColor.transparent)
-        
         for move_position in self._valid_moves:
-            rect = QRect(
-                move_position.col * self._square_size,
-                move_position.row * self._square_size,
-                self._square_size,
-                self._square_size,
-            )
-            painter.fillRect(rect, highlight_color)
+            if move_position in squares:
+                painter.fillRect(self._square_rect(move_position), highlight_color)
 
-    def _draw_selection_highlight(self, painter: QPainter) -> None:
-        if not self._selected_piece:
+    def _draw_selection_highlight(self, painter: QPainter, squares: set[Position]) -> None:
+        if not self._selected_piece or self._selected_piece.position not in squares:
             return
         
-        selection_color = QColor(255, 235, 59)
-        rect = QRect(
-            self._selected_piece.position.col * self._square_size,
-            self._selected_piece.position.row * self._square_size,
-            self._square_size,
-            self._square_size,
-        )
+        rect = self._square_rect(self._selected_piece.position)
         painter.fillRect(rect, QColor(255, 235, 59, 100))
         painter.drawRect(rect)
 
-    def _draw_pieces(self, painter: QPainter) -> None:
+    def _draw_pieces(self, painter: QPainter, squares: set[Position]) -> None:
         pieces = self._controller.get_pieces_for_rendering()
         renderer = self._controller.get_piece_renderer()
 
         for piece in pieces:
-            rect = QRect(
-                piece.position.col * self._square_size,
-                piece.position.row * self._square_size,
-                self._square_size,
-                self._square_size,
-            )
-            renderer.render(painter, rect, piece)
+            if piece.position in squares:
+                renderer.render(painter, self._square_rect(piece.position), piece)
+
+
+class AnalysisPanel(QWidget):
+    analysis_updated = pyqtSignal(int, object, object)
+
+    def __init__(self, controller: ChessController, lines: int = 3, limits: SearchLimits = SearchLimits(depth=64)):
+        super().__init__()
+        self._controller = controller
+        self._lines = lines
+        self._limits = limits
+        self._generation = 0
+        self._stop_event = threading.Event()
+        self._thread: threading.Thread | None = None
+
+        layout = QVBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._depth_label = QLabel("Analysis")
+        self._line_labels = [QLabel() for _ in range(lines)]
+        font = QFont("monospace")
+        font.setStyleHint(QFont.StyleHint.Monospace)
+        layout.addWidget(self._depth_label)
+        for label in self._line_labels:
+            label.setFont(font)
+            layout.addWidget(label)
+        layout.addStretch()
+        self.setMinimumWidth(280)
+        self.analysis_updated.connect(self._show_result)
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def line_texts(self) -> list[str]:
+        return [label.text() for label in self._line_labels]
+
+    def restart(self) -> None:
+        self.stop()
+        self._generation += 1
+        if self._controller.is_game_over():
+            self._set_text(self._depth_label, "Game over")
+            for label in self._line_labels:
+                self._set_text(label, "")
+            return
+        use_case = self._controller.prepare_analysis()
+        self._stop_event = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(use_case, self._generation, self._stop_event),
+            name="analysis",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        if self._thread is None:
+            return
+        self._stop_event.set()
+        self._thread.join()
+        self._thread = None
+
+    def wait(self) -> None:
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self, use_case: AnalyzePositionUseCase, generation: int, stop_event: threading.Event) -> None:
+        team = use_case.team
+        use_case.execute(
+            self._lines,
+            self._limits,
+            lambda result: self.analysis_updated.emit(generation, team, result),
+            stop_event.is_set,
+        )
+
+    def _show_result(self, generation: int, team: Team, result: AnalysisResult) -> None:
+        if generation != self._generation:
+            return
+        self._set_text(self._depth_label, f"Depth {result.depth}   {result.nodes} nodes")
+        for index, label in enumerate(self._line_labels):
+            text = ""
+            if index < len(result.lines):
+                line = result.lines[index]
+                moves = " ".join(source.algebraic + target.algebraic for source, target in line.pv)
+                text = f"{index + 1}. {self.format_score(line.score, team):>6}  {moves}"
+            self._set_text(label, text)
+
+    @staticmethod
+    def format_score(score: int, team: Team) -> str:
+        white_score = score if team == Team.WHITE else -score
+        if abs(white_score) >= MATE_THRESHOLD:
+            sign = "+" if white_score > 0 else "-"
+            return f"{sign}M{(MATE_SCORE - abs(white_score)) // 2 + 1}"
+        return f"{white_score / 100:+.2f}"
+
+    @staticmethod
+    def _set_text(label: QLabel, text: str) -> None:
+        if label.text() != text:
+            label.setText(text)
+
+
+class ClockPanel(QWidget):
+    TENTHS_BELOW_NS = 10 * NANOSECONDS
+    RUNNING_STYLE = "font-size: 18px; font-weight: bold; padding: 2px 8px; background: #333; color: white;"
+    IDLE_STYLE = "font-size: 18px; padding: 2px 8px; color: #555;"
+    FLAGGED_STYLE = "font-size: 18px; font-weight: bold; padding: 2px 8px; color: #d50000;"
+
+    flag_fallen = pyqtSignal()
+
+    def __init__(self, controller: ChessController):
+        super().__init__()
+        self._controller = controller
+        self._timer_service = controller.get_timer()
+        self._labels = {team: QLabel() for team in (Team.WHITE, Team.BLACK)}
+        self._styles: dict[Team, str | None] = {team: None for team in self._labels}
+        self._tick = QTimer(self)
+        self._tick.setSingleShot(True)
+        self._tick.setTimerType(Qt.TimerType.PreciseTimer)
+        self._tick.timeout.connect(self.refresh)
+
+        layout = QHBoxLayout(self)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.addWidget(self._labels[Team.WHITE])
+        layout.addStretch()
+        layout.addWidget(self._labels[Team.BLACK])
+        self.refresh()
+
+    @property
+    def next_tick_ms(self) -> int | None:
+        return self._tick.interval() if self._tick.isActive() else None
+
+    def clock_texts(self) -> dict[Team, str]:
+        return {team: label.text() for team, label in self._labels.items()}
+
+    def refresh(self) -> None:
+        if self._controller.check_clock():
+            self.flag_fallen.emit()
+        timer_service = self._timer_service
+        now = timer_service.now()
+        for team, label in self._labels.items():
+            name = "White" if team == Team.WHITE else "Black"
+            text = f"{name}  {self.format_clock(timer_service.remaining(team, now))}"
+            if label.text() != text:
+                label.setText(text)
+            if team == timer_service.flagged:
+                style = self.FLAGGED_STYLE
+            elif team == timer_service.running_team:
+                style = self.RUNNING_STYLE
+            else:
+                style = self.IDLE_STYLE
+            if style != self._styles[team]:
+                self._styles[team] = style
+                label.setStyleSheet(style)
+        self._schedule(now)
+
+    def stop(self) -> None:
+        self._tick.stop()
+
+    def _schedule(self, now: int) -> None:
+        running = self._timer_service.running_team
+        if running is None:
+            self._tick.stop()
+            return
+        remaining = self._timer_service.remaining(running, now)
+        step = NANOSECONDS // 10 if remaining < self.TENTHS_BELOW_NS else NANOSECONDS
+        until_change = self._timer_service.deadline() - now - remaining // step * step + 1
+        self._tick.start(max(1, -(-until_change // 1_000_000)))
+
+    @classmethod
+    def format_clock(cls, remaining_ns: int) -> str:
+        if remaining_ns < cls.TENTHS_BELOW_NS:
+            tenths = remaining_ns // (NANOSECONDS // 10)
+            return f"{tenths // 10}.{tenths % 10}"
+        minutes, seconds = divmod(remaining_ns // NANOSECONDS, 60)
+        hours, minutes = divmod(minutes, 60)
+        return f"{hours}:{minutes:02}:{seconds:02}" if hours else f"{minutes}:{seconds:02}"
 
 
 class ChessApplication(QWidget):
-    def __init__(self):
+    def __init__(
+        self,
+        computer_team: Team | None = None,
+        think_time: float = 1.0,
+        analysis_lines: int = 0,
+        heatmap: bool = False,
+        time_control: TimeControl | None = None,
+    ):
         super().__init__()
         self._board = Board()
         self._game_state = GameState()
-        self._controller = ChessController(self._board, self._game_state)
+        computer = None
+        if computer_team is not None:
+            computer = ComputerPlayer(computer_team, SearchLimits(depth=64, movetime=think_time))
+        timer = TimerService(self._game_state, time_control) if time_control is not None else None
+        self._controller = ChessController(self._board, self._game_state, computer, timer, auto_reply=False)
         self._controller.initialize_game()
 
         self._chess_widget = ChessBoardWidget(self._controller)
+        self._chess_widget.set_heatmap_enabled(heatmap)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(10, 10, 10, 10)
         
         self._status_label = QLabel()
+        self._status_style: str | None = None
         self._update_status_label()
+        self._chess_widget.state_changed.connect(self._update_status_label)
+
+        self._clock_panel: ClockPanel | None = None
+        if timer is not None:
+            self._clock_panel = ClockPanel(self._controller)
+            self._chess_widget.state_changed.connect(self._clock_panel.refresh)
+            self._clock_panel.flag_fallen.connect(self._update_status_label)
+
+        self._analysis_panel: AnalysisPanel | None = None
+        board_row = QHBoxLayout()
+        board_row.addWidget(self._chess_widget)
+        if analysis_lines:
+            self._analysis_panel = AnalysisPanel(self._controller, analysis_lines)
+            self._chess_widget.state_changed.connect(self._analysis_panel.restart)
+            board_row.addWidget(self._analysis_panel)
+            self._analysis_panel.restart()
         
         layout.addWidget(self._status_label)
-        layout.addWidget(self._chess_widget)
+        if self._clock_panel is not None:
+            layout.addWidget(self._clock_panel)
+        layout.addLayout(board_row)
         
-        board_height = self._chess_widget.height()
-        self.resize(self._chess_widget.width(), board_height + 50)
+        board_height = self._chess_widget.height() + (self._clock_panel.sizeHint().height() if self._clock_panel else 0)
+        panel_width = self._analysis_panel.minimumWidth() if self._analysis_panel else 0
+        self.resize(self._chess_widget.width() + panel_width, board_height + 50)
         self.setWindowTitle("Chess Game")
         
         self._chess_widget.update()
+        self._chess_widget.start_computer_move()
+
+    def closeEvent(self, event):
+        if self._clock_panel is not None:
+            self._clock_panel.stop()
+        if self._analysis_panel is not None:
+            self._analysis_panel.stop()
+        self._chess_widget.wait_for_computer()
+        self._controller.shutdown()
+        super().closeEvent(event)
 
     def _update_status_label(self) -> None:
-        if self._controller.is_game_over():
+        if self._controller.get_game_status() == GameStatus.DRAW:
+            self._set_status("Draw! Game Over", "color: green; font-weight: bold; font-size: 14px;")
+        elif self._controller.is_game_over():
             winner = self._controller.get_winner()
             winner_name = "White" if winner == Team.WHITE else "Black"
-            self._status_label.setText(f"{winner_name} wins! Game Over")
-            self._status_label.setStyleSheet("color: green; font-weight: bold; font-size: 14px;")
+            timer = self._controller.get_timer()
+            reason = " on time" if timer is not None and timer.flagged is not None else ""
+            self._set_status(f"{winner_name} wins{reason}! Game Over", "color: green; font-weight: bold; font-size: 14px;")
         else:
             current_turn = self._controller.get_current_turn()
             turn_name = "White" if current_turn == Team.WHITE else "Black"
-            self._status_label.setText(f"Current Turn: {turn_name}")
-            self._status_label.setStyleSheet("color: black; font-size: 12px;")
+            self._set_status(f"Current Turn: {turn_name}", "color: black; font-size: 12px;")
 
-    def paintEvent(self, event):
-        self._update_status_label()
-        super().paintEvent(event)
+    def _set_status(self, text: str, style: str) -> None:
+        self._status_label.setText(text)
+        if style != self._status_style:
+            self._status_style = style
+            self._status_label.setStyleSheet(style)
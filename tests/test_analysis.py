@@ -0,0 +1,134 @@
+import sys
+
+from PyQt6.QtWidgets import QApplication
+
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Position, Team
+from src.domain.game_state import GameState
+from src.application.search import AnalysisResult, MATE_SCORE, MiniMaxService, SearchLimits
+from src.application.usecases import AnalyzePositionUseCase, InitializeGameUseCase
+from src.infrastructure.fen import load_fen
+from src.presentation.controller import ChessController
+from src.presentation.ui import AnalysisPanel
+
+ITALIAN_FEN = "r1bqkbnr/pppp1ppp/2n5/4p3/4P3/5N2/PPPP1PPP/RNBQKB1R w KQkq - 2 3"
+
+
+def position(fen: str | None = None) -> tuple[Board, GameState]:
+    board, game_state = Board(), GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    if fen is not None:
+        load_fen(board, fen)
+    return board, game_state
+
+
+class TestMultiPV:
+    def test_returns_distinct_lines_sorted_by_score(self):
+        board, _ = position(ITALIAN_FEN)
+        result = MiniMaxService(board).analyze(Team.WHITE, 4, SearchLimits(depth=3))
+
+        assert result.depth == 3
+        assert len(result.lines) == 4
+        assert len({line.move for line in result.lines}) == 4
+        assert [line.score for line in result.lines] == sorted((line.score for line in result.lines), reverse=True)
+        assert all(line.pv[0] == line.move for line in result.lines)
+
+    def test_best_line_matches_single_search(self):
+        board, _ = position(ITALIAN_FEN)
+        single = MiniMaxService(board).search(Team.WHITE, SearchLimits(depth=3))
+        analysis = MiniMaxService(board).analyze(Team.WHITE, 3, SearchLimits(depth=3))
+
+        assert analysis.lines[0].score == single.score
+
+    def test_streams_one_update_per_depth(self):
+        board, _ = position()
+        updates: list[AnalysisResult] = []
+        MiniMaxService(board).analyze(Team.WHITE, 2, SearchLimits(depth=3), updates.append)
+
+        assert [update.depth for update in updates] == [1, 2, 3]
+        assert all(len(update.lines) == 2 for update in updates)
+
+    def test_extra_lines_cost_less_than_independent_searches(self):
+        board, _ = position(ITALIAN_FEN)
+        single = MiniMaxService(board).analyze(Team.WHITE, 1, SearchLimits(depth=3))
+        multi = MiniMaxService(board).analyze(Team.WHITE, 4, SearchLimits(depth=3))
+
+        assert multi.nodes < 4 * single.nodes
+
+    def test_lines_are_capped_by_legal_moves(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.KING, Team.WHITE, Position(7, 0)))
+        board.add_piece(Piece(PieceType.KING, Team.BLACK, Position(0, 7)))
+        result = MiniMaxService(board).analyze(Team.WHITE, 10, SearchLimits(depth=2))
+
+        assert len(result.lines) == 3
+
+    def test_king_capture_is_reported_as_mate(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.KING, Team.WHITE, Position(7, 0)))
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, Position(0, 0)))
+        board.add_piece(Piece(PieceType.KING, Team.BLACK, Position(0, 7)))
+        result = MiniMaxService(board).analyze(Team.WHITE, 2, SearchLimits(depth=2))
+
+        assert result.lines[0].score == MATE_SCORE
+        assert result.lines[0].move == (Position(0, 0), Position(0, 7))
+
+
+class TestAnalyzePositionUseCase:
+    def test_searches_a_private_copy(self):
+        board, game_state = position(ITALIAN_FEN)
+        use_case = AnalyzePositionUseCase()
+        use_case.load(board, game_state)
+        board.clear()
+
+        result = use_case.execute(2, SearchLimits(depth=2))
+
+        assert len(result.lines) == 2
+        assert board.get_all_pieces() == []
+
+    def test_stops_when_asked(self):
+        board, game_state = position()
+        use_case = AnalyzePositionUseCase()
+        use_case.load(board, game_state)
+
+        result = use_case.execute(3, SearchLimits(depth=64), should_stop=lambda: True)
+
+        assert result.depth < 64
+
+
+class TestAnalysisPanel:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_panel_shows_streamed_lines(self):
+        controller = ChessController(Board(), GameState())
+        controller.initialize_game()
+        panel = AnalysisPanel(controller, lines=3, limits=SearchLimits(depth=2))
+
+        panel.restart()
+        panel.wait()
+        QApplication.processEvents()
+
+        texts = panel.line_texts()
+        assert all(text.startswith(f"{index + 1}. ") for index, text in enumerate(texts))
+        assert not panel.is_running
+
+    def test_restart_discards_stale_results(self):
+        controller = ChessController(Board(), GameState())
+        controller.initialize_game()
+        panel = AnalysisPanel(controller, lines=2, limits=SearchLimits(depth=2))
+        panel.restart()
+        panel.wait()
+        panel.restart()
+        panel.stop()
+        stale = AnalysisResult(1, 1, 0.0, [])
+        panel.analysis_updated.emit(0, Team.WHITE, stale)
+        QApplication.processEvents()
+
+        assert "Depth 1   1 nodes" not in panel._depth_label.text()
+
+    def test_score_is_shown_from_white_view(self):
+        assert AnalysisPanel.format_score(35, Team.WHITE) == "+0.35"
+        assert AnalysisPanel.format_score(35, Team.BLACK) == "-0.35"
+        assert AnalysisPanel.format_score(MATE_SCORE - 2, Team.WHITE) == "+M2"
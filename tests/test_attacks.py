@@ -0,0 +1,133 @@
+import random
+import sys
+
+from PyQt6.QtCore import QRect
+from PyQt6.QtWidgets import QApplication
+
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.attacks import AttackMapService
+from src.application.services import MoveValidator
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.presentation.controller import ChessController
+from src.presentation.ui import ChessBoardWidget
+
+
+def square(name: str) -> Position:
+    return Position.from_algebraic(name)
+
+
+def counts(attack_map: AttackMapService) -> list[tuple[int, int]]:
+    return [
+        (attack_map.attack_count(Position(row, col), Team.WHITE), attack_map.attack_count(Position(row, col), Team.BLACK))
+        for row in range(8)
+        for col in range(8)
+    ]
+
+
+class TestAttackMapService:
+    def test_starting_position_counts(self):
+        board = Board()
+        InitializeGameUseCase(board, GameState()).execute()
+        attack_map = AttackMapService(board)
+
+        assert attack_map.attack_count(square("f3"), Team.WHITE) == 3
+        assert attack_map.attack_count(square("e2"), Team.WHITE) == 4
+        assert attack_map.attack_count(square("e4"), Team.WHITE) == 0
+        assert attack_map.attack_count(square("c6"), Team.BLACK) == 3
+        assert attack_map.hanging_pieces() == []
+
+    def test_sliders_stop_at_the_first_blocker(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, square("a1")))
+        board.add_piece(Piece(PieceType.PAWN, Team.BLACK, square("a5")))
+        attack_map = AttackMapService(board)
+
+        assert attack_map.attacked_squares(square("a1"))[:4] == [square("b1"), square("c1"), square("d1"), square("e1")]
+        assert attack_map.attack_count(square("a5"), Team.WHITE) == 1
+        assert attack_map.attack_count(square("a6"), Team.WHITE) == 0
+        assert attack_map.is_hanging(square("a5"))
+
+    def test_moving_a_blocker_extends_rays(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, square("a1")))
+        board.add_piece(Piece(PieceType.KNIGHT, Team.WHITE, square("a3")))
+        attack_map = AttackMapService(board)
+        board.remove_piece(square("a3"))
+        board.add_piece(Piece(PieceType.KNIGHT, Team.WHITE, square("c4")))
+
+        changed = attack_map.refresh()
+
+        assert attack_map.attack_count(square("a8"), Team.WHITE) == 1
+        assert attack_map.attackers_of(square("a6")) == [square("a1")]
+        assert {square("a3"), square("c4"), square("a4"), square("a8")} <= changed
+        assert square("h1") not in changed
+
+    def test_incremental_updates_match_full_rebuild(self):
+        board, game_state = Board(), GameState()
+        initialize = InitializeGameUseCase(board, game_state)
+        initialize.execute()
+        execute_move = ExecuteMoveUseCase(board, game_state)
+        validator = MoveValidator(board)
+        attack_map = AttackMapService(board)
+        rng = random.Random(7)
+
+        for _ in range(300):
+            if game_state.status != GameStatus.IN_PROGRESS:
+                initialize.execute()
+            piece, target = rng.choice(validator.get_all_valid_moves(game_state.current_turn))
+            execute_move.execute(piece, target)
+            attack_map.refresh()
+            rebuilt = AttackMapService(board)
+
+            assert counts(attack_map) == counts(rebuilt)
+            assert attack_map.hanging_pieces() == rebuilt.hanging_pieces()
+
+    def test_unchanged_board_reports_no_changes(self):
+        board = Board()
+        InitializeGameUseCase(board, GameState()).execute()
+        attack_map = AttackMapService(board)
+
+        assert attack_map.refresh() == set()
+
+
+class TestHeatmapOverlay:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setup_method(self):
+        self.controller = ChessController(Board(), GameState())
+        self.controller.initialize_game()
+        self.widget = ChessBoardWidget(self.controller)
+        self.widget.set_heatmap_enabled(True)
+        self.widget._render_frame()
+        self.updates: list[QRect] = []
+        self.widget.update = lambda *args: self.updates.append(args[0] if args else self.widget.rect())
+
+    def test_move_repaints_only_changed_squares(self):
+        overlay = self.widget._heatmap
+        self.widget._select_piece(self.controller.get_piece_at(square("g1")))
+        self.updates.clear()
+
+        self.widget._execute_move(square("f3"))
+
+        assert self.widget._heatmap is overlay
+        assert all(rect.width() == ChessBoardWidget.DEFAULT_SQUARE_SIZE for rect in self.updates)
+        assert 0 < len({(rect.x(), rect.y()) for rect in self.updates}) < 20
+
+    def test_overlay_tracks_undo(self):
+        self.widget._select_piece(self.controller.get_piece_at(square("e2")))
+        self.widget._execute_move(square("e4"))
+
+        self.widget._navigate_history(self.controller.undo)
+
+        assert counts(self.controller.get_attack_map()) == counts(AttackMapService(self.controller._board))
+
+    def test_toggle_drops_the_overlay(self):
+        self.widget.set_heatmap_enabled(False)
+
+        assert not self.widget.heatmap_enabled
+        assert self.widget._heatmap is None
+        assert self.widget._refresh_heatmap() == []
@@ -0,0 +1,107 @@
+import sys
+
+from PyQt6.QtCore import QRect
+from PyQt6.QtWidgets import QApplication
+
+from src.domain.board import Board
+from src.domain.entities import Position
+from src.domain.game_state import GameState
+from src.presentation.controller import ChessController
+from src.presentation.ui import ChessBoardWidget
+
+
+class TestDirtyRegionRepainting:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setup_method(self):
+        self.controller = ChessController(Board(), GameState())
+        self.controller.initialize_game()
+        self.widget = ChessBoardWidget(self.controller)
+        self.updates: list[QRect] = []
+        self.widget.update = lambda *args: self.updates.append(args[0] if args else self.widget.rect())
+
+    def square_rect(self, square: str) -> QRect:
+        position = Position.from_algebraic(square)
+        size = ChessBoardWidget.DEFAULT_SQUARE_SIZE
+        return QRect(position.col * size, position.row * size, size, size)
+
+    def test_selection_updates_only_affected_squares(self):
+        self.widget._select_piece(self.controller.get_piece_at(Position.from_algebraic("g1")))
+
+        assert sorted(map(str, self.updates)) == sorted(
+            map(str, [self.square_rect(square) for square in ("g1", "f3", "h3")])
+        )
+
+    def test_deselection_repaints_previous_highlights(self):
+        self.widget._select_piece(self.controller.get_piece_at(Position.from_algebraic("e2")))
+        self.updates.clear()
+
+        self.widget._deselect_piece()
+
+        assert len(self.updates) == 3
+        assert all(rect.width() == ChessBoardWidget.DEFAULT_SQUARE_SIZE for rect in self.updates)
+
+    def test_move_emits_state_changed(self):
+        emitted = []
+        self.widget.state_changed.connect(lambda: emitted.append(True))
+        self.widget._select_piece(self.controller.get_piece_at(Position.from_algebraic("e2")))
+        self.updates.clear()
+
+        self.widget._execute_move(Position.from_algebraic("e4"))
+
+        assert emitted == [True]
+        assert len(self.updates) == 3
+
+    def test_squares_in_dirty_rect(self):
+        assert self.widget._squares_in(self.square_rect("b7")) == [Position.from_algebraic("b7")]
+        assert len(self.widget._squares_in(QRect(0, 0, 480, 480))) == 64
+
+    def test_background_is_cached_per_square_size(self):
+        background = self.widget._board_background()
+
+        assert self.widget._board_background() is background
+        self.widget._square_size = 40
+        assert self.widget._board_background() is not background
+
+
+class TestResizeDebouncing:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setup_method(self):
+        self.controller = ChessController(Board(), GameState())
+        self.controller.initialize_game()
+        self.widget = ChessBoardWidget(self.controller)
+        self.widget.show()
+        self.app.processEvents()
+
+    def teardown_method(self):
+        self.widget.close()
+
+    def test_resize_shows_preview_until_settled(self):
+        self.widget.resize(800, 800)
+        self.widget.resize(960, 960)
+
+        assert self.widget.is_resizing
+        assert self.widget._resize_timer.isActive()
+        assert self.widget._square_size == 120
+        assert not self.widget.grab().isNull()
+
+    def test_settling_renders_full_quality_and_warms_sprites(self):
+        self.widget.resize(800, 800)
+        self.widget._resize_timer.stop()
+        self.widget._finish_resize()
+        assert self.widget._background_key != (100, self.widget.devicePixelRatioF())
+        self.app.processEvents()
+
+        renderer = self.controller.get_piece_renderer()
+        rook = self.controller.get_piece_at(Position(0, 0))
+        cached = renderer.cached_sprite_count
+        renderer.sprite(rook.piece_type, rook.team, 100, 100, self.widget.devicePixelRatioF())
+
+        assert not self.widget.is_resizing
+        assert renderer.cached_sprite_count == cached
+        assert self.widget._background_key == (100, self.widget.devicePixelRatioF())
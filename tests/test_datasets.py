@@ -0,0 +1,155 @@
+import json
+
+import numpy as np
+import pytest
+
+from src.domain.board import Board
+from src.domain.entities import Piece
+from src.domain.game_state import GameState, GameStatus
+from src.application.datasets import (
+    export_dataset,
+    game_positions,
+    GameFileSource,
+    MANIFEST_NAME,
+    SelfPlaySource,
+    shard_path,
+    TrainingDataset,
+)
+from src.application.services import MoveValidator
+from src.application.simulation import play_game, run_self_play, SelfPlayConfig
+from src.application.tensors import boards_to_planes
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.domain.encoding import decode_move, TEAMS
+from src.infrastructure.game_records import read_game_records
+
+CONFIG = SelfPlayConfig(games=7, max_plies=30, seed=5)
+
+
+def replay(moves) -> list[Board]:
+    board, game_state = Board(), GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+    positions = []
+    for move in moves:
+        copy = Board()
+        for piece in board.get_all_pieces():
+            copy.add_piece(Piece(piece.piece_type, piece.team, piece.position))
+        positions.append(copy)
+        source, target, _ = decode_move(move)
+        execute_move_use_case.execute(board.get_piece(source), target)
+    return positions
+
+
+class TestExport:
+    def test_writes_shards_and_manifest(self, tmp_path):
+        report = export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+        manifest = json.loads((tmp_path / MANIFEST_NAME).read_text())
+
+        assert report.shards_written == 3
+        assert [shard["games"] for shard in manifest["shards"]] == [3, 3, 1]
+        assert manifest["samples"] == report.samples
+        assert shard_path(tmp_path, 2, "masks").exists()
+        assert not list(tmp_path.glob("*.tmp"))
+
+    def test_dataset_length_matches_total_plies(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+        plies = sum(len(play_game(CONFIG, index).moves) for index in range(CONFIG.games))
+
+        assert len(TrainingDataset(tmp_path)) == plies
+
+    def test_samples_match_replayed_positions(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+        dataset = TrainingDataset(tmp_path)
+        record = play_game(CONFIG, 0)
+        boards = replay(record.moves)
+        expected_planes = boards_to_planes(boards)
+
+        for ply, board in enumerate(boards):
+            sample = dataset[ply]
+            expected_mask = np.zeros((64, 64), dtype=bool)
+            for piece, target in MoveValidator(board).get_all_valid_moves(TEAMS[ply % 2]):
+                expected_mask[piece.position.index, target.index] = True
+
+            assert np.array_equal(sample.planes, expected_planes[ply])
+            assert sample.turn == ply % 2
+            assert sample.move == record.moves[ply]
+            assert np.array_equal(sample.mask, expected_mask)
+
+    def test_result_is_from_white_perspective(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+        dataset = TrainingDataset(tmp_path)
+        offset = 0
+        for index in range(CONFIG.games):
+            record = play_game(CONFIG, index)
+            expected = {GameStatus.WHITE_WON: 1, GameStatus.BLACK_WON: -1}.get(record.status, 0)
+            assert dataset[offset].result == expected
+            assert dataset[offset + len(record.moves) - 1].result == expected
+            offset += len(record.moves)
+
+    def test_game_positions_start_from_initial_board(self):
+        codes, turns = game_positions(play_game(CONFIG, 1).moves)
+        board = Board()
+        InitializeGameUseCase(board, GameState()).execute()
+
+        assert np.array_equal(
+            (codes[:1, None, :] == np.arange(1, 13, dtype=np.uint8)[None, :, None]).astype(np.uint8),
+            boards_to_planes([board]),
+        )
+        assert list(turns[:4]) == [0, 1, 0, 1]
+
+    def test_resume_skips_completed_shards(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+        manifest_path = tmp_path / MANIFEST_NAME
+        manifest = json.loads(manifest_path.read_text())
+        expected = np.load(shard_path(tmp_path, 1, "bitboards"))
+        manifest["shards"] = [shard for shard in manifest["shards"] if shard["index"] != 1]
+        manifest_path.write_text(json.dumps(manifest))
+        shard_path(tmp_path, 1, "bitboards").unlink()
+
+        report = export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+
+        assert report.shards_skipped == 2
+        assert report.shards_written == 1
+        assert np.array_equal(np.load(shard_path(tmp_path, 1, "bitboards")), expected)
+        assert [shard["index"] for shard in TrainingDataset(tmp_path).manifest["shards"]] == [0, 1, 2]
+
+    def test_rejects_different_shard_size_on_resume(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+
+        with pytest.raises(ValueError):
+            export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=4)
+
+    def test_parallel_export_matches_serial_export(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path / "serial", games_per_shard=2)
+        export_dataset(SelfPlaySource(CONFIG), tmp_path / "parallel", games_per_shard=2, workers=2)
+        serial, parallel = TrainingDataset(tmp_path / "serial"), TrainingDataset(tmp_path / "parallel")
+
+        assert len(serial) == len(parallel)
+        for left, right in zip(serial.iter_shards(), parallel.iter_shards()):
+            assert all(np.array_equal(left[name], right[name]) for name in left)
+
+    def test_exports_from_game_record_file(self, tmp_path):
+        games_path = tmp_path / "games.bin"
+        run_self_play(CONFIG, games_path)
+        export_dataset(GameFileSource(str(games_path)), tmp_path / "from-file", games_per_shard=4)
+        export_dataset(SelfPlaySource(CONFIG), tmp_path / "from-play", games_per_shard=4)
+
+        from_file, from_play = TrainingDataset(tmp_path / "from-file"), TrainingDataset(tmp_path / "from-play")
+        assert len(from_file) == len(from_play)
+        assert from_file[len(from_file) - 1].move == from_play[len(from_play) - 1].move
+
+    def test_game_file_source_seeks_to_each_shard(self, tmp_path):
+        games_path = tmp_path / "games.bin"
+        run_self_play(CONFIG, games_path)
+        source = GameFileSource(str(games_path))
+        stored = [(game.status, game.moves) for game in read_game_records(games_path)]
+
+        assert source.count == len(stored)
+        assert source.load(2, 5) == stored[2:5]
+        assert source.load(len(stored) - 1, len(stored) + 3) == stored[-1:]
+        assert source.load(len(stored), len(stored) + 1) == []
+
+    def test_shards_are_memory_mapped(self, tmp_path):
+        export_dataset(SelfPlaySource(CONFIG), tmp_path, games_per_shard=3)
+
+        assert isinstance(TrainingDataset(tmp_path).shard(0)["bitboards"], np.memmap)
@@ -0,0 +1,69 @@
+import sys
+
+from PyQt6.QtGui import QImage
+from PyQt6.QtWidgets import QApplication
+
+from src.domain.board import Board
+from src.domain.game_state import GameState
+from src.application.diagrams import DiagramRenderer, read_positions, render_diagrams
+from src.application.rendering import DARK_SQUARE_COLOR, LIGHT_SQUARE_COLOR
+from src.application.usecases import InitializeGameUseCase
+from src.infrastructure.fen import STARTING_FEN
+from src.infrastructure.repositories import BoardRepository
+from src.infrastructure.snapshots import save_snapshots
+
+EMPTY_FEN = "4k3/8/8/8/8/8/8/4K3 w - - 0 1"
+
+
+class TestDiagramRenderer:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_renders_board_of_requested_size(self):
+        image = DiagramRenderer(square_size=30).render_position(EMPTY_FEN)
+
+        assert image.width() == image.height() == 240
+        assert image.pixelColor(15, 15) == LIGHT_SQUARE_COLOR
+        assert image.pixelColor(45, 15) == DARK_SQUARE_COLOR
+
+    def test_canvas_is_reused_and_cleared_between_positions(self):
+        renderer = DiagramRenderer(square_size=30)
+        full = QImage(renderer.render_position(STARTING_FEN))
+        sparse = QImage(renderer.render_position(EMPTY_FEN))
+
+        assert full != sparse
+        assert renderer.render_position(STARTING_FEN) == full
+        assert renderer.piece_renderer.cached_sprite_count == 12
+
+    def test_snapshot_positions_match_fen_positions(self):
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        snapshot = BoardRepository(board).snapshot(game_state)
+        renderer = DiagramRenderer(square_size=30)
+
+        assert QImage(renderer.render_position(snapshot)) == renderer.render_position(STARTING_FEN)
+
+
+class TestBatchRendering:
+    def test_reads_fen_and_snapshot_files(self, tmp_path):
+        fen_path = tmp_path / "positions.fen"
+        fen_path.write_text(f"{STARTING_FEN}\n\n{EMPTY_FEN}\n")
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        snapshot_path = tmp_path / "positions.bin"
+        save_snapshots(snapshot_path, [BoardRepository(board).snapshot(game_state)] * 3)
+
+        assert list(read_positions(fen_path)) == [STARTING_FEN, EMPTY_FEN]
+        assert len(list(read_positions(snapshot_path))) == 3
+
+    def test_worker_pool_writes_one_png_per_position(self, tmp_path):
+        positions = [STARTING_FEN, EMPTY_FEN] * 5
+
+        report = render_diagrams(positions, tmp_path / "out", square_size=20, workers=2, chunk_size=3)
+
+        assert report.positions == 10
+        files = sorted((tmp_path / "out").glob("*.png"))
+        assert [file.name for file in files[:2]] == ["000000.png", "000001.png"]
+        assert len(files) == 10
+        assert QImage(str(files[1])).width() == 160
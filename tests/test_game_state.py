@@ -2,8 +2,8 @@ import pytest
 from src.domain.entities import Piece, PieceType, Team, Position
 from src.domain.board import Board
 from src.domain.game_state import GameState, GameStatus
-from src.application.services import PawnPromotionService, KingCheckService
-from src.application.usecases import ExecuteMoveUseCase
+from src.application.services import PawnPromotionService, KingCheckService, DrawDetectionService
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
 
 
 class TestGameState:
@@ -195,3 +195,128 @@ class TestExecuteMoveWithTurns:
         
         assert moved is not None
         assert status == GameStatus.WHITE_WON
+
+
+class TestPositionHistory:
+    def test_repetition_count_tracks_recorded_positions(self):
+        game_state = GameState()
+        for key in (1, 2, 1, 2, 1):
+            game_state.record_position(key)
+
+        assert game_state.repetition_count == 3
+        assert game_state.is_threefold_repetition
+
+    def test_irreversible_position_resets_window(self):
+        game_state = GameState()
+        game_state.record_position(1)
+        game_state.record_position(2)
+        game_state.record_position(1, irreversible=True)
+
+        assert game_state.halfmove_clock == 0
+        assert game_state.repetition_count == 1
+
+    def test_unrecord_restores_previous_window(self):
+        game_state = GameState()
+        game_state.record_position(1)
+        game_state.record_position(2)
+        game_state.record_position(1)
+        game_state.record_position(3, irreversible=True)
+
+        game_state.unrecord_position()
+
+        assert game_state.halfmove_clock == 2
+        assert game_state.repetition_count == 2
+
+    def test_history_without_undo_keeps_only_the_current_window(self):
+        game_state = GameState(keep_history=False)
+        for key in (1, 2, 1, 2):
+            game_state.record_position(key)
+        game_state.record_position(3, irreversible=True)
+        for key in (4, 3, 4, 3):
+            game_state.record_position(key)
+
+        assert game_state._position_history == [3, 4, 3, 4, 3]
+        assert game_state.halfmove_clock == 4
+        assert game_state.is_threefold_repetition
+
+    def test_fifty_move_rule(self):
+        game_state = GameState()
+        for key in range(GameState.FIFTY_MOVE_HALFMOVES + 1):
+            game_state.record_position(key)
+
+        assert game_state.is_fifty_move_rule
+
+
+class TestBoardHashing:
+    def test_hash_is_restored_after_move_and_back(self):
+        board = Board()
+        knight = Piece(PieceType.KNIGHT, Team.WHITE, Position(7, 1))
+        board.add_piece(knight)
+        initial_hash = board.zobrist_hash
+
+        board.remove_piece(Position(7, 1))
+        board.add_piece(Piece(PieceType.KNIGHT, Team.WHITE, Position(5, 2)))
+        assert board.zobrist_hash != initial_hash
+
+        board.remove_piece(Position(5, 2))
+        board.add_piece(knight)
+        assert board.zobrist_hash == initial_hash
+
+    def test_position_key_depends_on_turn(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.KING, Team.WHITE, Position(7, 4)))
+
+        assert board.position_key(Team.WHITE) != board.position_key(Team.BLACK)
+
+    def test_replacing_piece_updates_material(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, Position(0, 0)))
+        board.add_piece(Piece(PieceType.QUEEN, Team.BLACK, Position(0, 0)))
+
+        assert board.piece_count(PieceType.ROOK) == 0
+        assert board.piece_count(PieceType.QUEEN, Team.BLACK) == 1
+
+
+class TestDrawDetection:
+    def _board_with_kings(self) -> Board:
+        board = Board()
+        board.add_piece(Piece(PieceType.KING, Team.WHITE, Position(7, 4)))
+        board.add_piece(Piece(PieceType.KING, Team.BLACK, Position(0, 4)))
+        return board
+
+    def test_kings_only_is_insufficient(self):
+        board = self._board_with_kings()
+
+        assert DrawDetectionService(board, GameState()).is_insufficient_material()
+
+    def test_same_colored_bishops_are_insufficient(self):
+        board = self._board_with_kings()
+        board.add_piece(Piece(PieceType.BISHOP, Team.WHITE, Position(7, 2)))
+        board.add_piece(Piece(PieceType.BISHOP, Team.BLACK, Position(0, 5)))
+
+        assert DrawDetectionService(board, GameState()).is_insufficient_material()
+
+    def test_rook_is_sufficient(self):
+        board = self._board_with_kings()
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, Position(7, 0)))
+
+        assert not DrawDetectionService(board, GameState()).is_insufficient_material()
+
+    def test_knight_shuffle_draws_by_threefold_repetition(self):
+        board = Board()
+        game_state = GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        executor = ExecuteMoveUseCase(board, game_state)
+        shuffle = [
+            (Position(7, 6), Position(5, 5)),
+            (Position(0, 6), Position(2, 5)),
+            (Position(5, 5), Position(7, 6)),
+            (Position(2, 5), Position(0, 6)),
+        ]
+
+        for _ in range(2):
+            for source, target in shuffle:
+                executor.execute(board.get_piece(source), target)
+
+        assert game_state.status == GameStatus.DRAW
+
@@ -0,0 +1,37 @@
+import subprocess
+import sys
+from pathlib import Path
+
+
+PROJECT_ROOT = Path(__file__).resolve().parent.parent
+
+
+class TestHeadlessCore:
+    def test_core_layers_import_without_qt(self):
+        script = (
+            "import sys\n"
+            "import src.domain.board, src.domain.game_state\n"
+            "import src.infrastructure.repositories, src.infrastructure.factories\n"
+            "import src.application.usecases, src.application.simulation\n"
+            "import src.presentation.controller\n"
+            "assert not any(name.startswith('PyQt6') for name in sys.modules)\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, check=True)
+
+    def test_application_services_do_not_import_infrastructure(self):
+        script = (
+            "import sys\n"
+            "import src.application.services\n"
+            "assert not any(name.startswith('src.infrastructure') for name in sys.modules)\n"
+        )
+
+        subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, check=True)
+
+    def test_renderer_loads_lazily(self):
+        from src.domain.board import Board
+        from src.application.usecases import RenderBoardUseCase
+
+        use_case = RenderBoardUseCase(Board())
+
+        assert use_case.get_renderer() is use_case.get_renderer()
@@ -0,0 +1,110 @@
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Team, Position
+from src.domain.game_state import GameState, GameStatus
+from src.application.services import UndoRedoService
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.domain.encoding import (
+    decode_move,
+    decode_undo_record,
+    encode_move,
+    encode_undo_record,
+    UndoRecord,
+)
+from src.infrastructure.repositories import MoveHistoryRepository
+
+
+class TestMoveEncoding:
+    def test_move_round_trip(self):
+        code = encode_move(Position(6, 4), Position(4, 4))
+        assert code < 2 ** 16
+        assert decode_move(code) == (Position(6, 4), Position(4, 4), None)
+
+    def test_promotion_round_trip(self):
+        code = encode_move(Position(1, 0), Position(0, 0), PieceType.QUEEN)
+        assert decode_move(code) == (Position(1, 0), Position(0, 0), PieceType.QUEEN)
+
+    def test_undo_record_round_trip(self):
+        record = UndoRecord(
+            (PieceType.KING, Team.BLACK), GameStatus.IN_PROGRESS, GameStatus.WHITE_WON, False
+        )
+        assert decode_undo_record(encode_undo_record(record)) == record
+
+
+class TestMoveHistoryRepository:
+    def test_step_back_and_forward(self):
+        history = MoveHistoryRepository()
+        history.append(1, 10)
+        history.append(2, 20)
+
+        assert history.step_back() == (2, 20)
+        assert history.step_forward() == (2, 20)
+        assert history.step_forward() is None
+
+    def test_append_after_undo_truncates_redo(self):
+        history = MoveHistoryRepository()
+        history.append(1, 10)
+        history.append(2, 20)
+        history.step_back()
+        history.append(3, 30)
+
+        assert not history.can_redo()
+        assert list(history.get_moves()) == [1, 3]
+
+
+class TestUndoRedoService:
+    def setup_method(self):
+        self.board = Board()
+        self.game_state = GameState()
+        self.service = UndoRedoService(self.board, self.game_state, MoveHistoryRepository())
+        self.executor = ExecuteMoveUseCase(self.board, self.game_state, self.service)
+
+    def test_undo_restores_captured_piece_and_turn(self):
+        white_rook = Piece(PieceType.ROOK, Team.WHITE, Position(4, 0))
+        black_knight = Piece(PieceType.KNIGHT, Team.BLACK, Position(0, 0))
+        self.board.add_piece(white_rook)
+        self.board.add_piece(black_knight)
+
+        self.executor.execute(white_rook, Position(0, 0))
+
+        assert self.service.undo()
+        assert self.board.get_piece(Position(4, 0)) == white_rook
+        assert self.board.get_piece(Position(0, 0)) == black_knight
+        assert self.game_state.current_turn == Team.WHITE
+        assert self.game_state.move_count == 0
+
+    def test_undo_reverts_promotion(self):
+        pawn = Piece(PieceType.PAWN, Team.WHITE, Position(1, 0))
+        self.board.add_piece(pawn)
+
+        self.executor.execute(pawn, Position(0, 0))
+        self.service.undo()
+
+        assert self.board.get_piece(Position(1, 0)) == pawn
+        assert self.board.get_piece(Position(0, 0)) is None
+
+    def test_undo_restores_status_after_king_capture(self):
+        pawn = Piece(PieceType.PAWN, Team.WHITE, Position(1, 1))
+        self.board.add_piece(pawn)
+        self.board.add_piece(Piece(PieceType.KING, Team.BLACK, Position(0, 0)))
+
+        self.executor.execute(pawn, Position(0, 0))
+        assert self.game_state.status == GameStatus.WHITE_WON
+
+        self.service.undo()
+        assert self.game_state.status == GameStatus.IN_PROGRESS
+        assert self.game_state.current_turn == Team.WHITE
+
+    def test_redo_reapplies_move(self):
+        InitializeGameUseCase(self.board, self.game_state).execute()
+        pawn = self.board.get_piece(Position(6, 4))
+        self.executor.execute(pawn, Position(4, 4))
+        self.service.undo()
+
+        assert self.service.redo()
+        assert self.board.get_piece(Position(4, 4)) == Piece(PieceType.PAWN, Team.WHITE, Position(4, 4))
+        assert self.board.get_piece(Position(6, 4)) is None
+        assert self.game_state.current_turn == Team.BLACK
+        assert not self.service.redo()
+
+    def test_undo_on_empty_history_returns_false(self):
+        assert not self.service.undo()
@@ -0,0 +1,58 @@
+import json
+
+from src.application.instrumentation import Instrumentation
+
+
+class TestInstrumentation:
+    def test_disabled_decorators_return_original_function(self):
+        metrics = Instrumentation(enabled=False)
+
+        def work():
+            return 42
+
+        assert metrics.timed("work")(work) is work
+        assert metrics.counted("work")(work) is work
+        assert metrics.snapshot() == {"counters": {}, "timers": {}}
+
+    def test_timed_records_calls(self):
+        metrics = Instrumentation(enabled=True)
+        work = metrics.timed("work")(lambda value: value * 2)
+
+        assert work(3) == 6
+        work(4)
+
+        timer = metrics.snapshot()["timers"]["work"]
+        assert timer["count"] == 2
+        assert timer["total_seconds"] >= timer["max_seconds"] >= 0
+
+    def test_counted_and_increment(self):
+        metrics = Instrumentation(enabled=True)
+        lookup = metrics.counted("lookup")(lambda: None)
+
+        lookup()
+        lookup()
+        metrics.increment("lookup", 3)
+
+        assert metrics.snapshot()["counters"]["lookup"] == 5
+
+    def test_reset_keeps_registered_names(self):
+        metrics = Instrumentation(enabled=True)
+        work = metrics.timed("work")(lambda: None)
+        work()
+
+        metrics.reset()
+        work()
+
+        assert metrics.snapshot()["timers"]["work"]["count"] == 1
+
+    def test_exports(self, tmp_path):
+        metrics = Instrumentation(enabled=True)
+        metrics.timed("move_validator.get_valid_moves.pawn")(lambda: None)()
+        metrics.increment("board_query.get_piece_at")
+
+        prometheus = metrics.to_prometheus()
+        assert 'chess_calls_total{name="move_validator.get_valid_moves.pawn"} 1' in prometheus
+        assert 'chess_events_total{name="board_query.get_piece_at"} 1' in prometheus
+
+        metrics.write(tmp_path / "metrics.json")
+        assert json.loads((tmp_path / "metrics.json").read_text())["counters"]["board_query.get_piece_at"] == 1
@@ -0,0 +1,173 @@
+import json
+
+import pytest
+
+from src.domain.entities import Position, PieceType, Team
+from src.infrastructure.move_journal import JournalEntry, JournalEntryKind, MoveJournal, read_journal, recover_games
+from src.application.timers import NANOSECONDS, TimeControl
+from src.domain.encoding import encode_move
+from src.presentation.server import GameServer
+
+
+class FakeConnection:
+    def __init__(self):
+        self.games = set()
+        self.spectating = set()
+        self.messages = []
+
+    def send(self, message: dict) -> None:
+        self.messages.append(message)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000 * NANOSECONDS
+
+    def __call__(self) -> int:
+        return self.now
+
+
+def send(server: GameServer, connection: FakeConnection, **message) -> dict:
+    server.handle_message(connection, json.dumps(message).encode())
+    return connection.messages[-1]
+
+
+class TestMoveJournal:
+    def test_records_round_trip(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        with MoveJournal(path) as journal:
+            journal.record_create(7)
+            journal.record_move(7, 1234, 299_500)
+            journal.record_close(7)
+
+        entries = list(read_journal(path))
+        assert [entry.kind for entry in entries] == [
+            JournalEntryKind.CREATE, JournalEntryKind.MOVE, JournalEntryKind.CLOSE
+        ]
+        assert entries[1].game_id == 7
+        assert entries[1].move == 1234
+        assert entries[1].clock_ms == 299_500
+
+    def test_fsync_is_batched_by_count(self, tmp_path):
+        journal = MoveJournal(tmp_path / "moves.journal", sync_interval=60, sync_every=10)
+        for move in range(25):
+            journal.record_move(1, move)
+
+        assert journal.sync_count == 2
+        assert journal.pending == 5
+        journal.close()
+        assert journal.sync_count == 3
+
+    def test_recovery_drops_closed_games(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        with MoveJournal(path) as journal:
+            journal.record_create(1)
+            journal.record_create(2)
+            journal.record_move(1, 10)
+            journal.record_move(2, 20)
+            journal.record_close(2)
+
+        assert recover_games(path) == {1: [JournalEntry(JournalEntryKind.MOVE, 1, 10)]}
+
+    def test_torn_tail_is_ignored_and_truncated(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        with MoveJournal(path) as journal:
+            journal.record_create(1)
+            journal.record_move(1, 10)
+        with path.open("ab") as stream:
+            stream.write(b"\x01\x00\x00")
+
+        assert [entry.move for entry in recover_games(path)[1]] == [10]
+        with MoveJournal(path) as journal:
+            journal.record_move(1, 11)
+        assert [entry.move for entry in recover_games(path)[1]] == [10, 11]
+
+    def test_rejects_foreign_file(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        path.write_bytes(b"nope")
+
+        with pytest.raises(ValueError):
+            recover_games(path)
+
+
+class TestServerRecovery:
+    def test_server_games_are_rebuilt_from_journal(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        server = GameServer(journal=MoveJournal(path))
+        white, black = FakeConnection(), FakeConnection()
+        game_id = send(server, white, type="create")["game"]
+        send(server, black, type="join", game=game_id)
+        for source, target, player in [("e2", "e4", white), ("e7", "e5", black), ("g1", "f3", white)]:
+            send(server, player, type="move", game=game_id, **{"from": source, "to": target})
+        server._journal.close()
+
+        recovered = GameServer()
+        recovered.restore_games(recover_games(path))
+
+        session = recovered.get_session(game_id)
+        original = server.get_session(game_id)
+        assert session.board.zobrist_hash == original.board.zobrist_hash
+        assert session.game_state.current_turn == Team.BLACK
+        assert session.board.get_piece(Position.from_algebraic("f3")).piece_type == PieceType.KNIGHT
+
+        player = FakeConnection()
+        send(recovered, player, type="join", game=game_id)
+        assert player.messages[0] == {"type": "joined", "game": game_id, "team": Team.WHITE.value}
+        assert send(recovered, FakeConnection(), type="create")["game"] == game_id + 1
+
+    def test_timed_games_are_replayed_with_their_clocks(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        clock = FakeClock()
+        server = GameServer(journal=MoveJournal(path), time_control=TimeControl(300, 0), clock=clock)
+        white, black = FakeConnection(), FakeConnection()
+        game_id = send(server, white, type="create")["game"]
+        send(server, black, type="join", game=game_id)
+        send(server, white, type="move", game=game_id, **{"from": "e2", "to": "e4"})
+        clock.now += 7 * NANOSECONDS
+        send(server, black, type="move", game=game_id, **{"from": "e7", "to": "e5"})
+        clock.now += 2 * NANOSECONDS
+        send(server, white, type="move", game=game_id, **{"from": "g1", "to": "f3"})
+        server._journal.close()
+
+        entries = recover_games(path)[game_id]
+        assert [entry.clock_ms for entry in entries] == [300_000, 293_000, 298_000]
+        clock.now += 60 * NANOSECONDS
+        recovered = GameServer(time_control=TimeControl(300, 0), clock=clock)
+        recovered.restore_games({game_id: entries})
+
+        timer = recovered.get_session(game_id).timer
+        assert timer.running_team == Team.BLACK
+        assert timer.remaining(Team.WHITE) == 298 * NANOSECONDS
+        assert timer.remaining(Team.BLACK) == 293 * NANOSECONDS
+        assert recovered.running_clock_count == 1
+
+    def test_replay_skips_move_validation(self, tmp_path):
+        e2, e5 = Position.from_algebraic("e2"), Position.from_algebraic("e5")
+        server = GameServer()
+
+        server.restore_games({3: [JournalEntry(JournalEntryKind.MOVE, 3, encode_move(e2, e5))]})
+
+        session = server.get_session(3)
+        assert session.board.get_piece(e5).piece_type == PieceType.PAWN
+        assert session.game_state.current_turn == Team.BLACK
+        assert session.game_state.halfmove_clock == 0
+
+    def test_moves_are_acknowledged_only_after_commit(self, tmp_path):
+        path = tmp_path / "moves.journal"
+        server = GameServer(journal=MoveJournal(path, sync_interval=60))
+        white, black = FakeConnection(), FakeConnection()
+        game_id = send(server, white, type="create")["game"]
+        send(server, black, type="join", game=game_id)
+
+        send(server, white, type="move", game=game_id, **{"from": "e2", "to": "e4"})
+
+        assert white.messages[-1]["type"] == "state"
+        assert server.uncommitted_ack_count == 1
+        assert recover_games(path) == {}
+
+        server.commit_journal()
+
+        assert white.messages[-1]["type"] == black.messages[-1]["type"] == "moved"
+        assert server.uncommitted_ack_count == 0
+        assert len(recover_games(path)[game_id]) == 1
+        server._journal.close()
@@ -0,0 +1,93 @@
+import random
+
+from src.domain.board import Board
+from src.domain.entities import Piece, Position, PieceType, Team
+from src.domain.game_state import GameState, GameStatus
+from src.domain.persistent_board import PersistentBoard
+from src.application.services import MoveValidator
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+
+
+def starting_board() -> tuple[Board, GameState]:
+    board = Board()
+    game_state = GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    return board, game_state
+
+
+def move_set(validator: MoveValidator, team: Team) -> set[tuple[Position, Position]]:
+    return {(piece.position, target) for piece, target in validator.get_all_valid_moves(team)}
+
+
+class TestPersistentBoard:
+    def test_move_returns_new_board_and_leaves_parent_untouched(self):
+        parent = PersistentBoard.from_board(starting_board()[0])
+        pawn = parent.get_piece(Position.from_algebraic("e2"))
+
+        child = parent.move(pawn, Position.from_algebraic("e4"))
+
+        assert parent.get_piece(Position.from_algebraic("e2")) is pawn
+        assert parent.get_piece(Position.from_algebraic("e4")) is None
+        assert child.get_piece(Position.from_algebraic("e2")) is None
+        assert child.get_piece(Position.from_algebraic("e4")).piece_type == PieceType.PAWN
+
+    def test_source_board_pieces_are_not_shared(self):
+        board = starting_board()[0]
+        persistent = PersistentBoard.from_board(board)
+        e2 = Position.from_algebraic("e2")
+
+        board.get_piece(e2).position = Position.from_algebraic("e4")
+
+        assert persistent.get_piece(e2) is not board.get_piece(e2)
+        assert persistent.get_piece(e2).position == e2
+
+    def test_unchanged_ranks_are_shared(self):
+        parent = PersistentBoard.from_board(starting_board()[0])
+        knight = parent.get_piece(Position.from_algebraic("g1"))
+
+        child = parent.move(knight, Position.from_algebraic("f3"))
+
+        assert sum(child.rank(row) is parent.rank(row) for row in range(8)) == 6
+
+    def test_siblings_are_independent(self):
+        parent = PersistentBoard.from_board(starting_board()[0])
+        pawn = parent.get_piece(Position.from_algebraic("d2"))
+
+        first = parent.move(pawn, Position.from_algebraic("d3"))
+        second = parent.move(pawn, Position.from_algebraic("d4"))
+
+        assert first.get_piece(Position.from_algebraic("d4")) is None
+        assert second.get_piece(Position.from_algebraic("d3")) is None
+        assert first.zobrist_hash != second.zobrist_hash
+
+    def test_promotion_and_material_counts(self):
+        board = PersistentBoard().with_piece(Piece(PieceType.PAWN, Team.WHITE, Position(1, 0)))
+
+        promoted = board.move(board.get_piece(Position(1, 0)), Position(0, 0), PieceType.QUEEN)
+
+        assert promoted.piece_count(PieceType.PAWN) == 0
+        assert promoted.piece_count(PieceType.QUEEN, Team.WHITE) == 1
+        assert board.piece_count(PieceType.PAWN, Team.WHITE) == 1
+
+    def test_matches_mutable_board_over_random_game(self):
+        board, game_state = starting_board()
+        execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+        persistent = PersistentBoard.from_board(board)
+        rng = random.Random(5)
+
+        for _ in range(80):
+            if game_state.status != GameStatus.IN_PROGRESS:
+                break
+            team = game_state.current_turn
+            assert move_set(MoveValidator(persistent), team) == move_set(MoveValidator(board), team)
+
+            piece, target = rng.choice(MoveValidator(board).get_all_valid_moves(team))
+            moved_piece, _ = execute_move_use_case.execute(piece, target)
+            promotion = moved_piece.piece_type if moved_piece.piece_type != piece.piece_type else None
+            persistent = persistent.move(persistent.get_piece(piece.position), target, promotion)
+
+            assert persistent.zobrist_hash == board.zobrist_hash
+            assert persistent.bishop_square_colors() == board.bishop_square_colors()
+            assert persistent.piece_count(PieceType.PAWN) == board.piece_count(PieceType.PAWN)
+
+        assert persistent.to_board().zobrist_hash == board.zobrist_hash
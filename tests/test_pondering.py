@@ -0,0 +1,224 @@
+import sys
+import time
+
+from PyQt6.QtWidgets import QApplication
+
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.pondering import ComputerPlayer
+from src.application.search import MiniMaxService, SearchLimits, SearchResult, TranspositionEntry
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.presentation.controller import ChessController
+from src.presentation.ui import ChessBoardWidget
+
+LIMITS = SearchLimits(depth=2)
+
+
+def computer_game(team: Team = Team.BLACK, limits: SearchLimits = LIMITS) -> tuple[ChessController, Board, ComputerPlayer]:
+    board, game_state = Board(), GameState()
+    computer = ComputerPlayer(team, limits)
+    controller = ChessController(board, game_state, computer)
+    controller.initialize_game()
+    return controller, board, computer
+
+
+def play(controller: ChessController, board: Board, source: Position, target: Position):
+    return controller.move_piece(board.get_piece(source), target)
+
+
+class TestTranspositionGenerations:
+    def test_each_search_starts_a_new_generation(self):
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        service = MiniMaxService(board)
+        service.search(Team.WHITE, SearchLimits(depth=1))
+        service.search(Team.WHITE, SearchLimits(depth=1))
+
+        assert service.generation == 2
+
+    def test_overflow_discards_stale_generations_first(self):
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        service = MiniMaxService(board)
+        service.MAX_TRANSPOSITIONS = 10
+        for key in range(10):
+            service._transpositions[key] = TranspositionEntry(1, 0, MiniMaxService.EXACT, None, generation=key % 3)
+        service._generation = 2
+
+        service._store(99, TranspositionEntry(1, 0, MiniMaxService.EXACT, None, generation=2))
+
+        assert all(entry.generation >= 1 for entry in service._transpositions.values())
+        assert 99 in service._transpositions
+        assert service.transposition_count == 7
+
+    def test_overflow_with_only_current_entries_clears_table(self):
+        board = Board()
+        service = MiniMaxService(board)
+        service.MAX_TRANSPOSITIONS = 4
+        for key in range(4):
+            service._transpositions[key] = TranspositionEntry(1, 0, MiniMaxService.EXACT, None)
+
+        service._store(99, TranspositionEntry(1, 0, MiniMaxService.EXACT, None))
+
+        assert list(service._transpositions) == [99]
+
+
+class TestComputerOpponent:
+    def test_computer_replies_through_move_piece(self):
+        controller, board, computer = computer_game()
+        moved_piece, status = play(controller, board, Position(6, 4), Position(4, 4))
+
+        assert moved_piece is not None
+        assert status == GameStatus.IN_PROGRESS
+        assert controller.get_current_turn() == Team.WHITE
+        source, target = controller.get_last_computer_move()
+        assert board.get_piece(target).team == Team.BLACK
+        assert board.get_piece(source) is None
+        controller.shutdown()
+
+    def test_computer_starts_when_playing_white(self):
+        controller, board, computer = computer_game(Team.WHITE)
+
+        assert controller.get_current_turn() == Team.BLACK
+        assert controller.get_last_computer_move() is not None
+        controller.shutdown()
+
+    def test_predicted_reply_is_a_ponder_hit(self):
+        controller, board, computer = computer_game()
+        play(controller, board, Position(6, 4), Position(4, 4))
+        assert computer.is_pondering
+        source, target = computer.ponder_move
+
+        play(controller, board, source, target)
+
+        assert computer.ponder_hits == 1
+        assert computer.ponder_misses == 0
+        assert controller.get_current_turn() == Team.WHITE
+        controller.shutdown()
+
+    def test_unexpected_reply_is_a_ponder_miss(self):
+        controller, board, computer = computer_game()
+        play(controller, board, Position(6, 4), Position(4, 4))
+        predicted = computer.ponder_move
+        source, target = next(
+            (piece.position, target)
+            for piece in board.get_pieces_by_team(Team.WHITE)
+            for target in controller.get_valid_moves(piece)
+            if (piece.position, target) != predicted
+        )
+
+        play(controller, board, source, target)
+
+        assert computer.ponder_misses == 1
+        assert controller.get_current_turn() == Team.WHITE
+        controller.shutdown()
+
+    def test_ponder_hit_reuses_search_work(self):
+        controller, board, computer = computer_game(limits=SearchLimits(depth=3))
+        play(controller, board, Position(6, 4), Position(4, 4))
+        source, target = computer.ponder_move
+        computer._ponder_thread.join()
+        pondered = computer._ponder_result
+
+        play(controller, board, source, target)
+
+        assert controller.get_last_computer_move() == pondered.move
+        controller.shutdown()
+
+    def test_pondering_does_not_touch_live_board(self):
+        controller, board, computer = computer_game()
+        play(controller, board, Position(6, 4), Position(4, 4))
+        pieces = sorted((piece.position.index, piece.piece_type.value) for piece in board.get_all_pieces())
+        computer._ponder_thread.join()
+
+        assert sorted((piece.position.index, piece.piece_type.value) for piece in board.get_all_pieces()) == pieces
+        controller.shutdown()
+
+    def test_undo_takes_back_both_plies_and_stops_pondering(self):
+        controller, board, computer = computer_game()
+        play(controller, board, Position(6, 4), Position(4, 4))
+
+        assert controller.undo()
+        assert not computer.is_pondering
+        assert controller.get_current_turn() == Team.WHITE
+        assert board.get_piece(Position(6, 4)) is not None
+        assert controller.redo()
+        assert controller.get_current_turn() == Team.WHITE
+        assert board.get_piece(Position(4, 4)) is not None
+
+    def test_game_ending_move_stops_pondering(self):
+        controller, board, computer = computer_game()
+        play(controller, board, Position(6, 4), Position(4, 4))
+        thread = computer._ponder_thread
+        assert thread is not None
+        board.add_piece(Piece(PieceType.QUEEN, Team.WHITE, Position(1, 4)))
+
+        moved_piece, status = play(controller, board, Position(1, 4), Position(0, 4))
+
+        assert moved_piece is not None
+        assert status == GameStatus.WHITE_WON
+        assert not computer.is_pondering
+        assert not thread.is_alive()
+        controller.shutdown()
+
+    def test_ponder_hit_with_depth_only_limits_is_bounded(self):
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        execute_move = ExecuteMoveUseCase(board, game_state)
+        computer = ComputerPlayer(Team.WHITE, SearchLimits(depth=64))
+        computer.PONDER_HIT_SECONDS = 0.2
+        e2, e4, e7, e5 = (Position.from_algebraic(name) for name in ("e2", "e4", "e7", "e5"))
+        execute_move.execute(board.get_piece(e2), e4)
+        assert computer.start_pondering(board, game_state, SearchResult((e2, e4), 0, 1, 1, 0.0, [(e2, e4), (e7, e5)]))
+        execute_move.execute(board.get_piece(e7), e5)
+
+        started = time.perf_counter()
+        result = computer.choose_move(board, game_state)
+
+        assert computer.ponder_hits == 1
+        assert result.move is not None
+        assert time.perf_counter() - started < 2.0
+
+
+class TestComputerWorker:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def setup_method(self):
+        self.board, game_state = Board(), GameState()
+        self.computer = ComputerPlayer(Team.BLACK, SearchLimits(depth=3))
+        self.controller = ChessController(self.board, game_state, self.computer, auto_reply=False)
+        self.controller.initialize_game()
+        self.widget = ChessBoardWidget(self.controller)
+
+    def teardown_method(self):
+        self.widget.wait_for_computer()
+        self.controller.shutdown()
+
+    def test_human_move_returns_before_the_computer_replies(self):
+        self.widget._select_piece(self.controller.get_piece_at(Position.from_algebraic("e2")))
+        self.widget._execute_move(Position.from_algebraic("e4"))
+
+        assert self.controller.get_current_turn() == Team.BLACK
+        assert self.controller.is_computer_thinking
+        assert not self.controller.undo()
+        self.widget.wait_for_computer()
+        self.app.processEvents()
+
+        assert not self.widget.is_computer_thinking
+        assert self.controller.get_current_turn() == Team.WHITE
+        assert self.controller.get_last_computer_move() is not None
+        assert self.computer.is_pondering
+
+    def test_worker_search_does_not_touch_live_board(self):
+        self.widget._select_piece(self.controller.get_piece_at(Position.from_algebraic("d2")))
+        self.widget._execute_move(Position.from_algebraic("d4"))
+        pieces = {piece.position for piece in self.board.get_all_pieces()}
+
+        self.widget.wait_for_computer()
+
+        assert {piece.position for piece in self.board.get_all_pieces()} == pieces
+        self.app.processEvents()
+        assert self.controller.get_current_turn() == Team.WHITE
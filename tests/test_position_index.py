@@ -0,0 +1,125 @@
+from collections import defaultdict
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Position, Team
+from src.domain.game_state import GameState
+from src.application.simulation import run_self_play, SelfPlayConfig
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.domain.encoding import decode_move
+from src.infrastructure.game_records import read_game_records
+from src.infrastructure.position_index import (
+    format_material,
+    material_key,
+    parse_material,
+    pawn_structure_key,
+    PositionIndex,
+    PositionMatch,
+)
+from src.infrastructure.position_index_repository import PositionIndexRepository
+
+
+@pytest.fixture(scope="module")
+def indexed_games(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("games")
+    run_self_play(SelfPlayConfig(games=30, max_plies=200, seed=9), directory / "games.bin")
+    repository = PositionIndexRepository.build(directory / "games.bin", directory / "games.idx")
+    return repository, replay_scan(directory / "games.bin")
+
+
+def replay_scan(path) -> tuple[dict[int, set[PositionMatch]], dict[int, set[PositionMatch]]]:
+    material, pawns = defaultdict(set), defaultdict(set)
+    for game in read_game_records(path):
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+        execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+        seen_material, seen_pawns = set(), set()
+        for ply in range(len(game.moves) + 1):
+            key = material_key(board)
+            if key not in seen_material:
+                seen_material.add(key)
+                material[key].add(PositionMatch(game.index, ply))
+            key = pawn_structure_key(board)
+            if key not in seen_pawns:
+                seen_pawns.add(key)
+                pawns[key].add(PositionMatch(game.index, ply))
+            if ply < len(game.moves):
+                source, target, _ = decode_move(game.moves[ply])
+                execute_move_use_case.execute(board.get_piece(source), target)
+    return material, pawns
+
+
+class TestMaterialSignature:
+    def test_parse_and_format_round_trip(self):
+        assert format_material(parse_material("KRPvKR")) == "KRPvKR"
+        assert parse_material("krp vs kr") == parse_material("KRPvKR")
+
+    def test_signature_matches_board_material(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.KING, Team.WHITE, Position(7, 4)))
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, Position(7, 0)))
+        board.add_piece(Piece(PieceType.PAWN, Team.WHITE, Position(6, 0)))
+        board.add_piece(Piece(PieceType.KING, Team.BLACK, Position(0, 4)))
+        board.add_piece(Piece(PieceType.ROOK, Team.BLACK, Position(0, 0)))
+
+        assert material_key(board) == parse_material("KRPvKR")
+
+    def test_rejects_malformed_signatures(self):
+        for signature in ("KRP", "RPvKR", "KXvK"):
+            with pytest.raises(ValueError):
+                parse_material(signature)
+
+
+class TestPositionIndex:
+    def test_material_postings_match_replay(self, indexed_games):
+        repository, (material, _) = indexed_games
+
+        for key, expected in material.items():
+            assert set(repository.find_by_material(format_material(key))) == expected
+
+    def test_pawn_postings_match_replay(self, indexed_games):
+        repository, (_, pawns) = indexed_games
+        index = repository._index
+
+        for key, expected in pawns.items():
+            assert set(index.find_pawn_structure(key)) == expected
+
+    def test_postings_are_sorted_by_game(self, indexed_games):
+        repository, _ = indexed_games
+        games = [match.game for match in repository.find_by_material("KQRRBBNNPPPPPPPPvKQRRBBNNPPPPPPPP")]
+
+        assert games == sorted(games) == list(range(repository.game_count))
+
+    def test_pawn_structure_query_from_board(self, indexed_games):
+        repository, _ = indexed_games
+        board = Board()
+        InitializeGameUseCase(board, GameState()).execute()
+
+        assert len(repository.find_by_pawn_structure(board)) == repository.game_count
+        assert all(match.ply == 0 for match in repository.find_by_pawn_structure(board))
+
+    def test_find_games_intersects_queries(self, indexed_games):
+        repository, (material, _) = indexed_games
+        board = Board()
+        InitializeGameUseCase(board, GameState()).execute()
+        endings = [key for key in material if key != material_key(board)]
+        signature = format_material(max(endings, key=lambda key: len(material[key])))
+        by_material = {match.game for match in repository.find_by_material(signature)}
+
+        assert repository.find_games(signature) == sorted(by_material)
+        assert repository.find_games(signature, board) == sorted(by_material)
+        with pytest.raises(ValueError):
+            repository.find_games()
+
+    def test_unknown_signature_returns_nothing(self, indexed_games):
+        repository, _ = indexed_games
+
+        assert repository.find_by_material("KQQQQQQQQQvK") == []
+
+    def test_rejects_foreign_files(self, tmp_path):
+        path = tmp_path / "games.idx"
+        path.write_bytes(b"CHG1" + bytes(40))
+
+        with pytest.raises(ValueError):
+            PositionIndex(path)
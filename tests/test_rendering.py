@@ -57,3 +57,62 @@ class TestRenderingIntegration:
 
         painter.end()
         assert not pixmap.isNull()
+
+
+class TestSpriteCache:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def render_piece(self, renderer: SVGPieceRenderer, piece: Piece, size: int) -> QPixmap:
+        pixmap = QPixmap(size, size)
+        pixmap.fill()
+        painter = QPainter(pixmap)
+        renderer.render(painter, QRect(0, 0, size, size), piece)
+        painter.end()
+        return pixmap
+
+    def test_sprite_is_reused_for_same_key(self):
+        renderer = SVGPieceRenderer()
+        piece = Piece(PieceType.KNIGHT, Team.WHITE, Position(0, 0))
+
+        self.render_piece(renderer, piece, 60)
+        first = renderer.sprite(PieceType.KNIGHT, Team.WHITE, 60, 60)
+        self.render_piece(renderer, piece, 60)
+
+        assert renderer.cached_sprite_count == 1
+        assert renderer.sprite(PieceType.KNIGHT, Team.WHITE, 60, 60) is first
+
+    def test_new_square_size_builds_new_sprite(self):
+        renderer = SVGPieceRenderer()
+        piece = Piece(PieceType.QUEEN, Team.BLACK, Position(0, 0))
+
+        self.render_piece(renderer, piece, 60)
+        self.render_piece(renderer, piece, 80)
+
+        assert renderer.cached_sprite_count == 2
+
+    def test_cache_evicts_least_recently_used_under_memory_cap(self):
+        renderer = SVGPieceRenderer(cache_bytes=2 * 50 * 50 * 4)
+        renderer.sprite(PieceType.PAWN, Team.WHITE, 50, 50)
+        renderer.sprite(PieceType.ROOK, Team.WHITE, 50, 50)
+        renderer.sprite(PieceType.PAWN, Team.WHITE, 50, 50)
+        renderer.sprite(PieceType.KING, Team.WHITE, 50, 50)
+
+        assert renderer.cached_sprite_count == 2
+        assert renderer.cache_bytes <= 2 * 50 * 50 * 4
+        pawn = renderer.sprite(PieceType.PAWN, Team.WHITE, 50, 50)
+        assert renderer.sprite(PieceType.PAWN, Team.WHITE, 50, 50) is pawn
+
+    def test_cached_sprite_matches_vector_drawing(self):
+        renderer = SVGPieceRenderer()
+        piece = Piece(PieceType.BISHOP, Team.WHITE, Position(0, 0))
+        cached = self.render_piece(renderer, piece, 64)
+
+        vector = QPixmap(64, 64)
+        vector.fill()
+        painter = QPainter(vector)
+        renderer.render_vector(painter, QRect(0, 0, 64, 64), piece)
+        painter.end()
+
+        assert cached.toImage() == vector.toImage()
@@ -0,0 +1,53 @@
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Team, Position
+from src.application.evaluation import BoardEvaluationService
+from src.application.search import MiniMaxService, SearchLimits, MATE_THRESHOLD
+from src.application.services import BoardSetupService
+
+
+class TestBoardEvaluationService:
+    def test_starting_position_is_balanced(self):
+        board = Board()
+        BoardSetupService(board).initialize_standard_game()
+
+        assert BoardEvaluationService().evaluate(board) == 0
+
+    def test_extra_queen_favors_owner(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.QUEEN, Team.BLACK, Position(3, 3)))
+
+        evaluation = BoardEvaluationService()
+        assert evaluation.evaluate(board) < 0
+        assert evaluation.evaluate_for(board, Team.BLACK) > 0
+
+
+class TestMiniMaxService:
+    def test_finds_king_capture(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.ROOK, Team.WHITE, Position(7, 0)))
+        board.add_piece(Piece(PieceType.KING, Team.WHITE, Position(7, 7)))
+        board.add_piece(Piece(PieceType.KING, Team.BLACK, Position(0, 0)))
+
+        result = MiniMaxService(board).search(Team.WHITE, SearchLimits(depth=2))
+
+        assert result.move == (Position(7, 0), Position(0, 0))
+        assert result.score >= MATE_THRESHOLD
+
+    def test_search_restores_board(self):
+        board = Board()
+        BoardSetupService(board).initialize_standard_game()
+        initial_hash = board.zobrist_hash
+
+        MiniMaxService(board).search(Team.WHITE, SearchLimits(depth=2))
+
+        assert board.zobrist_hash == initial_hash
+        assert len(board.get_all_pieces()) == 32
+
+    def test_node_limit_still_returns_move(self):
+        board = Board()
+        BoardSetupService(board).initialize_standard_game()
+
+        result = MiniMaxService(board).search(Team.WHITE, SearchLimits(depth=10, nodes=50))
+
+        assert result.move is not None
+        assert result.nodes <= 51
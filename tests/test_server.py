@@ -0,0 +1,198 @@
+import asyncio
+import json
+
+from src.domain.entities import Position, PieceType, Team
+from src.domain.game_state import GameStatus
+from src.application.streaming import SpectatorView
+from src.application.timers import NANOSECONDS, TimeControl
+from src.domain.encoding import encode_move
+from src.infrastructure.move_journal import JournalEntry, JournalEntryKind
+from src.presentation.loadtest import GameClient
+from src.presentation.server import GameServer
+
+
+class FakeConnection:
+    def __init__(self):
+        self.games = set()
+        self.spectating = set()
+        self.messages = []
+
+    def send(self, message: dict) -> None:
+        self.messages.append(message)
+
+    def write(self, payload: bytes) -> None:
+        self.messages.append(json.loads(payload))
+
+
+def send(server: GameServer, connection: FakeConnection, **message) -> dict:
+    server.handle_message(connection, json.dumps(message).encode())
+    return connection.messages[-1]
+
+
+class SteppedClock:
+    def __init__(self):
+        self.now = NANOSECONDS
+
+    def __call__(self) -> int:
+        return self.now
+
+
+class TestGameServer:
+    def setup_method(self):
+        self.server = GameServer()
+        self.white = FakeConnection()
+        self.black = FakeConnection()
+        self.game_id = send(self.server, self.white, type="create")["game"]
+        send(self.server, self.black, type="join", game=self.game_id)
+
+    def test_join_pushes_state_to_both_players(self):
+        assert self.white.messages[-1]["type"] == "state"
+        assert self.black.messages[-1]["type"] == "state"
+        assert len(self.black.messages[-1]["pieces"]) == 32
+
+    def test_valid_move_is_broadcast(self):
+        reply = send(self.server, self.white, type="move", game=self.game_id, **{"from": "e2", "to": "e4"})
+
+        assert reply["type"] == "moved"
+        assert self.black.messages[-1] == reply
+        session = self.server.get_session(self.game_id)
+        assert session.board.get_piece(Position(4, 4)).piece_type == PieceType.PAWN
+        assert session.game_state.current_turn == Team.BLACK
+
+    def test_session_history_is_trimmed_at_pawn_moves(self):
+        for source, target in (("g1", "f3"), ("g8", "f6"), ("f3", "g1"), ("f6", "g8"), ("e2", "e4")):
+            mover = self.white if source in ("g1", "f3", "e2") else self.black
+            send(self.server, mover, type="move", game=self.game_id, **{"from": source, "to": target})
+
+        game_state = self.server.get_session(self.game_id).game_state
+        assert len(game_state._position_history) == 1
+        assert game_state.halfmove_clock == 0
+
+    def test_move_out_of_turn_is_rejected(self):
+        reply = send(self.server, self.black, type="move", game=self.game_id, **{"from": "e7", "to": "e5"})
+
+        assert reply == {"type": "error", "reason": "Not your turn", "game": self.game_id}
+
+    def test_illegal_move_is_rejected(self):
+        reply = send(self.server, self.white, type="move", game=self.game_id, **{"from": "e2", "to": "e5"})
+
+        assert reply["type"] == "error"
+
+    def test_game_removed_when_all_players_leave(self):
+        self.server.disconnect(self.white)
+        assert self.black.messages[-1]["type"] == "opponent_left"
+
+        self.server.disconnect(self.black)
+        assert self.server.session_count == 0
+
+    def test_server_full(self):
+        server = GameServer(max_games=1)
+        connection = FakeConnection()
+        send(server, connection, type="create")
+
+        assert send(server, connection, type="create")["reason"] == "Server is full"
+
+
+class TestGameServerOverTcp:
+    def test_move_round_trip(self):
+        async def scenario():
+            server = GameServer()
+            listener = await server.start("127.0.0.1", 0)
+            port = listener.sockets[0].getsockname()[1]
+            white = await GameClient.connect("127.0.0.1", port)
+            black = await GameClient.connect("127.0.0.1", port)
+
+            game_id = (await white.request({"type": "create"}))["game"]
+            await black.request({"type": "join", "game": game_id})
+            await white.games[game_id].get()
+            white.send({"type": "move", "game": game_id, "from": "g1", "to": "f3"})
+            moved = await black.games[game_id].get()
+            while moved["type"] != "moved":
+                moved = await black.games[game_id].get()
+
+            await white.close()
+            await black.close()
+            listener.close()
+            await listener.wait_closed()
+            return moved
+
+        moved = asyncio.run(scenario())
+
+        assert moved["from"] == "g1"
+        assert moved["to"] == "f3"
+        assert moved["turn"] == "black"
+
+
+class TestSpectators:
+    def setup_method(self):
+        self.server = GameServer()
+        self.white = FakeConnection()
+        self.black = FakeConnection()
+        self.spectator = FakeConnection()
+        self.game_id = send(self.server, self.white, type="create")["game"]
+        send(self.server, self.black, type="join", game=self.game_id)
+
+    def test_spectator_receives_keyframe_and_move_deltas(self):
+        keyframe = send(self.server, self.spectator, type="spectate", game=self.game_id)
+        send(self.server, self.white, type="move", game=self.game_id, **{"from": "e2", "to": "e4"})
+
+        assert keyframe["type"] == "keyframe"
+        assert self.spectator.messages[-1]["type"] == "delta"
+        assert self.spectator.messages[-1]["seq"] == 1
+
+    def test_disconnected_spectator_is_unsubscribed(self):
+        send(self.server, self.spectator, type="spectate", game=self.game_id)
+        self.server.disconnect(self.spectator)
+
+        assert self.server.get_session(self.game_id).stream.subscriber_count == 0
+
+    def test_spectators_see_time_forfeit(self):
+        clock = SteppedClock()
+        server = GameServer(time_control=TimeControl(10, 0), clock=clock)
+        white, black, spectator = FakeConnection(), FakeConnection(), FakeConnection()
+        game_id = send(server, white, type="create")["game"]
+        send(server, black, type="join", game=game_id)
+        send(server, spectator, type="spectate", game=game_id)
+        send(server, white, type="move", game=game_id, **{"from": "e2", "to": "e4"})
+        clock.now += 10 * NANOSECONDS
+
+        server.expire_clocks()
+
+        view = SpectatorView()
+        for frame in spectator.messages:
+            view.apply(frame)
+        assert spectator.messages[-1]["type"] == "status"
+        assert spectator.messages[-1]["reason"] == "time"
+        assert view.status == GameStatus.WHITE_WON
+
+    def test_late_spectator_replays_the_forfeit(self):
+        clock = SteppedClock()
+        server = GameServer(time_control=TimeControl(10, 0), clock=clock)
+        white, black, early, late = FakeConnection(), FakeConnection(), FakeConnection(), FakeConnection()
+        game_id = send(server, white, type="create")["game"]
+        send(server, black, type="join", game=game_id)
+        send(server, early, type="spectate", game=game_id)
+        send(server, white, type="move", game=game_id, **{"from": "e2", "to": "e4"})
+        clock.now += 10 * NANOSECONDS
+        server.expire_clocks()
+
+        send(server, late, type="spectate", game=game_id)
+
+        view = SpectatorView()
+        for frame in late.messages:
+            view.apply(frame)
+        assert view.status == GameStatus.WHITE_WON
+
+
+class TestRestoredClocks:
+    def test_restored_timed_games_can_lose_on_time(self):
+        clock = SteppedClock()
+        server = GameServer(time_control=TimeControl(10, 0), clock=clock)
+        e2e4 = encode_move(Position.from_algebraic("e2"), Position.from_algebraic("e4"))
+
+        server.restore_games({7: [JournalEntry(JournalEntryKind.MOVE, 7, e2e4)]})
+
+        assert server.running_clock_count == 1
+        clock.now += 10 * NANOSECONDS
+        assert server.expire_clocks() == 1
+        assert server.get_session(7).game_state.status == GameStatus.WHITE_WON
@@ -0,0 +1,31 @@
+from src.domain.game_state import GameStatus
+from src.application.simulation import SelfPlayConfig, play_game, run_self_play
+from src.infrastructure.game_records import read_game_records
+
+
+class TestSelfPlay:
+    def test_games_are_reproducible_from_seed(self):
+        config = SelfPlayConfig(games=1, max_plies=60, seed=7)
+
+        first = play_game(config, 0)
+        second = play_game(config, 0)
+
+        assert list(first.moves) == list(second.moves)
+        assert first.status == second.status
+
+    def test_game_ends_with_final_status(self):
+        record = play_game(SelfPlayConfig(max_plies=20), 3)
+
+        assert record.status != GameStatus.IN_PROGRESS
+        assert len(record.moves) <= 20
+
+    def test_report_and_output_file_agree(self, tmp_path):
+        output = tmp_path / "games.bin"
+        config = SelfPlayConfig(games=5, white_policy="greedy", max_plies=40)
+
+        report = run_self_play(config, output)
+        stored = list(read_game_records(output))
+
+        assert report.games == 5
+        assert [game.index for game in stored] == list(range(5))
+        assert sum(len(game.moves) for game in stored) == report.plies
@@ -0,0 +1,59 @@
+import pytest
+
+from src.domain.board import Board
+from src.domain.entities import Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.infrastructure.repositories import BoardRepository
+from src.infrastructure.snapshots import SNAPSHOT_SIZE
+
+
+class TestSnapshots:
+    def setup_method(self):
+        self.board = Board()
+        self.game_state = GameState()
+        InitializeGameUseCase(self.board, self.game_state).execute()
+        execute_move_use_case = ExecuteMoveUseCase(self.board, self.game_state)
+        for source, target in [("e2", "e4"), ("d7", "d5"), ("e4", "d5"), ("g8", "f6"), ("g1", "f3")]:
+            piece = self.board.get_piece(Position.from_algebraic(source))
+            execute_move_use_case.execute(piece, Position.from_algebraic(target))
+        self.repository = BoardRepository(self.board)
+
+    def assert_restored(self, board: Board, game_state: GameState) -> None:
+        assert board.zobrist_hash == self.board.zobrist_hash
+        assert sorted(map(repr, board.get_all_pieces())) == sorted(map(repr, self.board.get_all_pieces()))
+        assert game_state.current_turn == Team.BLACK
+        assert game_state.move_count == 5
+        assert game_state.halfmove_clock == self.game_state.halfmove_clock == 2
+        assert game_state.status == GameStatus.IN_PROGRESS
+
+    def test_snapshot_is_fixed_size(self):
+        assert len(self.repository.snapshot(self.game_state)) == SNAPSHOT_SIZE
+        assert len(BoardRepository().snapshot(GameState())) == SNAPSHOT_SIZE
+
+    def test_restore_round_trips_board_and_state(self):
+        board, game_state = Board(), GameState()
+        BoardRepository(board).restore(self.repository.snapshot(self.game_state), game_state)
+
+        self.assert_restored(board, game_state)
+        assert game_state.repetition_count == 1
+
+    def test_save_and_load_from_disk(self, tmp_path):
+        path = tmp_path / "game.snapshot"
+        self.repository.save(path, self.game_state)
+        board, game_state = Board(), GameState()
+        BoardRepository(board).load(path, game_state)
+
+        self.assert_restored(board, game_state)
+
+    def test_halfmove_clock_continues_after_restore(self):
+        board, game_state = Board(), GameState()
+        BoardRepository(board).restore(self.repository.snapshot(self.game_state), game_state)
+        knight = board.get_piece(Position.from_algebraic("b8"))
+        ExecuteMoveUseCase(board, game_state).execute(knight, Position.from_algebraic("c6"))
+
+        assert game_state.halfmove_clock == 3
+
+    def test_rejects_wrong_size(self):
+        with pytest.raises(ValueError):
+            self.repository.restore(b"\x00" * (SNAPSHOT_SIZE - 1), GameState())
@@ -0,0 +1,123 @@
+import json
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.entities import Position, PieceType, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.streaming import PositionStream, SpectatorView
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+
+
+class RecordingSubscriber:
+    def __init__(self):
+        self.payloads: list[bytes] = []
+
+    def write(self, payload: bytes) -> None:
+        self.payloads.append(payload)
+
+    def frames(self) -> list[dict]:
+        return [json.loads(payload) for payload in self.payloads]
+
+
+class TestPositionStream:
+    def setup_method(self):
+        self.board = Board()
+        self.game_state = GameState()
+        InitializeGameUseCase(self.board, self.game_state).execute()
+        self.execute_move_use_case = ExecuteMoveUseCase(self.board, self.game_state)
+        self.stream = PositionStream(1, self.board, self.game_state, keyframe_interval=4)
+
+    def play(self, source: str, target: str) -> bytes:
+        piece = self.board.get_piece(Position.from_algebraic(source))
+        moved_piece, status = self.execute_move_use_case.execute(piece, Position.from_algebraic(target))
+        return self.stream.publish_move(piece, moved_piece, status)
+
+    def replay(self, subscriber: RecordingSubscriber) -> SpectatorView:
+        view = SpectatorView()
+        for frame in subscriber.frames():
+            view.apply(frame)
+        return view
+
+    def assert_matches_board(self, view: SpectatorView) -> None:
+        assert view.board.zobrist_hash == self.board.zobrist_hash
+        assert view.turn == self.game_state.current_turn
+        assert view.status == self.game_state.status
+
+    def test_subscriber_receives_keyframe_then_deltas(self):
+        subscriber = RecordingSubscriber()
+        self.stream.subscribe(subscriber)
+        self.play("e2", "e4")
+        self.play("e7", "e5")
+
+        frames = subscriber.frames()
+        assert [frame["type"] for frame in frames] == ["keyframe", "delta", "delta"]
+        assert [frame["seq"] for frame in frames] == [0, 1, 2]
+        self.assert_matches_board(self.replay(subscriber))
+
+    def test_payload_is_encoded_once_for_all_subscribers(self):
+        subscribers = [RecordingSubscriber() for _ in range(3)]
+        for subscriber in subscribers:
+            self.stream.subscribe(subscriber)
+
+        payload = self.play("g1", "f3")
+
+        assert all(subscriber.payloads[-1] is payload for subscriber in subscribers)
+
+    def test_late_joiner_gets_latest_keyframe_and_backlog(self):
+        for source, target in [("e2", "e4"), ("e7", "e5"), ("g1", "f3"), ("b8", "c6"), ("f1", "c4")]:
+            self.play(source, target)
+
+        subscriber = RecordingSubscriber()
+        self.stream.subscribe(subscriber)
+
+        frames = subscriber.frames()
+        assert frames[0]["type"] == "keyframe"
+        assert frames[0]["seq"] == 4
+        assert len(frames) == 2
+        self.assert_matches_board(self.replay(subscriber))
+
+    def test_capture_and_game_end_are_replayed(self):
+        subscriber = RecordingSubscriber()
+        self.stream.subscribe(subscriber)
+        for source, target in [("e2", "e4"), ("f7", "f6"), ("d1", "h5"), ("a7", "a6"), ("h5", "e8")]:
+            self.play(source, target)
+
+        view = self.replay(subscriber)
+        self.assert_matches_board(view)
+        assert view.status == GameStatus.WHITE_WON
+        assert view.board.get_piece(Position.from_algebraic("e8")).piece_type == PieceType.QUEEN
+
+    def test_unsubscribed_subscriber_stops_receiving(self):
+        subscriber = RecordingSubscriber()
+        self.stream.subscribe(subscriber)
+        self.stream.unsubscribe(subscriber)
+        self.play("e2", "e4")
+
+        assert len(subscriber.payloads) == 1
+        assert self.stream.subscriber_count == 0
+
+    def test_unsubscribe_keeps_remaining_subscribers_in_order(self):
+        subscribers = [RecordingSubscriber() for _ in range(5)]
+        for subscriber in subscribers:
+            self.stream.subscribe(subscriber)
+
+        self.stream.unsubscribe(subscribers[2])
+        self.stream.unsubscribe(subscribers[2])
+        self.stream.unsubscribe(RecordingSubscriber())
+
+        assert list(self.stream._subscribers) == subscribers[:2] + subscribers[3:]
+        assert self.stream.subscriber_count == 4
+
+
+class TestSpectatorView:
+    def test_missing_frames_are_rejected(self):
+        view = SpectatorView()
+        view.apply({"type": "keyframe", "seq": 0, "turn": Team.WHITE.value, "status": 0, "board": "." * 64})
+
+        with pytest.raises(ValueError):
+            view.apply({"type": "delta", "seq": 2, "move": 0, "status": 0})
+
+    def test_delta_before_keyframe_is_rejected(self):
+        with pytest.raises(ValueError):
+            SpectatorView().apply({"type": "delta", "seq": 1, "move": 0, "status": 0})
@@ -0,0 +1,144 @@
+import random
+
+import numpy as np
+
+from src.domain.board import Board
+from src.domain.entities import Piece, PieceType, Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.evaluation import BoardEvaluationService
+from src.application.services import MoveValidator
+from src.application.tensors import (
+    BatchEvaluationService,
+    bitboards_to_planes,
+    boards_to_planes,
+    codes_to_planes,
+    load_snapshot_batch,
+    move_masks,
+    plane_index,
+    planes_to_bitboards,
+    snapshots_to_codes,
+)
+from src.application.usecases import ExecuteMoveUseCase, InitializeGameUseCase
+from src.infrastructure.repositories import BoardRepository
+from src.infrastructure.snapshots import save_snapshots
+
+
+def random_positions(count: int, seed: int = 3) -> tuple[list[Board], list[bytes]]:
+    board, game_state = Board(), GameState()
+    InitializeGameUseCase(board, game_state).execute()
+    execute_move_use_case = ExecuteMoveUseCase(board, game_state)
+    validator = MoveValidator(board)
+    repository = BoardRepository(board)
+    rng = random.Random(seed)
+    boards, snapshots = [], []
+    for _ in range(count):
+        if game_state.status != GameStatus.IN_PROGRESS:
+            InitializeGameUseCase(board, game_state).execute()
+        execute_move_use_case.execute(*rng.choice(validator.get_all_valid_moves(game_state.current_turn)))
+        snapshot = repository.snapshot(game_state)
+        copy, copy_state = Board(), GameState()
+        BoardRepository(copy).restore(snapshot, copy_state)
+        boards.append(copy)
+        snapshots.append(snapshot)
+    return boards, snapshots
+
+
+def scalar_mobility(board: Board) -> int:
+    validator = MoveValidator(board)
+    score = 0
+    for piece in board.get_all_pieces():
+        if piece.piece_type != PieceType.PAWN:
+            moves = len(validator.get_valid_moves(piece))
+            score += moves if piece.team == Team.WHITE else -moves
+    return score
+
+
+class TestBoardTensors:
+    def test_board_planes_mark_each_piece_once(self):
+        board = Board()
+        board.add_piece(Piece(PieceType.KNIGHT, Team.BLACK, Position.from_algebraic("c6")))
+
+        planes = boards_to_planes([board])
+
+        assert planes.shape == (1, 12, 64)
+        assert planes.sum() == 1
+        assert planes[0, plane_index(PieceType.KNIGHT, Team.BLACK), Position.from_algebraic("c6").index] == 1
+
+    def test_snapshot_decoding_matches_board_conversion(self):
+        boards, snapshots = random_positions(200)
+        codes, turns = snapshots_to_codes(b"".join(snapshots))
+
+        assert np.array_equal(codes_to_planes(codes), boards_to_planes(boards))
+        assert turns.shape == (200,)
+
+    def test_snapshot_file_loads_in_bulk(self, tmp_path):
+        boards, snapshots = random_positions(50)
+        path = tmp_path / "positions.bin"
+        save_snapshots(path, snapshots)
+
+        planes, _ = load_snapshot_batch(path)
+
+        assert np.array_equal(planes, boards_to_planes(boards))
+
+    def test_bitboards_round_trip(self):
+        boards, _ = random_positions(50)
+        planes = boards_to_planes(boards)
+
+        bitboards = planes_to_bitboards(planes)
+
+        assert bitboards.shape == (50, 12)
+        assert bitboards.dtype == np.uint64
+        assert np.array_equal(bitboards_to_planes(bitboards), planes)
+
+
+class TestBatchEvaluation:
+    def test_matches_scalar_evaluation(self):
+        boards, _ = random_positions(300)
+        scalar = BoardEvaluationService()
+
+        scores = BatchEvaluationService().evaluate(boards_to_planes(boards))
+
+        assert scores.tolist() == [scalar.evaluate(board) for board in boards]
+
+    def test_mobility_matches_move_validator(self):
+        boards, _ = random_positions(300, seed=8)
+
+        mobility = BatchEvaluationService().mobility(boards_to_planes(boards))
+
+        assert mobility.tolist() == [scalar_mobility(board) for board in boards]
+
+    def test_mobility_weight_is_added(self):
+        boards, _ = random_positions(20)
+        planes = boards_to_planes(boards)
+        base = BatchEvaluationService()
+
+        weighted = BatchEvaluationService(mobility_weight=5).evaluate(planes)
+
+        assert np.array_equal(weighted, base.evaluate(planes) + 5 * base.mobility(planes))
+
+
+class TestMoveMasks:
+    def test_masks_match_move_validator_for_both_sides(self):
+        boards, _ = random_positions(300, seed=11)
+        planes = boards_to_planes(boards)
+        turns = np.arange(len(boards)) % 2
+
+        masks = move_masks(planes, turns)
+
+        for board, turn, mask in zip(boards, turns, masks):
+            team = Team.WHITE if turn == 0 else Team.BLACK
+            expected = np.zeros((64, 64), dtype=bool)
+            for piece, target in MoveValidator(board).get_all_valid_moves(team):
+                expected[piece.position.index, target.index] = True
+            assert np.array_equal(mask, expected)
+
+    def test_starting_position_has_twenty_moves(self):
+        board, game_state = Board(), GameState()
+        InitializeGameUseCase(board, game_state).execute()
+
+        masks = move_masks(boards_to_planes([board, board]), np.array([0, 1]))
+
+        assert masks.shape == (2, 64, 64)
+        assert masks.sum(axis=(1, 2)).tolist() == [20, 20]
+        assert masks[0, Position.from_algebraic("e2").index, Position.from_algebraic("e4").index]
+        assert masks[1, Position.from_algebraic("g8").index, Position.from_algebraic("f6").index]
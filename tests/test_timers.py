@@ -0,0 +1,217 @@
+import json
+import sys
+
+import pytest
+from PyQt6.QtWidgets import QApplication
+
+from src.domain.board import Board
+from src.domain.entities import Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.application.timers import ClockMode, ClockScheduler, NANOSECONDS, TimeControl, TimerService
+from src.presentation.controller import ChessController
+from src.presentation.server import GameServer
+from src.presentation.ui import ClockPanel
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000 * NANOSECONDS
+
+    def __call__(self) -> int:
+        return self.now
+
+    def advance(self, seconds: float) -> None:
+        self.now += round(seconds * NANOSECONDS)
+
+
+class FakeConnection:
+    def __init__(self):
+        self.games = set()
+        self.spectating = set()
+        self.messages = []
+
+    def send(self, message: dict) -> None:
+        self.messages.append(message)
+
+
+def clocked_game(time_control: TimeControl) -> tuple[ChessController, Board, TimerService, FakeClock]:
+    board, game_state, clock = Board(), GameState(), FakeClock()
+    timer = TimerService(game_state, time_control, clock)
+    controller = ChessController(board, game_state, timer=timer)
+    controller.initialize_game()
+    return controller, board, timer, clock
+
+
+def play(controller: ChessController, board: Board, source: str, target: str):
+    return controller.move_piece(board.get_piece(Position.from_algebraic(source)), Position.from_algebraic(target))
+
+
+class TestTimeControl:
+    def test_parses_increment_and_delay(self):
+        assert TimeControl.parse("5+3") == TimeControl(300.0, 3.0, ClockMode.INCREMENT)
+        assert TimeControl.parse("0.5d2") == TimeControl(30.0, 2.0, ClockMode.DELAY)
+        assert TimeControl.parse("5d2").format() == "5d2"
+
+    def test_rejects_malformed_controls(self):
+        for text in ("5", "5+", "+3", "5x3"):
+            with pytest.raises(ValueError):
+                TimeControl.parse(text)
+
+
+class TestTimerService:
+    def test_clock_starts_after_first_move_and_adds_increment(self):
+        controller, board, timer, clock = clocked_game(TimeControl(60, 2))
+        clock.advance(10)
+        play(controller, board, "e2", "e4")
+
+        assert timer.remaining(Team.WHITE) == 60 * NANOSECONDS
+        assert timer.running_team == Team.BLACK
+        clock.advance(5)
+        play(controller, board, "e7", "e5")
+
+        assert timer.remaining(Team.BLACK) == 57 * NANOSECONDS
+        assert timer.running_team == Team.WHITE
+
+    def test_delay_is_not_charged(self):
+        controller, board, timer, clock = clocked_game(TimeControl(60, 3, ClockMode.DELAY))
+        play(controller, board, "e2", "e4")
+        clock.advance(2)
+
+        assert timer.remaining(Team.BLACK) == 60 * NANOSECONDS
+        clock.advance(3)
+        play(controller, board, "e7", "e5")
+
+        assert timer.remaining(Team.BLACK) == 58 * NANOSECONDS
+
+    def test_flag_fall_sets_the_result_and_blocks_moves(self):
+        controller, board, timer, clock = clocked_game(TimeControl(5, 0))
+        play(controller, board, "e2", "e4")
+        clock.advance(5)
+
+        moved_piece, status = play(controller, board, "e7", "e5")
+
+        assert moved_piece is None
+        assert status == GameStatus.WHITE_WON
+        assert timer.flagged == Team.BLACK
+        assert timer.remaining(Team.BLACK) == 0
+
+    def test_undo_switches_the_running_side_without_increment(self):
+        controller, board, timer, clock = clocked_game(TimeControl(60, 2))
+        play(controller, board, "e2", "e4")
+        play(controller, board, "e7", "e5")
+        clock.advance(4)
+
+        assert controller.undo()
+        assert timer.running_team == Team.BLACK
+        assert timer.remaining(Team.WHITE) == 56 * NANOSECONDS
+        assert timer.remaining(Team.BLACK) == 62 * NANOSECONDS
+
+    def test_new_game_resets_clocks(self):
+        controller, board, timer, clock = clocked_game(TimeControl(60, 0))
+        play(controller, board, "e2", "e4")
+        clock.advance(7)
+        controller.initialize_game()
+
+        assert timer.running_team is None
+        assert timer.remaining(Team.BLACK) == 60 * NANOSECONDS
+
+
+class TestClockScheduler:
+    def test_pops_deadlines_in_order_and_ignores_rescheduled_entries(self):
+        scheduler = ClockScheduler()
+        assert scheduler.schedule(1, 300)
+        assert scheduler.schedule(2, 100)
+        assert not scheduler.schedule(3, 200)
+        scheduler.schedule(2, 400)
+        scheduler.cancel(3)
+
+        assert scheduler.next_deadline() == 300
+        assert scheduler.pop_expired(350) == [1]
+        assert scheduler.pop_expired(1_000) == [2]
+        assert len(scheduler) == 0
+
+    def test_heap_is_compacted_under_rescheduling(self):
+        scheduler = ClockScheduler()
+        for deadline in range(10_000):
+            scheduler.schedule(deadline % 10, 1_000_000 - deadline)
+
+        assert len(scheduler._heap) <= 2 * len(scheduler) + 65
+        assert scheduler.next_deadline() == 1_000_000 - 9_999
+
+
+class TestServerClocks:
+    def setup_method(self):
+        self.clock = FakeClock()
+        self.server = GameServer(time_control=TimeControl(10, 0), clock=self.clock)
+        self.white = FakeConnection()
+        self.black = FakeConnection()
+        self.game_id = self.send(self.white, type="create")["game"]
+        self.send(self.black, type="join", game=self.game_id)
+
+    def send(self, connection: FakeConnection, **message) -> dict:
+        self.server.handle_message(connection, json.dumps(message).encode())
+        return connection.messages[-1]
+
+    def test_moves_report_clocks_and_schedule_one_deadline_per_game(self):
+        moved = self.send(self.white, type="move", game=self.game_id, **{"from": "e2", "to": "e4"})
+
+        assert moved["clock"] == {"white_ms": 10_000, "black_ms": 10_000, "running": "black"}
+        assert self.server.running_clock_count == 1
+
+    def test_expired_clock_flags_without_a_move(self):
+        self.send(self.white, type="move", game=self.game_id, **{"from": "e2", "to": "e4"})
+        self.clock.advance(9)
+        assert self.server.expire_clocks() == 0
+        self.clock.advance(1)
+
+        assert self.server.expire_clocks() == 1
+        assert self.white.messages[-1]["type"] == "flag"
+        assert self.black.messages[-1]["team"] == "black"
+        assert self.server.get_session(self.game_id).game_state.status == GameStatus.WHITE_WON
+        assert self.server.running_clock_count == 0
+
+    def test_late_move_is_rejected_with_flag(self):
+        self.send(self.white, type="move", game=self.game_id, **{"from": "e2", "to": "e4"})
+        self.clock.advance(11)
+
+        reply = self.send(self.black, type="move", game=self.game_id, **{"from": "e7", "to": "e5"})
+
+        assert reply["type"] == "error"
+        assert any(message["type"] == "flag" for message in self.black.messages)
+
+
+class TestClockPanel:
+    @classmethod
+    def setup_class(cls):
+        cls.app = QApplication.instance() or QApplication(sys.argv)
+
+    def test_formats_minutes_and_tenths(self):
+        assert ClockPanel.format_clock(65 * NANOSECONDS) == "1:05"
+        assert ClockPanel.format_clock(3_725 * NANOSECONDS) == "1:02:05"
+        assert ClockPanel.format_clock(9_450_000_000) == "9.4"
+
+    def test_ticks_only_when_the_display_changes(self):
+        controller, board, timer, clock = clocked_game(TimeControl(60, 0))
+        panel = ClockPanel(controller)
+        assert panel.next_tick_ms is None
+
+        play(controller, board, "e2", "e4")
+        clock.advance(0.25)
+        panel.refresh()
+
+        assert panel.next_tick_ms == 751
+        assert panel.clock_texts()[Team.BLACK] == "Black  0:59"
+
+    def test_panel_reports_flag_fall(self):
+        controller, board, timer, clock = clocked_game(TimeControl(5, 0))
+        panel = ClockPanel(controller)
+        flags = []
+        panel.flag_fallen.connect(lambda: flags.append(True))
+        play(controller, board, "e2", "e4")
+        clock.advance(6)
+
+        panel.refresh()
+
+        assert flags == [True]
+        assert panel.next_tick_ms is None
+        assert panel.clock_texts()[Team.BLACK] == "Black  0.0"
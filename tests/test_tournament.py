@@ -0,0 +1,85 @@
+import pytest
+
+from src.application.tournament import (
+    EngineConfig,
+    MatchConfig,
+    MatchStatistics,
+    SequentialProbabilityRatioTest,
+    SPRTDecision,
+    TournamentRunner,
+    elo_from_score,
+    generate_opening,
+)
+
+
+class TestMatchStatistics:
+    def test_even_score_is_zero_elo(self):
+        statistics = MatchStatistics(wins=10, draws=5, losses=10)
+
+        assert statistics.score == 0.5
+        assert elo_from_score(statistics.score) == pytest.approx(0.0)
+
+    def test_error_margin_shrinks_with_games(self):
+        small = MatchStatistics(wins=6, draws=4, losses=4)
+        large = MatchStatistics(wins=600, draws=400, losses=400)
+
+        assert large.elo_error_margin() < small.elo_error_margin()
+
+
+class TestSequentialProbabilityRatioTest:
+    def test_dominant_result_accepts_h1(self):
+        sprt = SequentialProbabilityRatioTest(0.0, 10.0)
+
+        assert sprt.decide(MatchStatistics(wins=300, draws=100, losses=100)) == SPRTDecision.ACCEPT_H1
+
+    def test_losing_result_accepts_h0(self):
+        sprt = SequentialProbabilityRatioTest(0.0, 10.0)
+
+        assert sprt.decide(MatchStatistics(wins=100, draws=100, losses=300)) == SPRTDecision.ACCEPT_H0
+
+    def test_few_games_continue(self):
+        sprt = SequentialProbabilityRatioTest(0.0, 10.0)
+
+        assert sprt.decide(MatchStatistics(wins=2, draws=1, losses=1)) == SPRTDecision.CONTINUE
+
+
+class TestTournamentRunner:
+    def test_engine_config_parse(self):
+        config = EngineConfig.parse("A", "nodes=500,movetime=0.2")
+
+        assert config.nodes == 500
+        assert config.movetime == 0.2
+        assert config.limits.depth == 64
+
+    def test_engine_config_rejects_unknown_option(self):
+        with pytest.raises(ValueError):
+            EngineConfig.parse("A", "ponder=1")
+
+    def test_openings_are_deterministic(self):
+        assert generate_opening(3, 6) == generate_opening(3, 6)
+
+    def test_runner_plays_paired_games(self):
+        config = MatchConfig(
+            engine_a=EngineConfig("A", depth=1),
+            engine_b=EngineConfig("B", depth=1),
+            max_games=4,
+            opening_plies=2,
+            max_plies=20,
+        )
+
+        report = TournamentRunner(config).run()
+
+        assert report.statistics.games == 4
+
+    def test_odd_game_cap_is_respected(self):
+        config = MatchConfig(
+            engine_a=EngineConfig("A", depth=1),
+            engine_b=EngineConfig("B", depth=1),
+            max_games=3,
+            opening_plies=2,
+            max_plies=20,
+        )
+
+        report = TournamentRunner(config).run()
+
+        assert report.statistics.games == 3
@@ -0,0 +1,114 @@
+import numpy as np
+import pytest
+
+from src.domain.entities import PieceType
+from src.application.datasets import export_dataset, SelfPlaySource, TrainingDataset
+from src.application.evaluation import EvaluationWeights, load_weights, save_weights
+from src.application.simulation import SelfPlayConfig
+from src.application.tensors import BatchEvaluationService, bitboards_to_planes
+from src.application.tuning import (
+    chunk_loss_and_gradient,
+    parameters_to_weights,
+    position_features,
+    result_targets,
+    score_table,
+    TexelTuner,
+    TuningConfig,
+    weights_to_parameters,
+)
+
+
+@pytest.fixture(scope="module")
+def dataset_directory(tmp_path_factory):
+    directory = tmp_path_factory.mktemp("dataset")
+    export_dataset(SelfPlaySource(SelfPlayConfig(games=12, max_plies=120, seed=2)), directory, games_per_shard=4)
+    return directory
+
+
+def all_samples(directory) -> tuple[np.ndarray, np.ndarray]:
+    shards = list(TrainingDataset(directory).iter_shards())
+    return (
+        np.concatenate([np.asarray(shard["bitboards"]) for shard in shards]),
+        np.concatenate([np.asarray(shard["results"]) for shard in shards]),
+    )
+
+
+class TestFeatures:
+    def test_features_reproduce_batch_evaluation(self, dataset_directory):
+        bitboards, _ = all_samples(dataset_directory)
+        table = score_table(weights_to_parameters(EvaluationWeights()))
+        expected = BatchEvaluationService().material_and_position(bitboards_to_planes(bitboards))
+
+        assert np.allclose(position_features(bitboards) @ table.ravel(), expected)
+
+    def test_weights_round_trip_through_parameters(self):
+        weights = EvaluationWeights()
+
+        assert parameters_to_weights(weights_to_parameters(weights)) == weights
+
+    def test_gradient_matches_finite_difference(self, dataset_directory):
+        bitboards, results = all_samples(dataset_directory)
+        features, targets = position_features(bitboards), result_targets(results)
+        table = score_table(weights_to_parameters(EvaluationWeights()))
+        _, gradient = chunk_loss_and_gradient(features, targets, table, 400.0)
+
+        square = (0, 20)
+        step = 1.0
+        higher, lower = table.copy(), table.copy()
+        higher[square] += step
+        lower[square] -= step
+        numeric = (
+            chunk_loss_and_gradient(features, targets, higher, 400.0)[0]
+            - chunk_loss_and_gradient(features, targets, lower, 400.0)[0]
+        ) / (2 * step)
+
+        assert gradient[square] == pytest.approx(numeric, rel=1e-2, abs=1e-3)
+
+
+class TestTexelTuner:
+    def test_loss_decreases(self, dataset_directory):
+        tuner = TexelTuner(dataset_directory, TuningConfig(epochs=15, chunk_size=500))
+        report = tuner.tune()
+
+        assert report.epochs == 15
+        assert report.losses[-1] < report.losses[0]
+
+    def test_king_value_is_frozen(self, dataset_directory):
+        tuner = TexelTuner(dataset_directory, TuningConfig(epochs=5))
+        tuner.tune()
+
+        assert tuner.weights.piece_values[PieceType.KING] == EvaluationWeights().piece_values[PieceType.KING]
+
+    def test_chunking_does_not_change_gradient(self, dataset_directory):
+        _, whole = TexelTuner(dataset_directory, TuningConfig(chunk_size=100000)).loss_and_gradient()
+        _, chunked = TexelTuner(dataset_directory, TuningConfig(chunk_size=97)).loss_and_gradient()
+
+        assert np.allclose(whole, chunked, atol=1e-6)
+
+    def test_resume_from_checkpoint_matches_uninterrupted_run(self, dataset_directory, tmp_path):
+        checkpoint = tmp_path / "tune.npz"
+        TexelTuner(dataset_directory, TuningConfig(epochs=4, checkpoint_every=2)).tune(checkpoint)
+        resumed = TexelTuner(dataset_directory, TuningConfig(epochs=8, checkpoint_every=2))
+        report = resumed.tune(checkpoint)
+
+        uninterrupted = TexelTuner(dataset_directory, TuningConfig(epochs=8))
+        uninterrupted.tune()
+
+        assert report.resumed_from == 4
+        assert np.allclose(resumed.parameters, uninterrupted.parameters)
+        assert resumed.losses == pytest.approx(uninterrupted.losses)
+
+    def test_parallel_workers_match_serial(self, dataset_directory):
+        serial = TexelTuner(dataset_directory, TuningConfig(epochs=3, chunk_size=400))
+        parallel = TexelTuner(dataset_directory, TuningConfig(epochs=3, chunk_size=400, workers=2))
+        serial.tune()
+        parallel.tune()
+
+        assert np.allclose(serial.parameters, parallel.parameters)
+
+    def test_tuned_weights_save_and_load(self, dataset_directory, tmp_path):
+        tuner = TexelTuner(dataset_directory, TuningConfig(epochs=3))
+        tuner.tune()
+        save_weights(tuner.weights, tmp_path / "tuned.json")
+
+        assert load_weights(tmp_path / "tuned.json") == tuner.weights
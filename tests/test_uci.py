@@ -0,0 +1,103 @@
+import asyncio
+
+import pytest
+
+from src.domain.board import Board
+from src.domain.entities import Position, Team
+from src.domain.game_state import GameState, GameStatus
+from src.infrastructure.fen import load_fen, to_fen, STARTING_FEN
+from src.presentation.uci import UCIEngine, format_score, parse_move
+from src.application.search import MATE_SCORE
+
+
+def run_commands(*commands: str) -> list[str]:
+    output = []
+    engine = UCIEngine(output.append)
+
+    async def drive():
+        for command in commands:
+            await engine.handle(command)
+        await engine.wait_for_search()
+
+    asyncio.run(drive())
+    return output
+
+
+class TestFen:
+    def test_starting_fen_round_trip(self):
+        board = Board()
+        turn = load_fen(board, STARTING_FEN)
+
+        assert turn == Team.WHITE
+        assert len(board.get_all_pieces()) == 32
+        assert to_fen(board, turn) == STARTING_FEN
+
+    def test_invalid_fen_raises(self):
+        with pytest.raises(ValueError):
+            load_fen(Board(), "8/8/8 w")
+        with pytest.raises(ValueError):
+            load_fen(Board(), "k7/8/8/8/8/8/8/K7 w - - x 1")
+
+    def test_move_counters_restore_game_state(self):
+        game_state = GameState()
+        load_fen(Board(), "k7/8/8/8/8/8/8/R6K b - - 37 42", game_state)
+
+        assert game_state.current_turn == Team.BLACK
+        assert game_state.halfmove_clock == 37
+        assert game_state.move_count == 83
+
+
+class TestUCIEngine:
+    def test_handshake(self):
+        assert run_commands("uci", "isready") == [
+            "id name Chess PyQt6",
+            "id author Chess PyQt6 contributors",
+            "uciok",
+            "readyok",
+        ]
+
+    def test_go_depth_reports_info_and_bestmove(self):
+        output = run_commands("position startpos moves e2e4 e7e5", "go depth 2")
+
+        assert output[0].startswith("info depth 1 ")
+        assert output[-1].startswith("bestmove ")
+
+    def test_finds_king_capture_from_fen(self):
+        output = run_commands("position fen k7/8/8/8/8/8/8/R6K w - - 0 1", "go depth 2")
+
+        assert output[-1] == "bestmove a1a8"
+
+    def test_stop_interrupts_infinite_search(self):
+        output = run_commands("position startpos", "go infinite", "isready", "stop")
+
+        assert "readyok" in output
+        assert output[-1].startswith("bestmove ")
+
+    def test_illegal_move_is_reported(self):
+        output = run_commands("position startpos moves e2e5")
+
+        assert output == ["info string Illegal move 'e2e5'"]
+
+    def test_failed_move_list_invalidates_cached_position(self):
+        engine = UCIEngine(lambda line: None)
+
+        async def drive():
+            await engine.handle("position startpos moves e2e4")
+            await engine.handle("position startpos moves e2e4 e7e5 e1e5")
+            await engine.handle("position startpos moves e2e4 d7d5")
+
+        asyncio.run(drive())
+
+        assert to_fen(engine._board, engine._game_state.current_turn).split()[0] == "rnbqkbnr/ppp1pppp/8/3p4/4P3/8/PPPP1PPP/RNBQKBNR"
+
+    def test_fen_halfmove_clock_counts_towards_fifty_moves(self):
+        engine = UCIEngine(lambda line: None)
+
+        asyncio.run(engine.handle("position fen k7/8/8/8/8/8/8/R6K w - - 99 80 moves h1g1"))
+
+        assert engine._game_state.halfmove_clock == 100
+        assert engine._game_state.status == GameStatus.DRAW
+
+    def test_parse_move_and_mate_score(self):
+        assert parse_move("e2e4") == (Position(6, 4), Position(4, 4))
+        assert format_score(MATE_SCORE - 1) == "mate 1"
@@ -0,0 +1,11 @@
+import asyncio
+
+from src.presentation.uci import run_uci
+
+
+def main():
+    asyncio.run(run_uci())
+
+
+if __name__ == "__main__":
+    main()